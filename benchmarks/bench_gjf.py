@@ -0,0 +1,57 @@
+"""GJF parse time on large inputs; the parser should scale linearly.
+
+Run from the repository root:
+
+    python benchmarks/bench_gjf.py [--atoms N] [--repeat N] [--max-ratio 6]
+
+Times N/4, N/2 and N atoms. If N atoms take more than --max-ratio times as
+long as N/4 atoms (linear is 4x, quadratic 16x), the exit code is 1.
+"""
+
+import argparse
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from synthetic import write_gjf  # noqa: E402
+
+from qcinput.structure.gjf import load_gjf_geometry  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--atoms", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-ratio", type=float, default=6.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+        for atoms in (args.atoms // 4, args.atoms // 2, args.atoms):
+            path = write_gjf(Path(tmp) / f"big_{atoms}.gjf", atoms)
+            best = min(
+                timeit.repeat(
+                    lambda: load_gjf_geometry(path), number=1, repeat=args.repeat
+                )
+            )
+            timings[atoms] = best
+            print(
+                f"{atoms:8d} atoms  {best * 1e3:9.2f} ms  {best / atoms * 1e9:7.1f} ns/atom"
+            )
+    ratio = timings[args.atoms] / timings[args.atoms // 4]
+    print(f"4x atoms -> {ratio:.2f}x time (linear ~ 4x)")
+    if ratio > args.max_ratio:
+        print(
+            f"not linear: 4x atoms took {ratio:.2f}x the time "
+            f"(limit {args.max_ratio:g}x)",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
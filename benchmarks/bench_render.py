@@ -0,0 +1,95 @@
+"""Per-molecule render cost: one-shot render_* calls vs a compiled renderer.
+
+Run from the repository root:
+
+    python benchmarks/bench_render.py [--molecules N] [--atoms N]
+"""
+
+import argparse
+import sys
+import timeit
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from qcinput.config import QCInputConfig  # noqa: E402
+from qcinput.gaussian import render_gaussian_input  # noqa: E402
+from qcinput.generate import CompiledRenderer  # noqa: E402
+from qcinput.orca import render_orca_input  # noqa: E402
+from qcinput.structure import StructureData, parse_atom_block  # noqa: E402
+
+ORCA = QCInputConfig(
+    engine="orca",
+    kind="sp",
+    charge=0,
+    multiplicity=1,
+    task_keywords=("SP",),
+    nprocs=8,
+    maxcore=4000,
+    base_keywords=("r2scan-3c",),
+    orca_extra_keywords=("TightSCF",),
+    orca_smd=True,
+    orca_smd_solvent="water",
+)
+GAUSSIAN = replace(
+    ORCA,
+    engine="gaussian",
+    nprocshared=8,
+    mem="8GB",
+    gaussian_base_keywords=("B3LYP/def2SVP",),
+    gaussian_extra_keywords=("SCF=Tight",),
+)
+
+
+def _structure(atoms: int) -> StructureData:
+    xyz_text = "\n".join(f"C {i * 0.1:.6f} 0.000000 0.000000" for i in range(atoms))
+    return StructureData(
+        geometry=parse_atom_block(xyz_text),
+        charge=None,
+        multiplicity=None,
+        source_format="xyz",
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--molecules", type=int, default=20000)
+    parser.add_argument("--atoms", type=int, default=3)
+    args = parser.parse_args()
+
+    structure = _structure(args.atoms)
+    cases = {
+        "orca": (
+            lambda: render_orca_input(xyz_text=structure.xyz_text, config=ORCA),
+            CompiledRenderer(ORCA),
+        ),
+        "gaussian": (
+            lambda: render_gaussian_input(
+                xyz_text=structure.xyz_text,
+                config=GAUSSIAN,
+                source_structure_name="mol.xyz",
+            ),
+            CompiledRenderer(GAUSSIAN),
+        ),
+    }
+    print(f"{args.molecules} molecules x {args.atoms} atoms")
+    for name, (one_shot, renderer) in cases.items():
+        baseline = timeit.timeit(one_shot, number=args.molecules)
+        compiled = timeit.timeit(
+            lambda: renderer.render(
+                structure, source_structure_name="mol.xyz", output_stem="mol"
+            ),
+            number=args.molecules,
+        )
+        per_call = 1e6 / args.molecules
+        print(
+            f"{name:9s} one-shot {baseline * per_call:7.2f} us/mol  "
+            f"compiled {compiled * per_call:7.2f} us/mol  "
+            f"speedup {baseline / compiled:5.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,275 @@
+"""Benchmark suite for the parse, config and render hot paths.
+
+Run from the repository root:
+
+    python benchmarks/run.py [--quick] [--max-atoms N] [-k SUBSTRING]
+        [--output results.json] [--baseline baseline.json] [--threshold 0.25]
+
+Each case reports the best per-call time over --repeat rounds (each round
+auto-sized to take at least 0.2 s). With --baseline, cases slower than
+baseline * (1 + threshold) are listed and the exit code is 1.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+import timeit
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from synthetic import write_gjf, write_multiframe_xyz, write_xyz  # noqa: E402
+
+from qcinput import __version__  # noqa: E402
+from qcinput.cli import main as cli_main  # noqa: E402
+from qcinput.config import (  # noqa: E402
+    QCInputConfig,
+    clear_config_cache,
+    default_config_toml,
+    load_all_configs,
+    load_config,
+)
+from qcinput.gaussian import (  # noqa: E402
+    render_gaussian_input,
+    render_gaussian_two_step_ts_input,
+)
+from qcinput.generate import compile_renderer, render_structure  # noqa: E402
+from qcinput.orca import render_orca_input  # noqa: E402
+from qcinput.structure import load_structure  # noqa: E402
+from qcinput.structure.gjf import load_gjf_data  # noqa: E402
+from qcinput.structure.vectorized import numpy_enabled  # noqa: E402
+from qcinput.structure.xyz import iter_xyz_frames, load_xyz_text  # noqa: E402
+from qcinput.structure.xyz_index import XYZFrameIndex  # noqa: E402
+
+SIZES = (3, 100, 10_000, 100_000, 1_000_000)
+QUICK_MAX_ATOMS = 10_000
+FRAMES = (1_000, 30)  # frames x atoms per frame
+
+Case = tuple[str, Callable[[], object]]
+
+
+def _run_cli(argv: list[str]) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        cli_main(argv)
+
+
+def iter_cases(
+    workdir: Path, sizes: tuple[int, ...], *, only: str = ""
+) -> Iterator[Case]:
+    # Synthetic files are only written for groups that have a case matching
+    # `only`; the caller still filters individual cases.
+    config_path = workdir / "qcinput.toml"
+    config_path.write_text(default_config_toml("int"), encoding="utf-8")
+    configs = load_all_configs(config_path)
+
+    def cold_load() -> QCInputConfig:
+        clear_config_cache()
+        return load_config(config_path)
+
+    yield "config.load_config.cold", cold_load
+    yield "config.load_config.warm", lambda: load_config(config_path)
+    yield "config.load_all_configs", lambda: load_all_configs(config_path)
+
+    frames, frame_atoms = FRAMES
+    label = f"[{frames}x{frame_atoms}]"
+    if only in f"parse.iter_xyz_frames{label}" or only in (
+        f"parse.XYZFrameIndex.every_10th{label}"
+    ):
+        yield from _frame_cases(workdir, frames, frame_atoms, label)
+
+    for atoms in sizes:
+        suffix = f"[{atoms}]"
+        if any(only in f"{name}{suffix}" for name in _SIZED_CASES):
+            yield from _sized_cases(workdir, atoms, suffix, config_path, configs)
+
+
+def _frame_cases(
+    workdir: Path, frames: int, frame_atoms: int, label: str
+) -> Iterator[Case]:
+    trajectory = write_multiframe_xyz(workdir / "traj.xyz", frames, frame_atoms)
+    yield (
+        f"parse.iter_xyz_frames{label}",
+        lambda: sum(1 for _ in iter_xyz_frames(trajectory)),
+    )
+
+    def indexed_frames() -> int:
+        with XYZFrameIndex.open(trajectory) as index:
+            return sum(1 for _ in index.iter_frames(slice(None, None, 10)))
+
+    yield f"parse.XYZFrameIndex.every_10th{label}", indexed_frames
+
+
+_SIZED_CASES = (
+    "parse.load_xyz_text",
+    "parse.load_gjf_data",
+    "render.render_orca_input",
+    "render.render_structure_orca_ts",
+    "render.render_gaussian_input",
+    "render.render_gaussian_two_step_ts_input",
+    "render.compiled_orca",
+    "e2e.run_generate",
+)
+
+
+def _sized_cases(
+    workdir: Path,
+    atoms: int,
+    suffix: str,
+    config_path: Path,
+    configs: dict[tuple[str, str], QCInputConfig],
+) -> Iterator[Case]:
+    xyz = write_xyz(workdir / f"mol_{atoms}.xyz", atoms)
+    gjf = write_gjf(workdir / f"mol_{atoms}.gjf", atoms)
+    xyz_text = load_xyz_text(xyz)
+    structure = load_structure(xyz)
+
+    yield f"parse.load_xyz_text{suffix}", lambda xyz=xyz: load_xyz_text(xyz)
+    yield f"parse.load_gjf_data{suffix}", lambda gjf=gjf: load_gjf_data(gjf)
+
+    yield (
+        f"render.render_orca_input{suffix}",
+        lambda xyz_text=xyz_text: render_orca_input(
+            xyz_text=xyz_text, config=configs[("orca", "int")]
+        ),
+    )
+    yield (
+        f"render.render_structure_orca_ts{suffix}",
+        (
+            lambda structure=structure: render_structure(
+                structure,
+                configs[("orca", "ts")],
+                source_structure_name="mol.xyz",
+                output_stem="mol",
+            )
+        ),
+    )
+    yield (
+        f"render.render_gaussian_input{suffix}",
+        lambda xyz_text=xyz_text: render_gaussian_input(
+            xyz_text=xyz_text,
+            config=configs[("gaussian", "int")],
+            source_structure_name="mol.xyz",
+        ),
+    )
+    yield (
+        f"render.render_gaussian_two_step_ts_input{suffix}",
+        (
+            lambda xyz_text=xyz_text: render_gaussian_two_step_ts_input(
+                xyz_text=xyz_text,
+                config=configs[("gaussian", "ts")],
+                source_structure_name="mol.xyz",
+            )
+        ),
+    )
+    renderer = compile_renderer(configs[("orca", "int")])
+    yield (
+        f"render.compiled_orca{suffix}",
+        (
+            lambda renderer=renderer, structure=structure: renderer.render(
+                structure, source_structure_name="mol.xyz", output_stem="mol"
+            )
+        ),
+    )
+
+    argv = ["generate", str(xyz), "-c", str(config_path), "--force"]
+    argv += ["-o", str(workdir / f"mol_{atoms}.inp")]
+    yield f"e2e.run_generate{suffix}", lambda argv=argv: _run_cli(argv)
+
+
+def measure(func: Callable[[], object], *, repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"seconds": best, "number": number, "repeat": repeat}
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], *, threshold: float
+) -> list[tuple[str, float, float]]:
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if result["seconds"] > reference["seconds"] * (1 + threshold):
+            regressions.append((name, reference["seconds"], result["seconds"]))
+    return regressions
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:8.3f} s "
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:8.3f} ms"
+    return f"{seconds * 1e6:8.3f} us"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-atoms", type=int, default=SIZES[-1])
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help=f"Shorthand for --max-atoms {QUICK_MAX_ATOMS} --repeat 1.",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "-k", "--filter", default="", help="Only run cases containing this text."
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON.")
+    parser.add_argument("--baseline", type=Path, help="Results JSON to compare to.")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+    if args.quick:
+        args.max_atoms = min(args.max_atoms, QUICK_MAX_ATOMS)
+        args.repeat = 1
+
+    baseline = None
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+
+    sizes = tuple(size for size in SIZES if size <= args.max_atoms)
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="qcinput-bench-") as tmp:
+        for name, func in iter_cases(Path(tmp), sizes, only=args.filter):
+            if args.filter not in name:
+                continue
+            results[name] = measure(func, repeat=args.repeat)
+            line = f"{name:60s} {_format_seconds(results[name]['seconds'])}"
+            if baseline is not None and name in baseline:
+                ratio = results[name]["seconds"] / baseline[name]["seconds"]
+                line += f"  x{ratio:5.2f} vs baseline"
+            print(line, flush=True)
+
+    if args.output is not None:
+        payload = {
+            "meta": {
+                "qcinput": __version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "numpy": numpy_enabled(),
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, threshold=args.threshold)
+    for name, before, after in regressions:
+        print(
+            f"regression: {name} {_format_seconds(before).strip()} -> "
+            f"{_format_seconds(after).strip()} (+{(after / before - 1) * 100:.0f}%, "
+            f"threshold {args.threshold * 100:.0f}%)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
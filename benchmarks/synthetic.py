@@ -0,0 +1,43 @@
+"""Synthetic structures and configs for the benchmark scripts."""
+
+from pathlib import Path
+
+# Repeating organic-ish composition so symbol lookup sees a realistic mix.
+_SYMBOLS = ("C", "H", "H", "N", "C", "H", "O", "H")
+
+
+def atom_lines(atoms: int, *, indent: str = "") -> list[str]:
+    return [
+        f"{indent}{_SYMBOLS[idx % len(_SYMBOLS)]} {(idx % 97) * 1.37:.8f} "
+        f"{(idx // 97 % 89) * 1.41:.8f} {(idx // 8633) * 1.53:.8f}"
+        for idx in range(atoms)
+    ]
+
+
+def write_xyz(path: Path, atoms: int) -> Path:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(f"{atoms}\nsynthetic {atoms} atoms\n")
+        handle.writelines(f"{line}\n" for line in atom_lines(atoms))
+    return path
+
+
+def write_multiframe_xyz(path: Path, frames: int, atoms: int) -> Path:
+    lines = "".join(f"{line}\n" for line in atom_lines(atoms))
+    with path.open("w", encoding="utf-8") as handle:
+        for idx in range(frames):
+            handle.write(f"{atoms}\nframe {idx} E=-{idx * 1e-4:.6f}\n{lines}")
+    return path
+
+
+def write_gjf(path: Path, atoms: int) -> Path:
+    # Connectivity after the geometry adds one integer-pair line per atom,
+    # the layout that made charge/multiplicity candidate scans expensive.
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("%chk=big.chk\n# sp b3lyp/def2svp geom=connectivity\n\n")
+        handle.write("1 2\n\n0 1\n")
+        handle.writelines(f"{line}\n" for line in atom_lines(atoms, indent=" "))
+        handle.write("\n")
+        for idx in range(1, atoms):
+            handle.write(f" {idx} {idx + 1} 1.0\n")
+        handle.write(f" {atoms}\n\n")
+    return path
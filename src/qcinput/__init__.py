@@ -1,3 +1,15 @@
 __version__ = "0.7.0"
 __homepage__ = "https://github.com/yushengyangchem/qcinput"
 __generator_banner__ = f"Generated by qcinput v{__version__} ({__homepage__})"
+
+__all__ = ["generate_many"]
+
+
+def __getattr__(name: str):
+    # Imported on first use so that `import qcinput` (and the CLI's startup)
+    # stays free of the renderers and the process pool.
+    if name == "generate_many":
+        from qcinput.batch import generate_many
+
+        return generate_many
+    raise AttributeError(f"module 'qcinput' has no attribute {name!r}")
@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, TypeVar
+
+from qcinput.batch import (
+    BatchResult,
+    BatchTask,
+    StructureSource,
+    render_source,
+)
+from qcinput.config import QCInputConfig
+from qcinput.generate import (
+    default_output_suffix,
+    expand_output_items,
+    iter_structure_items,
+    render_structure,
+)
+from qcinput.structure import StructureData
+
+T = TypeVar("T")
+
+# Reads and writes in flight at once; rendering stays on the event loop.
+IO_CONCURRENCY = 16
+
+
+async def _offload(limit: asyncio.Semaphore, func: Callable[..., T], *args: Any) -> T:
+    async with limit:
+        return await asyncio.to_thread(func, *args)
+
+
+def _read_items(
+    structure_path: Path, output: Path, frames: slice | None
+) -> list[tuple[str, Path, StructureData]]:
+    # Reads and parses every frame of one file in a worker thread, so a
+    # multi-frame file is held in memory whole (the serial path streams it).
+    return list(iter_structure_items(structure_path, output, frames=frames))
+
+
+async def _write_output(
+    limit: asyncio.Semaphore,
+    task: BatchTask,
+    target: Path,
+    text: str,
+    on_result: Callable[[BatchTask, BatchResult], None] | None,
+) -> BatchResult:
+    data = text.encode("utf-8")
+    await _offload(limit, target.write_bytes, data)
+    result = BatchResult(
+        structure=task.structure,
+        output=target,
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+    if on_result is not None:
+        on_result(task, result)
+    return result
+
+
+async def _run_task(
+    task: BatchTask,
+    limit: asyncio.Semaphore,
+    *,
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    frames: slice | None,
+    write: bool,
+    on_result: Callable[[BatchTask, BatchResult], None] | None,
+) -> tuple[BatchResult, ...]:
+    results: list[BatchResult] = []
+    try:
+        items = await _offload(
+            limit,
+            _read_items,
+            task.structure,
+            task.output,
+            task.frame_selection(frames),
+        )
+        writes = []
+        for target, structure, item_config, structure_name in expand_output_items(
+            items, config, skip=task.done
+        ):
+            text = render_structure(
+                structure,
+                item_config,
+                source_structure_name=structure_name,
+                output_stem=target.stem,
+            )
+            if write:
+                writes.append(_write_output(limit, task, target, text, on_result))
+                continue
+            result = BatchResult(structure=task.structure, output=target, text=text)
+            results.append(result)
+            if on_result is not None:
+                on_result(task, result)
+        for outcome in await asyncio.gather(*writes, return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+    except (OSError, ValueError) as exc:
+        results.append(
+            BatchResult(structure=task.structure, output=task.output, error=str(exc))
+        )
+    return tuple(results)
+
+
+async def aiter_batch_task_results(
+    tasks: Iterable[BatchTask],
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    *,
+    io_concurrency: int = IO_CONCURRENCY,
+    frames: slice | None = None,
+    write: bool = True,
+    on_result: Callable[[BatchTask, BatchResult], None] | None = None,
+) -> AsyncIterator[tuple[BatchTask, tuple[BatchResult, ...]]]:
+    # Async counterpart of batch.iter_batch_task_results() for filesystems
+    # where each read or write waits on the network: up to `io_concurrency`
+    # reads and writes run in threads while the loop renders. Results come
+    # back in task order; at most 2 * io_concurrency tasks are in flight.
+    limit = asyncio.Semaphore(io_concurrency)
+    pending: deque[tuple[BatchTask, asyncio.Task[tuple[BatchResult, ...]]]] = deque()
+    try:
+        for task in tasks:
+            pending.append(
+                (
+                    task,
+                    asyncio.ensure_future(
+                        _run_task(
+                            task,
+                            limit,
+                            config=config,
+                            frames=frames,
+                            write=write,
+                            on_result=on_result,
+                        )
+                    ),
+                )
+            )
+            if len(pending) >= 2 * io_concurrency:
+                done, future = pending.popleft()
+                yield done, await future
+        while pending:
+            done, future = pending.popleft()
+            yield done, await future
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+async def agenerate_many(
+    structures: Iterable[StructureSource],
+    config: QCInputConfig | Iterable[QCInputConfig] | str | Path,
+    *,
+    io_concurrency: int = IO_CONCURRENCY,
+    frames: slice | None = None,
+) -> AsyncIterator[tuple[str, str]]:
+    # Async counterpart of qcinput.generate_many(): same sources and output,
+    # with structure files read in threads, up to `io_concurrency` at once.
+    if isinstance(config, (str, Path)):
+        from qcinput.config import load_config
+
+        config = await asyncio.to_thread(load_config, Path(config).expanduser())
+    elif not isinstance(config, QCInputConfig):
+        config = tuple(config)
+        if not config:
+            raise ValueError("agenerate_many() needs at least one config.")
+    limit = asyncio.Semaphore(io_concurrency)
+    engine = config.engine if isinstance(config, QCInputConfig) else config[0].engine
+
+    async def render(source: StructureSource) -> list[tuple[str, str]]:
+        if isinstance(source, tuple):
+            return render_source(source, config=config)
+        path = Path(source)
+        output = Path(f"{path.stem}{default_output_suffix(engine)}")
+        try:
+            items = await _offload(limit, _read_items, path, output, frames)
+            return [
+                (
+                    target.name,
+                    render_structure(
+                        structure,
+                        item_config,
+                        source_structure_name=structure_name,
+                        output_stem=target.stem,
+                    ),
+                )
+                for target, structure, item_config, structure_name in (
+                    expand_output_items(items, config)
+                )
+            ]
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+
+    pending: deque[asyncio.Task[list[tuple[str, str]]]] = deque()
+    try:
+        for source in structures:
+            pending.append(asyncio.ensure_future(render(source)))
+            if len(pending) >= 2 * io_concurrency:
+                for output in await pending.popleft():
+                    yield output
+        while pending:
+            for output in await pending.popleft():
+                yield output
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def iter_async(iterator: AsyncIterator[T]) -> Iterator[T]:
+    # Drives an async iterator from synchronous code on a private event loop.
+    async def step() -> T:
+        return await anext(iterator)
+
+    with asyncio.Runner() as runner:
+        try:
+            while True:
+                try:
+                    item = runner.run(step())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                runner.run(aclose())
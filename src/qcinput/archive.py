@@ -0,0 +1,133 @@
+import gzip
+import io
+import os
+import tarfile
+import time
+import zipfile
+from pathlib import Path, PurePosixPath
+
+ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".zip")
+# 1980-01-01T00:00:00Z, the earliest timestamp a zip entry can hold.
+_DEFAULT_MTIME = 315532800
+
+
+def archive_format(path: Path) -> str:
+    name = path.name.lower()
+    if name.endswith(".zip"):
+        return "zip"
+    if name.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if name.endswith(".tar"):
+        return "tar"
+    raise ValueError(
+        f"Unsupported archive type: {path}. "
+        f"Expected one of: {', '.join(ARCHIVE_SUFFIXES)}"
+    )
+
+
+def archive_mtime() -> int:
+    # Honour SOURCE_DATE_EPOCH so archives are reproducible across runs and
+    # hosts; zip cannot store anything earlier than 1980.
+    value = os.environ.get("SOURCE_DATE_EPOCH", "")
+    return max(int(value), _DEFAULT_MTIME) if value.isdigit() else _DEFAULT_MTIME
+
+
+class ArchiveWriter:
+    # Streams entries straight into a tar, tar.gz, or zip file: no temporary
+    # files, fixed mtimes/owners/modes, and entries in the order they are
+    # added, so the same inputs produce byte-identical archives.
+    def __init__(self, path: Path, *, mtime: int | None = None) -> None:
+        self.path = path
+        self.format = archive_format(path)
+        self.mtime = archive_mtime() if mtime is None else mtime
+        self._names: set[str] = set()
+        self._raw = path.open("wb")
+        self._gzip: gzip.GzipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._zip: zipfile.ZipFile | None = None
+        if self.format == "zip":
+            self._zip = zipfile.ZipFile(
+                self._raw, "w", compression=zipfile.ZIP_DEFLATED
+            )
+            return
+        fileobj = self._raw
+        if self.format == "tar.gz":
+            # filename="" keeps the output path out of the gzip header.
+            fileobj = self._gzip = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self._raw, mtime=self.mtime
+            )
+        self._tar = tarfile.open(fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT)
+
+    def add(self, name: str, text: str) -> None:
+        if name in self._names:
+            raise ValueError(f"Duplicate archive entry: {name}")
+        self._names.add(name)
+        data = text.encode("utf-8")
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, time.gmtime(self.mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o100644 << 16
+            self._zip.writestr(info, data)
+            return
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = self.mtime
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        for handle in (self._zip, self._tar, self._gzip, self._raw):
+            if handle is not None:
+                handle.close()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _safe_member_path(destination: Path, name: str) -> Path:
+    member = PurePosixPath(name)
+    if member.is_absolute() or ".." in member.parts or not member.parts:
+        raise ValueError(f"Refusing to extract unsafe archive entry: {name}")
+    return destination.joinpath(*member.parts)
+
+
+def extract_archive(path: Path, destination: Path) -> list[Path]:
+    # Regular files only; links, devices and entries escaping `destination`
+    # are rejected rather than trusted.
+    if not path.exists():
+        raise FileNotFoundError(f"Archive not found: {path}")
+    extracted: list[Path] = []
+
+    def write(name: str, source) -> None:
+        target = _safe_member_path(destination, name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("wb") as handle:
+            while chunk := source.read(1 << 20):
+                handle.write(chunk)
+        extracted.append(target)
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                with archive.open(info) as source:
+                    write(info.filename, source)
+        return extracted
+    try:
+        archive = tarfile.open(path, mode="r|*")
+    except tarfile.TarError as exc:
+        raise ValueError(f"Not a tar or zip archive: {path}") from exc
+    with archive:
+        for member in archive:
+            if member.isdir():
+                continue
+            if not member.isfile():
+                raise ValueError(
+                    f"Refusing to extract non-regular archive entry: {member.name}"
+                )
+            write(member.name, archive.extractfile(member))
+    return extracted
@@ -0,0 +1,424 @@
+import glob
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from qcinput.config import QCInputConfig
+from qcinput.generate import (
+    default_output_suffix,
+    iter_rendered_outputs,
+    render_structure,
+    write_rendered_outputs,
+)
+from qcinput.manifest import ManifestEntry, ManifestSet, manifest_entry
+from qcinput.structure import Geometry, StructureData, parse_atom_block
+
+STRUCTURE_SUFFIXES = (".xyz", ".gjf")
+
+
+@dataclass(frozen=True)
+class BatchTask:
+    structure: Path
+    output: Path
+    # Outputs already written by an interrupted run (see --resume).
+    done: frozenset[Path] = frozenset()
+    # Absolute frame numbers to generate instead of the run's selection
+    # (a shard's part of a multi-frame XYZ file).
+    frames: range | None = None
+
+    def frame_selection(self, frames: slice | None) -> slice | None:
+        if self.frames is None:
+            return frames
+        # A negative stop only comes from a descending range down to 0.
+        stop = self.frames.stop if self.frames.stop >= 0 else None
+        return slice(self.frames.start, stop, self.frames.step)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    structure: Path
+    output: Path
+    error: str | None = None
+    # Rendered input, returned instead of written when archiving.
+    text: str | None = None
+    sha256: str | None = None
+
+
+def _expand_structure_spec(spec: str, suffixes: tuple[str, ...]) -> list[Path]:
+    path = Path(spec).expanduser()
+    if path.is_dir():
+        return sorted(
+            child
+            for child in path.iterdir()
+            if child.is_file() and child.suffix.lower() in suffixes
+        )
+    if path.is_file():
+        return [path]
+    if glob.has_magic(spec):
+        matches = sorted(
+            Path(match)
+            for match in glob.glob(str(path), recursive=True)
+            if Path(match).is_file()
+        )
+        if not matches:
+            raise ValueError(f"No structure files match pattern: {spec}")
+        return matches
+    raise FileNotFoundError(f"Structure path not found: {spec}")
+
+
+def read_file_list(path: Path) -> list[str]:
+    if not path.exists():
+        raise FileNotFoundError(f"File list not found: {path}")
+    specs: list[str] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            specs.append(stripped)
+    return specs
+
+
+def collect_structure_paths(
+    specs: Iterable[str], *, suffixes: tuple[str, ...] = STRUCTURE_SUFFIXES
+) -> list[Path]:
+    # `suffixes` only filters directory listings; explicit files and glob
+    # matches are taken as given.
+    seen: set[Path] = set()
+    paths: list[Path] = []
+    for spec in specs:
+        for path in _expand_structure_spec(spec, suffixes):
+            key = path.resolve()
+            if key in seen:
+                continue
+            seen.add(key)
+            paths.append(path)
+    return paths
+
+
+def drop_generated_outputs(
+    structures: Iterable[Path],
+    *,
+    engine: str,
+    output_dir: Path | None = None,
+    manifests: ManifestSet | None = None,
+) -> list[Path]:
+    # Directory listings also pick up the inputs an earlier run wrote next to
+    # its structures (water.xyz -> water.gjf). Drop files that another
+    # structure here will write, or that a manifest records as an output.
+    structures = list(structures)
+    suffix = default_output_suffix(engine)
+    planned: dict[Path, Path] = {}
+    for path in structures:
+        parent = path.parent if output_dir is None else output_dir
+        output = (parent / f"{path.stem}{suffix}").resolve()
+        if output != path.resolve():
+            planned[output] = path
+    if manifests is None:
+        manifests = ManifestSet()
+    kept: list[Path] = []
+    for path in structures:
+        key = path.resolve()
+        if key in planned:
+            continue
+        recorded = [
+            entry.structure
+            for entry in manifests.for_output(path).entries.values()
+            if path.name in entry.outputs
+        ]
+        if any(Path(source).resolve() != key for source in recorded):
+            continue
+        kept.append(path)
+    return kept
+
+
+def output_collision(first: Path, second: Path, output: Path) -> ValueError:
+    return ValueError(
+        f"Output name collision: {first} and {second} both map to {output}."
+    )
+
+
+def plan_batch(
+    structures: Iterable[Path],
+    *,
+    engine: str,
+    output_dir: Path | None = None,
+) -> list[BatchTask]:
+    suffix = default_output_suffix(engine)
+    tasks: list[BatchTask] = []
+    owners: dict[Path, Path] = {}
+    for structure in structures:
+        parent = structure.parent if output_dir is None else output_dir
+        output = parent / f"{structure.stem}{suffix}"
+        key = output.resolve()
+        if key in owners:
+            raise output_collision(owners[key], structure, output)
+        owners[key] = structure
+        tasks.append(BatchTask(structure=structure, output=output))
+    return tasks
+
+
+def _generate_one(
+    task: BatchTask,
+    *,
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    frames: slice | None = None,
+    write: bool = True,
+    on_result: Callable[[BatchTask, BatchResult], None] | None = None,
+) -> tuple[BatchResult, ...]:
+    results: list[BatchResult] = []
+    output = task.output
+    frames = task.frame_selection(frames)
+    try:
+        if write:
+            # Hash what is written so the manifest and journal never have
+            # to read outputs back.
+            for output, digest in write_rendered_outputs(
+                task.structure, task.output, config, frames=frames, skip=task.done
+            ):
+                result = BatchResult(
+                    structure=task.structure, output=output, sha256=digest
+                )
+                results.append(result)
+                if on_result is not None:
+                    on_result(task, result)
+        else:
+            for output, text in iter_rendered_outputs(
+                task.structure, task.output, config, frames=frames, skip=task.done
+            ):
+                result = BatchResult(structure=task.structure, output=output, text=text)
+                results.append(result)
+                if on_result is not None:
+                    on_result(task, result)
+    except (OSError, ValueError) as exc:
+        results.append(
+            BatchResult(structure=task.structure, output=output, error=str(exc))
+        )
+    return tuple(results)
+
+
+def iter_batch_task_results(
+    tasks: list[BatchTask],
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    *,
+    workers: int = 1,
+    chunksize: int = 1,
+    frames: slice | None = None,
+    write: bool = True,
+    on_result: Callable[[BatchTask, BatchResult], None] | None = None,
+    io_concurrency: int = 1,
+) -> Iterator[tuple[BatchTask, tuple[BatchResult, ...]]]:
+    # `on_result` sees each successful output as soon as this process learns
+    # of it: per output when running inline, per task from worker processes.
+    # io_concurrency > 1 runs the asyncio pipeline in this process instead
+    # of worker processes (see qcinput.aio).
+    if io_concurrency > 1:
+        from qcinput.aio import aiter_batch_task_results, iter_async
+
+        yield from iter_async(
+            aiter_batch_task_results(
+                tasks,
+                config,
+                io_concurrency=io_concurrency,
+                frames=frames,
+                write=write,
+                on_result=on_result,
+            )
+        )
+        return
+    if workers <= 1 or len(tasks) <= 1:
+        worker = partial(
+            _generate_one,
+            config=config,
+            frames=frames,
+            write=write,
+            on_result=on_result,
+        )
+        for task in tasks:
+            yield task, worker(task)
+        return
+    worker = partial(_generate_one, config=config, frames=frames, write=write)
+    executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+    try:
+        for task, results in zip(
+            tasks, executor.map(worker, tasks, chunksize=chunksize)
+        ):
+            if on_result is not None:
+                for result in results:
+                    if result.error is None:
+                        on_result(task, result)
+            yield task, results
+    finally:
+        # Drop queued chunks when the caller stops early (first failure).
+        executor.shutdown(cancel_futures=True)
+
+
+def iter_batch_results(
+    tasks: list[BatchTask],
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    *,
+    workers: int = 1,
+    chunksize: int = 1,
+    frames: slice | None = None,
+) -> Iterator[BatchResult]:
+    with closing(
+        iter_batch_task_results(
+            tasks, config, workers=workers, chunksize=chunksize, frames=frames
+        )
+    ) as task_results:
+        for _, results in task_results:
+            yield from results
+
+
+def plan_incremental(
+    tasks: Iterable[BatchTask],
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    manifests: ManifestSet,
+    *,
+    frames: slice | None = None,
+    force: bool = False,
+) -> tuple[
+    list[tuple[BatchTask, ManifestEntry | None]], dict[BatchTask, tuple[Path, ...]]
+]:
+    # Returns the tasks to run, each with the manifest entry to record once
+    # it succeeds, and the outputs of the tasks skipped as unchanged. Tasks
+    # whose structure cannot be hashed still run, so they fail with the
+    # usual error.
+    pending: list[tuple[BatchTask, ManifestEntry | None]] = []
+    skipped: dict[BatchTask, tuple[Path, ...]] = {}
+    for task in tasks:
+        try:
+            entry = manifest_entry(
+                task.structure, config, frames=task.frame_selection(frames)
+            )
+        except OSError:
+            pending.append((task, None))
+            continue
+        if not force:
+            current = manifests.for_output(task.output).current_outputs(
+                task.output, entry
+            )
+            if current:
+                skipped[task] = tuple(task.output.with_name(name) for name in current)
+                continue
+        pending.append((task, entry))
+    return pending, skipped
+
+
+def record_task(
+    manifests: ManifestSet,
+    task: BatchTask,
+    entry: ManifestEntry | None,
+    results: tuple[BatchResult, ...],
+    *,
+    done: Mapping[Path, str] | None = None,
+) -> ManifestEntry | None:
+    # `done` holds the digests of outputs an interrupted run already wrote.
+    manifest = manifests.for_output(task.output)
+    if entry is None or any(result.error is not None for result in results):
+        manifest.discard(task.output)
+        return None
+    digests = dict(done or {})
+    digests.update((result.output, result.sha256) for result in results)
+    return manifest.record(task.output, entry, digests)
+
+
+StructureSource = str | Path | tuple[str, StructureData | Geometry | str]
+
+
+def render_source(
+    source: StructureSource,
+    *,
+    config: QCInputConfig | tuple[QCInputConfig, ...],
+    frames: slice | None = None,
+) -> list[tuple[str, str]]:
+    # (output name, input text) pairs for one generate_many() source; also
+    # used by qcinput.aio for in-memory sources.
+    if not isinstance(source, tuple):
+        path = Path(source)
+        engine = (
+            config.engine if isinstance(config, QCInputConfig) else config[0].engine
+        )
+        output = Path(f"{path.stem}{default_output_suffix(engine)}")
+        try:
+            return [
+                (target.name, text)
+                for target, text in iter_rendered_outputs(
+                    path, output, config, frames=frames
+                )
+            ]
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+    name, structure = source
+    if isinstance(structure, str):
+        structure = parse_atom_block(structure)
+    if isinstance(structure, Geometry):
+        structure = StructureData(
+            geometry=structure, charge=None, multiplicity=None, source_format="xyz"
+        )
+    source_name = name if Path(name).suffix else f"{name}.xyz"
+    stem = Path(name).stem
+    configs = (config,) if isinstance(config, QCInputConfig) else config
+    outputs: list[tuple[str, str]] = []
+    for item_config in configs:
+        output_stem = stem
+        structure_name = source_name
+        if not isinstance(config, QCInputConfig):
+            output_stem = f"{stem}_{item_config.kind}"
+            structure_name = f"{output_stem}{Path(source_name).suffix}"
+        try:
+            text = render_structure(
+                structure,
+                item_config,
+                source_structure_name=structure_name,
+                output_stem=output_stem,
+            )
+        except ValueError as exc:
+            raise ValueError(f"{name}: {exc}") from exc
+        suffix = default_output_suffix(item_config.engine)
+        outputs.append((f"{output_stem}{suffix}", text))
+    return outputs
+
+
+def generate_many(
+    structures: Iterable[StructureSource],
+    config: QCInputConfig | Iterable[QCInputConfig] | str | Path,
+    *,
+    workers: int = 1,
+    frames: slice | None = None,
+) -> Iterator[tuple[str, str]]:
+    # Library entry point: lazily yields (output file name, input text) for
+    # every structure, in order, without touching the disk beyond reading
+    # structure files. Structures are paths (multi-frame XYZ files yield one
+    # input per frame) or (name, structure) pairs, where the structure is a
+    # StructureData, a Geometry or an atom block ("symbol x y z" lines).
+    # A config path is loaded like the CLI's -c; several configs render each
+    # structure once per config, tagged <stem>_<kind>.inp|.gjf. workers > 1
+    # renders in worker processes, keeping a bounded window of structures in
+    # flight. A structure that fails raises ValueError naming it.
+    if isinstance(config, (str, Path)):
+        from qcinput.config import load_config
+
+        config = load_config(Path(config).expanduser())
+    elif not isinstance(config, QCInputConfig):
+        config = tuple(config)
+        if not config:
+            raise ValueError("generate_many() needs at least one config.")
+    render = partial(render_source, config=config, frames=frames)
+    if workers <= 1:
+        for source in structures:
+            yield from render(source)
+        return
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: deque[Future[list[tuple[str, str]]]] = deque()
+    try:
+        for source in structures:
+            pending.append(executor.submit(render, source))
+            if len(pending) >= workers * 4:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
@@ -1,22 +1,155 @@
 import argparse
+import os
 import sys
-from dataclasses import replace
+from collections.abc import Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from qcinput import __homepage__, __version__
-from qcinput.config import default_config_path, default_config_toml, load_config
-from qcinput.gaussian import render_gaussian_input, render_gaussian_two_step_ts_input
-from qcinput.orca import render_orca_input, render_orca_two_step_ts_input
-from qcinput.structure import load_structure
 
+# Subcommand dependencies (config/TOML parsing, renderers, structure
+# readers, the process pool, the socket server) are imported inside the
+# run_* functions, so `--version`, `--help` and `init-config` only pay for
+# argparse. test_cli_startup.py guards this.
+if TYPE_CHECKING:
+    from qcinput.archive import ArchiveWriter
+    from qcinput.batch import BatchResult, BatchTask
+    from qcinput.config import QCInputConfig
+    from qcinput.journal import Journal
+    from qcinput.manifest import ManifestSet
+    from qcinput.server import QCInputServer
 
-def _merge_keywords(*keyword_groups: tuple[str, ...]) -> tuple[str, ...]:
-    merged: list[str] = []
-    for group in keyword_groups:
-        for kw in group:
-            if kw not in merged:
-                merged.append(kw)
-    return tuple(merged)
+_ENGINES = ("orca", "gaussian")
+_KINDS = ("int", "ts", "sp")
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"expected a positive integer, got {value!r}"
+        ) from exc
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def _available_cpus() -> int:
+    # CPUs this process may run on (SLURM/PBS cpusets, taskset), not the host's.
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _seconds(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"expected a number of seconds, got {value!r}"
+        ) from exc
+    if not number >= 0:
+        raise argparse.ArgumentTypeError(f"expected a number of seconds, got {value!r}")
+    return number
+
+
+def _frame_selection(value: str) -> slice:
+    from qcinput.structure.xyz_index import parse_frame_selection
+
+    try:
+        return parse_frame_selection(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _name_list(choices: tuple[str, ...]):
+    def parse(value: str) -> tuple[str, ...]:
+        names = tuple(dict.fromkeys(v.strip() for v in value.split(",") if v.strip()))
+        invalid = [name for name in names if name not in choices]
+        if not names or invalid:
+            raise argparse.ArgumentTypeError(
+                f"expected a comma-separated list of {', '.join(choices)}; "
+                f"got {value!r}"
+            )
+        return names
+
+    return parse
+
+
+def _add_variant_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--kinds",
+        type=_name_list(_KINDS),
+        help=(
+            "Comma-separated task kinds to render from one config parse, "
+            "e.g. int,sp,ts. Outputs are named <stem>_<kind>.inp|.gjf."
+        ),
+    )
+    parser.add_argument(
+        "--engines",
+        type=_name_list(_ENGINES),
+        help="Comma-separated engines to render, e.g. orca,gaussian.",
+    )
+
+
+def _load_configs(
+    args: argparse.Namespace,
+) -> "QCInputConfig | tuple[QCInputConfig, ...]":
+    from qcinput.config import load_all_configs, load_config
+
+    if args.kinds is None and args.engines is None:
+        return load_config(args.config)
+    configs = load_all_configs(
+        args.config, engines=args.engines, kinds=args.kinds, active_defaults=True
+    )
+    return tuple(configs.values())
+
+
+def _add_frames_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--frames",
+        type=_frame_selection,
+        metavar="START:STOP:STEP",
+        help=(
+            "Select frames of a multi-frame XYZ file by 0-based index or slice, "
+            "e.g. 42, 100:200, 100:200:5. Uses a cached byte-offset index."
+        ),
+    )
+
+
+def _add_force_arg(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Rewrite outputs even if the structure, resolved config, and qcinput "
+            "version match the output directory's .qcinput-manifest.json."
+        ),
+    )
+
+
+def _add_resume_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue an interrupted run from its journal instead of starting "
+            "over; outputs it already wrote are kept."
+        ),
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "Checkpoint journal path. Default: .<output>.qcinput-journal.jsonl "
+            "next to the output for generate; for batch, "
+            ".batch-<hash>.qcinput-journal.jsonl in --output-dir (else the "
+            "current directory), keyed by the outputs the run writes."
+        ),
+    )
 
 
 def _add_generate_args(parser: argparse.ArgumentParser) -> None:
@@ -27,7 +160,6 @@ def _add_generate_args(parser: argparse.ArgumentParser) -> None:
         "-c",
         "--config",
         type=Path,
-        default=default_config_path(),
         help="Path to TOML config file. Default: ./qcinput.toml",
     )
     parser.add_argument(
@@ -36,13 +168,127 @@ def _add_generate_args(parser: argparse.ArgumentParser) -> None:
         type=Path,
         help="Output path. Default: <xyz_stem>.inp|.gjf by engine",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help=(
+            "Report the wall time of each stage (load_config, manifest, "
+            "load_structure, render, write) as JSON lines on stderr."
+        ),
+    )
+    parser.add_argument(
+        "--timings-memory",
+        action="store_true",
+        help=(
+            "Like --timings, plus each stage's peak traced memory. Tracing makes "
+            "allocation-heavy stages slower, so their times are inflated."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="PATH",
+        help="Run under cProfile and write the stats to PATH (see `python -m pstats`).",
+    )
+    _add_frames_arg(parser)
+    _add_variant_args(parser)
+    _add_force_arg(parser)
+    _add_resume_args(parser)
+
+
+def _add_batch_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Structure files, directories, or glob patterns (.xyz or .gjf).",
+    )
+    parser.add_argument(
+        "-l",
+        "--file-list",
+        type=Path,
+        help="Text file with one structure path or pattern per line.",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        help="Path to TOML config file. Default: ./qcinput.toml",
+    )
+    parser.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        help="Directory for generated inputs. Default: next to each structure.",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=_positive_int,
+        default=_available_cpus(),
+        help="Number of worker processes. Default: CPUs available to this process.",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=_positive_int,
+        default=16,
+        help="Structures handed to a worker at a time. Default: 16",
+    )
+    parser.add_argument(
+        "--io-concurrency",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help=(
+            "Overlap up to N structure reads and input writes (asyncio with "
+            "I/O threads) for network filesystems where each file operation is "
+            "slow. Renders in this process instead of -j workers. Default: 1 (off)"
+        ),
+    )
+    parser.add_argument(
+        "--keep-going",
+        action="store_true",
+        help="Continue after failures and report them all at the end.",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "Stream all inputs into one reproducible .tar, .tar.gz/.tgz, or .zip "
+            "archive instead of writing individual files."
+        ),
+    )
+    parser.add_argument(
+        "--pack",
+        type=_positive_int,
+        metavar="N",
+        help=(
+            "Put N structures into each input (pack_0001.inp|.gjf, ...): steps "
+            "of one ORCA %%compound job, or Gaussian --Link1-- jobs."
+        ),
+    )
+    parser.add_argument(
+        "--order",
+        choices=("name", "cost"),
+        default="name",
+        help=(
+            "Order of the structures: name, or cost (most expensive first, from "
+            "`qcinput estimate`'s model), so big jobs start first and packs hold "
+            "jobs of similar size. Default: name"
+        ),
+    )
+    _add_shard_args(parser)
+    _add_frames_arg(parser)
+    _add_variant_args(parser)
+    _add_force_arg(parser)
+    _add_resume_args(parser)
 
 
 def _add_init_config_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "-k",
         "--kind",
-        choices=("int", "ts", "sp"),
+        choices=_KINDS,
         default="int",
         help="Default active kind in generated config. Choices: int, ts, sp.",
     )
@@ -50,7 +296,6 @@ def _add_init_config_args(parser: argparse.ArgumentParser) -> None:
         "-o",
         "--output",
         type=Path,
-        default=default_config_path(),
         help="Output TOML path. Default: ./qcinput.toml",
     )
     parser.add_argument(
@@ -61,6 +306,309 @@ def _add_init_config_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_serve_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help=(
+            "Unix socket path, in a directory only you can access. Default: "
+            "$QCINPUT_SOCKET, else $XDG_RUNTIME_DIR/qcinput/qcinput.sock"
+        ),
+    )
+
+
+def _shard(value: str) -> tuple[int, int]:
+    from qcinput.shard import parse_shard
+
+    try:
+        return parse_shard(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _memory_mb(value: str) -> int:
+    from qcinput.jobscript import parse_memory_mb
+
+    try:
+        return parse_memory_mb(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _mem_overhead(value: str) -> float:
+    try:
+        number = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"expected a factor of at least 1, got {value!r}"
+        ) from exc
+    if not number >= 1:
+        raise argparse.ArgumentTypeError(
+            f"expected a factor of at least 1, got {value!r}"
+        )
+    return number
+
+
+def _add_shard_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="I/N",
+        help=(
+            "Only generate shard I of N (1-based) of the structures, e.g. 3/16; "
+            "frames of multi-frame XYZ files are dealt one by one. The same "
+            "inputs always give the same split."
+        ),
+    )
+    parser.add_argument(
+        "--shard-by",
+        choices=("index", "hash"),
+        default="index",
+        help=(
+            "index: deal structures (and frames) sorted by path round-robin "
+            "(balanced). hash: bucket by file name (stable as inputs change). "
+            "Default: index"
+        ),
+    )
+    parser.add_argument(
+        "--shard-record",
+        type=Path,
+        metavar="PATH",
+        help=(
+            "Where to write the shard's record for `qcinput verify-shards`. "
+            "Default: qcinput-shard-I-of-N.json in --output-dir, else the current "
+            "directory."
+        ),
+    )
+
+
+def _add_verify_shards_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "records",
+        nargs="+",
+        type=Path,
+        help="Shard records written by `qcinput batch --shard`.",
+    )
+
+
+def _add_split_pack_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "output",
+        type=Path,
+        help="Program output of a packed input (pack_0001.out|.log).",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=Path,
+        help="The packed input. Default: the output path with .inp or .gjf.",
+    )
+    parser.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        help="Directory for the per-structure outputs. Default: next to OUTPUT.",
+    )
+    parser.add_argument(
+        "--marker",
+        help=(
+            "Regular expression matching the start of each job in the output; "
+            "a group 1, if any, must capture the step number."
+        ),
+    )
+
+
+def _add_extract_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "archive", type=Path, help="Archive written by `qcinput batch --archive`."
+    )
+    parser.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        default=Path(),
+        help="Directory to extract into. Default: current directory.",
+    )
+
+
+def _add_estimate_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Structure files, directories, or glob patterns (.xyz or .gjf).",
+    )
+    parser.add_argument(
+        "-l",
+        "--file-list",
+        type=Path,
+        help="Text file with one structure path or pattern per line.",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        help="Path to TOML config file. Default: ./qcinput.toml",
+    )
+    parser.add_argument(
+        "--sort",
+        choices=("cost", "name"),
+        default="cost",
+        help="Row order: cost (most expensive first) or name. Default: cost",
+    )
+    parser.add_argument(
+        "--cores",
+        type=_positive_int,
+        help="Cores per job for the walltime. Default: from the config.",
+    )
+    parser.add_argument(
+        "--seconds-per-unit",
+        type=float,
+        metavar="SECONDS",
+        help="Calibration: wall seconds of one cost unit on one core. Default: 30",
+    )
+    parser.add_argument(
+        "--safety",
+        type=float,
+        default=3.0,
+        help="Factor applied to the predicted runtime for the walltime. Default: 3",
+    )
+    _add_frames_arg(parser)
+
+
+def _add_jobscripts_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="Generated inputs, directories, or glob patterns (.inp or .gjf).",
+    )
+    parser.add_argument(
+        "-l",
+        "--file-list",
+        type=Path,
+        help="Text file with one input path or pattern per line.",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        help=(
+            "TOML config the inputs were generated from; [orca].nprocs/maxcore "
+            "and [gaussian].nprocshared/mem give each job's size. "
+            "Default: ./qcinput.toml"
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        help="Directory for the job scripts. Default: next to the first input.",
+    )
+    parser.add_argument(
+        "--scheduler",
+        choices=("slurm", "pbs"),
+        default="slurm",
+        help="Directive dialect: slurm (#SBATCH) or pbs (PBS Pro #PBS). Default: slurm",
+    )
+    parser.add_argument(
+        "--node-cores",
+        type=_positive_int,
+        metavar="N",
+        help="Cores per node to pack jobs onto.",
+    )
+    parser.add_argument(
+        "--node-mem",
+        type=_memory_mb,
+        metavar="SIZE",
+        help="Memory per node available to jobs, e.g. 250G (bare numbers are MB).",
+    )
+    parser.add_argument(
+        "--mem-overhead",
+        type=_mem_overhead,
+        default=1.25,
+        metavar="FACTOR",
+        help=(
+            "Memory a job is given per MB of %%maxcore (ORCA, times nprocs) or "
+            "%%Mem (Gaussian), for packing and for the memory request. Default: 1.25"
+        ),
+    )
+    parser.add_argument(
+        "--array",
+        action="store_true",
+        help=(
+            "Write one job array per job shape (one input per array task) "
+            "instead of per-node bundles."
+        ),
+    )
+    parser.add_argument(
+        "--time", help="Walltime directive, e.g. 24:00:00. Default: none."
+    )
+    parser.add_argument(
+        "--partition", help="Partition (SLURM) or queue (PBS). Default: none."
+    )
+    parser.add_argument(
+        "--name",
+        default="qcinput",
+        help="Job name and script prefix (<name>-0001.sh, ...). Default: qcinput",
+    )
+    parser.add_argument(
+        "--orca-command",
+        metavar="SHELL",
+        help='How scripts start ORCA. Default: "$(command -v orca)"',
+    )
+    parser.add_argument(
+        "--gaussian-command",
+        metavar="SHELL",
+        help="How scripts start Gaussian. Default: g16",
+    )
+
+
+def _add_watch_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "directories",
+        nargs="+",
+        type=Path,
+        help="Directories to watch for .xyz/.gjf structures.",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=Path,
+        help=(
+            "Path to TOML config file, reloaded when it changes. "
+            "Default: ./qcinput.toml"
+        ),
+    )
+    parser.add_argument(
+        "-d",
+        "--output-dir",
+        type=Path,
+        help="Directory for generated inputs. Default: next to each structure.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=_seconds,
+        default=1.0,
+        metavar="SECONDS",
+        help="Seconds between directory scans. Default: 1",
+    )
+    parser.add_argument(
+        "--settle",
+        type=_seconds,
+        default=2.0,
+        metavar="SECONDS",
+        help=(
+            "Seconds a structure's size and mtime must stay unchanged before it "
+            "is read, so partially written files are skipped. Default: 2"
+        ),
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Generate for the structures present now and exit (no settling).",
+    )
+    _add_variant_args(parser)
+
+
 def build_root_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="qcinput",
@@ -73,6 +621,21 @@ def build_root_parser() -> argparse.ArgumentParser:
         action="version",
         version=f"%(prog)s {__version__}\nHomepage: {__homepage__}",
     )
+    # Handled in main() before parsing; listed here for --help.
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help=(
+            "Run the rest of the command line in a fresh interpreter and report "
+            "per-module import time (-X importtime). Must come first."
+        ),
+    )
+    parser.add_argument(
+        "--via-socket",
+        metavar="PATH",
+        nargs="?",
+        help="Forward the command to a running `qcinput serve`. Must come first.",
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     generate_parser = subparsers.add_parser(
@@ -81,17 +644,101 @@ def build_root_parser() -> argparse.ArgumentParser:
     )
     _add_generate_args(generate_parser)
 
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Generate input files for many structures in parallel.",
+        description="Generate input files for many structures in parallel.",
+    )
+    _add_batch_args(batch_parser)
+
     init_parser = subparsers.add_parser(
         "init-config",
         help="Write a starter qcinput.toml in the current directory.",
         description="Write a starter qcinput.toml in the current directory.",
     )
     _add_init_config_args(init_parser)
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Serve requests from `qcinput --via-socket` over a Unix socket.",
+        description=(
+            "Keep one qcinput process warm and answer requests from "
+            "`qcinput --via-socket ...` over a Unix socket."
+        ),
+    )
+    _add_serve_args(serve_parser)
+
+    extract_parser = subparsers.add_parser(
+        "extract",
+        help="Unpack an archive written by `qcinput batch --archive`.",
+        description=(
+            "Unpack an archive written by `qcinput batch --archive`, e.g. on the "
+            "compute node's local scratch."
+        ),
+    )
+    _add_extract_args(extract_parser)
+
+    verify_parser = subparsers.add_parser(
+        "verify-shards",
+        help="Check that sharded batch runs emitted every structure exactly once.",
+        description=(
+            "Check that the records of a `qcinput batch --shard I/N` run cover "
+            "every shard and emitted every structure exactly once."
+        ),
+    )
+    _add_verify_shards_args(verify_parser)
+
+    split_parser = subparsers.add_parser(
+        "split-pack",
+        help="Split the output of a packed input into one file per structure.",
+        description=(
+            "Split the output of a `qcinput batch --pack` input into "
+            "<structure>.out (ORCA) or <structure>.log (Gaussian) files."
+        ),
+    )
+    _add_split_pack_args(split_parser)
+
+    estimate_parser = subparsers.add_parser(
+        "estimate",
+        help="Estimate the relative cost and a walltime of each structure's job.",
+        description=(
+            "Estimate the relative cost of each structure's job from its atoms "
+            "and electrons and the config's method, basis and task keywords, "
+            "and suggest a walltime. 1.0 is a single-point SCF with 100 basis "
+            "functions."
+        ),
+    )
+    _add_estimate_args(estimate_parser)
+
+    jobscripts_parser = subparsers.add_parser(
+        "jobscripts",
+        help="Write SLURM/PBS scripts that run generated inputs, packed onto nodes.",
+        description=(
+            "Write SLURM or PBS job scripts for generated inputs. By default, "
+            "jobs are bin-packed onto nodes of --node-cores/--node-mem and each "
+            "script runs one node's jobs concurrently; --array writes job "
+            "arrays with one input per task instead."
+        ),
+    )
+    _add_jobscripts_args(jobscripts_parser)
+
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Generate inputs as structures appear in directories.",
+        description=(
+            "Poll directories and generate an input for every new or changed "
+            "structure once it has been fully written. Config edits are picked "
+            "up and the affected outputs regenerated. Stop with Ctrl-C."
+        ),
+    )
+    _add_watch_args(watch_parser)
     return parser
 
 
 def run_init_config(args: argparse.Namespace) -> int:
-    path = args.output
+    from qcinput.config import default_config_path, default_config_toml
+
+    path = args.output or default_config_path()
     if path.exists() and not args.force:
         raise SystemExit(
             f"error: Config file already exists: {path}. Use --force to overwrite."
@@ -101,110 +748,894 @@ def run_init_config(args: argparse.Namespace) -> int:
     return 0
 
 
-def run_generate(args: argparse.Namespace) -> int:
+def _run_tasks(
+    pending: list,
+    config: "QCInputConfig | tuple[QCInputConfig, ...]",
+    manifests: "ManifestSet | None",
+    *,
+    keep_going: bool,
+    archive: "ArchiveWriter | None" = None,
+    journal: "Journal | None" = None,
+    resumed: dict[str, dict[Path, str]] | None = None,
+    workers: int = 1,
+    chunksize: int = 1,
+    frames: slice | None = None,
+    io_concurrency: int = 1,
+    order: Sequence["BatchTask"] = (),
+    unchanged: dict["BatchTask", tuple[Path, ...]] | None = None,
+) -> tuple[int, list["BatchResult"]]:
+    # `order` lists every task of the run, including the `unchanged` ones
+    # that are not run; their outputs are printed where a full run would
+    # print them.
+    from qcinput.batch import iter_batch_task_results, record_task
+
+    entries = dict(pending)
+    resumed = resumed or {}
+    unchanged = unchanged or {}
+    upcoming = iter(order)
+    failures: list[BatchResult] = []
+    rebuilt = 0
+
+    def print_unchanged(until: "BatchTask | None" = None) -> None:
+        for task in upcoming:
+            if task == until:
+                return
+            for path in unchanged.get(task, ()):
+                print(path)
+
+    results = iter_batch_task_results(
+        list(entries),
+        config,
+        workers=workers,
+        chunksize=chunksize,
+        frames=frames,
+        write=archive is None,
+        io_concurrency=io_concurrency,
+        on_result=(
+            None
+            if journal is None
+            else lambda task, result: journal.output_done(
+                task.output, result.output, result.sha256
+            )
+        ),
+    )
     try:
-        structure = load_structure(args.structure)
-        config = load_config(args.config)
-        if (
-            structure.source_format == "gjf"
-            and structure.charge is not None
-            and structure.multiplicity is not None
-        ):
-            if (
-                config.charge != structure.charge
-                or config.multiplicity != structure.multiplicity
-            ):
-                raise ValueError(
-                    "GJF charge/multiplicity mismatch with config: "
-                    f"gjf={structure.charge}/{structure.multiplicity}, "
-                    f"config={config.charge}/{config.multiplicity}. "
-                    "Please align [molecule] in config with the GJF file."
+        for task, task_results in results:
+            print_unchanged(task)
+            if archive is None:
+                for path in sorted(task.done):
+                    print(path)
+            if manifests is not None:
+                recorded = record_task(
+                    manifests,
+                    task,
+                    entries[task],
+                    task_results,
+                    done=resumed.get(os.fspath(task.output)),
                 )
-            config = replace(
-                config,
-                charge=structure.charge,
-                multiplicity=structure.multiplicity,
+                if journal is not None and recorded is not None:
+                    journal.task_done(task.output, recorded)
+            for result in task_results:
+                if result.error is None:
+                    if archive is None:
+                        print(result.output)
+                    else:
+                        archive.add(result.output.as_posix(), result.text)
+                    rebuilt += 1
+                    continue
+                if not keep_going:
+                    raise SystemExit(f"error: {result.structure}: {result.error}")
+                failures.append(result)
+        print_unchanged()
+    finally:
+        results.close()
+        if manifests is not None:
+            manifests.save()
+    return rebuilt, failures
+
+
+def _run_incremental(
+    args: argparse.Namespace,
+    tasks: list["BatchTask"],
+    config: "QCInputConfig | tuple[QCInputConfig, ...]",
+    *,
+    journal_path: Path,
+    keep_going: bool,
+    workers: int = 1,
+    chunksize: int = 1,
+    io_concurrency: int = 1,
+) -> list["BatchResult"]:
+    # Manifest-driven skipping plus the checkpoint journal: finished jobs
+    # from the journal are folded back into the manifest, and outputs of
+    # the job that was interrupted are not rendered again.
+    import signal
+    import threading
+    from dataclasses import replace
+    from functools import partial
+
+    from qcinput.batch import plan_incremental
+    from qcinput.journal import Journal, replay_journal
+    from qcinput.manifest import ManifestSet
+
+    manifests = ManifestSet()
+    written: dict[str, dict[Path, str]] = {}
+    if args.resume:
+        finished, written = replay_journal(journal_path)
+        for key, entry in finished.items():
+            output = Path(key)
+            manifests.for_output(output).record(
+                output,
+                entry,
+                {
+                    output.with_name(name): digest
+                    for name, digest in entry.outputs.items()
+                },
+            )
+        tasks = [
+            replace(task, done=frozenset(written.get(os.fspath(task.output), ())))
+            for task in tasks
+        ]
+    elif journal_path.exists():
+        print(
+            f"note: discarding the journal of an interrupted run ({journal_path}); "
+            "pass --resume to continue it instead",
+            file=sys.stderr,
+        )
+    from qcinput.timings import active_timer
+
+    timer = active_timer()
+    plan = partial(
+        plan_incremental, tasks, config, manifests, frames=args.frames, force=args.force
+    )
+    pending, unchanged = plan() if timer is None else timer.measure("manifest", plan)
+    skipped = sum(map(len, unchanged.values()))
+    skipped += sum(len(task.done) for task, _ in pending)
+
+    try:
+        journal = Journal(journal_path, append=args.resume)
+    except OSError as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    # Let a scheduler's SIGTERM (preemption, walltime) unwind normally so the
+    # journal is flushed and the manifest saved.
+    handler = None
+    if threading.current_thread() is threading.main_thread():
+        handler = signal.signal(signal.SIGTERM, lambda *_: sys.exit(128 + 15))
+    complete = False
+    try:
+        rebuilt, failures = _run_tasks(
+            pending,
+            config,
+            manifests,
+            keep_going=keep_going,
+            journal=journal,
+            resumed=written,
+            workers=workers,
+            chunksize=chunksize,
+            frames=args.frames,
+            io_concurrency=io_concurrency,
+            order=tasks,
+            unchanged=unchanged,
+        )
+        complete = True
+    finally:
+        journal.close(complete=complete)
+        if handler is not None:
+            signal.signal(signal.SIGTERM, handler)
+    _report_skipped(rebuilt, skipped)
+    return failures
+
+
+def _report_skipped(rebuilt: int, skipped: int) -> None:
+    if skipped:
+        print(
+            f"{rebuilt} rebuilt, {skipped} skipped (unchanged; --force to rebuild)",
+            file=sys.stderr,
+        )
+
+
+def run_generate(args: argparse.Namespace) -> int:
+    if args.profile is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(_run_generate_timed, args)
+        finally:
+            profiler.dump_stats(args.profile)
+            print(f"profile written to {args.profile}", file=sys.stderr)
+    return _run_generate_timed(args)
+
+
+def _run_generate_timed(args: argparse.Namespace) -> int:
+    if not (args.timings or args.timings_memory):
+        return _run_generate(args)
+    from qcinput.timings import json_lines_hook, record_timings
+
+    hook = json_lines_hook(sys.stderr)
+    with record_timings(hook, memory=args.timings_memory) as timer:
+        return timer.measure("total", _run_generate, args)
+
+
+def _run_generate(args: argparse.Namespace) -> int:
+    from qcinput.batch import BatchTask
+    from qcinput.config import QCInputConfig
+    from qcinput.generate import default_output_suffix
+    from qcinput.timings import active_timer
+
+    timer = active_timer()
+    try:
+        if timer is None:
+            config = _load_configs(args)
+        else:
+            config = timer.measure(
+                "load_config", _load_configs, args, path=str(args.config)
             )
-        default_suffix = ".inp" if config.engine == "orca" else ".gjf"
+        engine = (
+            config.engine if isinstance(config, QCInputConfig) else config[0].engine
+        )
         out_path = args.output or args.structure.with_name(
-            f"{args.structure.stem}{default_suffix}"
-        )
-        if config.engine == "orca":
-            if config.kind == "ts":
-                if not config.orca_ts_constraint_atoms:
-                    raise ValueError("ORCA ts config is missing constraint_atoms.")
-                if (
-                    config.nprocs is None
-                    or config.maxcore is None
-                    or config.orca_ts_calc_hess is None
-                ):
-                    raise ValueError("ORCA ts config is incomplete.")
-                # ORCA compound task writes <input_stem>_Compound_1.xyz after step 1.
-                step2_xyzfile_name = f"{out_path.stem}_Compound_1.xyz"
-                inp_text = render_orca_two_step_ts_input(
-                    xyz_text=structure.xyz_text,
-                    step2_xyzfile_name=step2_xyzfile_name,
-                    charge=config.charge,
-                    multiplicity=config.multiplicity,
-                    step1_keywords=_merge_keywords(
-                        config.base_keywords,
-                        config.orca_ts_step1_keywords,
-                        config.orca_extra_keywords,
-                    ),
-                    step2_keywords=_merge_keywords(
-                        config.base_keywords,
-                        config.orca_ts_step2_keywords,
-                        config.orca_extra_keywords,
-                    ),
-                    constraint_atom_pairs=config.orca_ts_constraint_atoms,
-                    nprocs=config.nprocs,
-                    maxcore=config.maxcore,
-                    calc_hess=config.orca_ts_calc_hess,
-                    smd=config.orca_smd,
-                    smd_solvent=config.orca_smd_solvent,
-                )
-            else:
-                inp_text = render_orca_input(
-                    xyz_text=structure.xyz_text,
-                    config=config,
-                )
+            f"{args.structure.stem}{default_output_suffix(engine)}"
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+
+    from qcinput.journal import default_journal_path
+
+    failures = _run_incremental(
+        args,
+        [BatchTask(structure=args.structure, output=out_path)],
+        config,
+        journal_path=args.journal
+        or default_journal_path(out_path.parent, out_path.name),
+        keep_going=True,
+    )
+    if failures:
+        raise SystemExit(f"error: {failures[0].error}")
+    return 0
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    from qcinput.batch import (
+        collect_structure_paths,
+        drop_generated_outputs,
+        plan_batch,
+        read_file_list,
+    )
+    from qcinput.config import QCInputConfig
+
+    try:
+        config = _load_configs(args)
+        engine = (
+            config.engine if isinstance(config, QCInputConfig) else config[0].engine
+        )
+        specs = list(args.inputs)
+        if args.file_list is not None:
+            specs.extend(read_file_list(args.file_list))
+        structures = drop_generated_outputs(
+            collect_structure_paths(specs), engine=engine, output_dir=args.output_dir
+        )
+        if not structures:
+            raise ValueError(
+                "No structure files given. Pass paths, globs, or --file-list."
+            )
+        if args.order == "cost" and args.archive is not None:
+            raise ValueError("--archive entries are ordered by name; drop --order.")
+        if args.pack is not None and (args.archive is not None or args.resume):
+            raise ValueError("--pack cannot be combined with --archive or --resume.")
+        if args.pack is not None and args.io_concurrency > 1:
+            raise ValueError("--pack reads structures serially; drop --io-concurrency.")
+        if args.archive is not None:
+            if args.output_dir is not None:
+                raise ValueError("--archive and --output-dir cannot be combined.")
+            if args.resume:
+                raise ValueError("--archive always writes the full set; drop --resume.")
+            # Entries are named as if the archive root were the output
+            # directory; sorted so the archive is reproducible.
+            tasks = sorted(
+                plan_batch(structures, engine=engine, output_dir=Path()),
+                key=lambda task: task.output.as_posix(),
+            )
         else:
-            if config.kind == "ts":
-                inp_text = render_gaussian_two_step_ts_input(
-                    xyz_text=structure.xyz_text,
-                    config=config,
-                    source_structure_name=args.structure.name,
-                )
-            else:
-                inp_text = render_gaussian_input(
-                    xyz_text=structure.xyz_text,
-                    config=config,
-                    source_structure_name=args.structure.name,
+            if args.output_dir is not None:
+                args.output_dir.mkdir(parents=True, exist_ok=True)
+            tasks = plan_batch(structures, engine=engine, output_dir=args.output_dir)
+    except (FileNotFoundError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+
+    if args.shard is not None:
+        from dataclasses import replace
+
+        from qcinput.shard import frame_ranges, select_shard
+
+        shard, shards = args.shard
+        # --pack groups whole files, so its shards deal whole files too.
+        split = (
+            {}
+            if args.pack is not None
+            else frame_ranges(structures, frames=args.frames)
+        )
+        selected = select_shard(
+            structures, shard=shard, shards=shards, by=args.shard_by, frames=split
+        )
+        tasks = [
+            replace(task, frames=selected[task.structure])
+            for task in tasks
+            if task.structure in selected
+        ]
+
+    if args.order == "cost":
+        from qcinput.cost import order_by_cost
+
+        ranks = {
+            path: rank
+            for rank, path in enumerate(
+                order_by_cost(
+                    [task.structure for task in tasks],
+                    config if isinstance(config, tuple) else (config,),
+                    frames=args.frames,
                 )
-        out_path.write_text(inp_text, encoding="utf-8")
+            )
+        }
+        tasks.sort(key=lambda task: ranks[task.structure])
+
+    if args.pack is not None:
+        return _run_batch_pack(args, [task.structure for task in tasks], config)
+    if args.archive is not None:
+        failures = _run_batch_archive(args, tasks, config)
+    else:
+        from qcinput.journal import batch_journal_key, default_journal_path
+
+        failures = _run_incremental(
+            args,
+            tasks,
+            config,
+            journal_path=args.journal
+            or default_journal_path(
+                args.output_dir or Path(), batch_journal_key(tasks)
+            ),
+            keep_going=args.keep_going,
+            workers=args.workers,
+            chunksize=args.chunksize,
+            io_concurrency=args.io_concurrency,
+        )
+    if args.shard is not None:
+        _write_shard_record(args, structures, split, tasks, failures)
+    return _report_failures(failures, total=len(tasks))
+
+
+def _write_shard_record(
+    args: argparse.Namespace,
+    structures: list[Path],
+    split: dict[Path, range],
+    tasks: list,
+    failures: list["BatchResult"],
+) -> None:
+    from qcinput.shard import (
+        ShardRecord,
+        default_record_path,
+        format_frames,
+        inputs_digest,
+        shard_key,
+        write_shard_record,
+    )
+
+    shard, shards = args.shard
+    failed = {failure.structure for failure in failures}
+    done = [task for task in tasks if task.structure not in failed]
+    record = ShardRecord(
+        shard=shard,
+        shards=shards,
+        by=args.shard_by,
+        inputs=len(structures),
+        inputs_sha256=inputs_digest(structures),
+        emitted=tuple(
+            shard_key(task.structure) for task in done if task.frames is None
+        ),
+        failed=tuple(shard_key(path) for path in sorted(failed, key=shard_key)),
+        split={
+            shard_key(path): format_frames(numbers)
+            for path, numbers in sorted(
+                split.items(), key=lambda item: shard_key(item[0])
+            )
+        },
+        emitted_frames={
+            shard_key(task.structure): format_frames(task.frames)
+            for task in done
+            if task.frames is not None
+        },
+    )
+    path = args.shard_record or default_record_path(
+        args.output_dir or Path(), shard, shards
+    )
+    try:
+        write_shard_record(path, record)
+    except OSError as exc:
+        raise SystemExit(f"error: Cannot write shard record: {exc}") from exc
+    print(f"shard {shard}/{shards}: record written to {path}", file=sys.stderr)
+
+
+def _report_failures(failures: list["BatchResult"], *, total: int) -> int:
+    if not failures:
+        return 0
+    print(f"error: {len(failures)} of {total} structures failed:", file=sys.stderr)
+    for failure in failures:
+        print(f"  {failure.structure}: {failure.error}", file=sys.stderr)
+    return 1
+
+
+def _run_batch_archive(
+    args: argparse.Namespace,
+    tasks: list,
+    config: "QCInputConfig | tuple[QCInputConfig, ...]",
+) -> list["BatchResult"]:
+    from qcinput.archive import ArchiveWriter, archive_format
+
+    try:
+        archive_format(args.archive)
+        args.archive.parent.mkdir(parents=True, exist_ok=True)
+        writer = ArchiveWriter(args.archive)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    completed = False
+    try:
+        with writer as archive:
+            _, failures = _run_tasks(
+                [(task, None) for task in tasks],
+                config,
+                None,
+                keep_going=args.keep_going,
+                archive=archive,
+                workers=args.workers,
+                chunksize=args.chunksize,
+                frames=args.frames,
+                io_concurrency=args.io_concurrency,
+            )
+        completed = True
+    finally:
+        # Do not leave a truncated archive behind after an aborted run.
+        if not completed:
+            args.archive.unlink(missing_ok=True)
+    print(args.archive)
+    return failures
+
+
+def _run_batch_pack(
+    args: argparse.Namespace,
+    structures: list[Path],
+    config: "QCInputConfig | tuple[QCInputConfig, ...]",
+) -> int:
+    from qcinput.pack import iter_packs
+
+    if isinstance(config, tuple):
+        if len(config) > 1:
+            raise SystemExit("error: --pack renders one engine and kind at a time.")
+        config = config[0]
+    output_dir = args.output_dir or Path()
+    try:
+        for path, text in iter_packs(
+            structures,
+            config,
+            size=args.pack,
+            output_dir=output_dir,
+            frames=args.frames,
+        ):
+            path.write_bytes(text.encode("utf-8"))
+            print(path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    return 0
+
+
+def run_split_pack(args: argparse.Namespace) -> int:
+    from qcinput.pack import pack_engine, split_pack_output
+
+    input_path = args.input
+    if input_path is None:
+        candidates = [args.output.with_suffix(suffix) for suffix in (".inp", ".gjf")]
+        input_path = next((path for path in candidates if path.exists()), candidates[0])
+    output_dir = args.output_dir or args.output.parent
+    try:
+        for path in (args.output, input_path):
+            if not path.exists():
+                raise FileNotFoundError(f"File not found: {path}")
+        pieces = split_pack_output(
+            args.output.read_text(encoding="utf-8", errors="replace"),
+            input_path.read_text(encoding="utf-8"),
+            engine=pack_engine(input_path),
+            marker=args.marker,
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, text in pieces:
+            path = output_dir / name
+            path.write_text(text, encoding="utf-8")
+            print(path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    return 0
+
+
+def run_verify_shards(args: argparse.Namespace) -> int:
+    from qcinput.shard import load_shard_record, verify_shards
+
+    try:
+        records = [load_shard_record(path) for path in args.records]
     except (FileNotFoundError, ValueError) as exc:
         raise SystemExit(f"error: {exc}") from exc
+    problems = verify_shards(records)
+    if problems:
+        print(f"error: {len(problems)} shard problems:", file=sys.stderr)
+        for problem in problems:
+            print(f"  {problem}", file=sys.stderr)
+        return 1
+    first = records[0]
+    print(f"ok: {first.inputs} structures emitted once across {first.shards} shards")
+    return 0
+
+
+def run_extract(args: argparse.Namespace) -> int:
+    from qcinput.archive import extract_archive
+
+    try:
+        for path in extract_archive(args.archive, args.output_dir):
+            print(path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    return 0
 
-    print(out_path)
+
+def run_estimate(args: argparse.Namespace) -> int:
+    from qcinput.batch import collect_structure_paths, read_file_list
+    from qcinput.config import load_config
+    from qcinput.cost import (
+        SECONDS_PER_UNIT,
+        iter_estimates,
+        job_cores,
+        suggest_walltime,
+    )
+
+    try:
+        config = load_config(args.config)
+        specs = list(args.inputs)
+        if args.file_list is not None:
+            specs.extend(read_file_list(args.file_list))
+        structures = collect_structure_paths(specs)
+        if not structures:
+            raise ValueError(
+                "No structure files given. Pass paths, globs, or --file-list."
+            )
+        rows = [
+            (name, estimate)
+            for _, name, estimate in iter_estimates(
+                structures, config, frames=args.frames
+            )
+        ]
+    except (FileNotFoundError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    if args.sort == "cost":
+        rows.sort(key=lambda row: -row[1].cost)
+    cores = args.cores or job_cores(config)
+    seconds_per_unit = args.seconds_per_unit or SECONDS_PER_UNIT
+    print(f"{'cost':>12} {'walltime':>9} {'basis_fns':>9} {'atoms':>6}  structure")
+    for name, estimate in rows:
+        walltime = suggest_walltime(
+            estimate.cost,
+            cores=cores,
+            seconds_per_unit=seconds_per_unit,
+            safety=args.safety,
+        )
+        print(
+            f"{estimate.cost:>12.1f} {walltime:>9} {estimate.basis_functions:>9} "
+            f"{estimate.atoms:>6}  {name}"
+        )
+    if rows:
+        first = rows[0][1]
+        total = sum(estimate.cost for _, estimate in rows)
+        print(
+            f"{len(rows)} structures, total cost {total:.1f} "
+            f"({first.method}, {first.basis}, {cores} cores per job)",
+            file=sys.stderr,
+        )
     return 0
 
 
-def main() -> int:
-    argv = sys.argv[1:]
+def run_jobscripts(args: argparse.Namespace) -> int:
+    from qcinput.batch import collect_structure_paths, read_file_list
+    from qcinput.config import load_all_configs
+    from qcinput.jobscript import (
+        INPUT_ENGINES,
+        check_fits,
+        group_by_shape,
+        input_engine,
+        job_resources,
+        pack_nodes,
+        plan_jobs,
+        render_array_script,
+        render_bundle_script,
+        script_path,
+    )
+
+    node = None
+    if args.node_cores is not None and args.node_mem is not None:
+        node = (args.node_cores, args.node_mem)
+    elif not args.array or (args.node_cores, args.node_mem) != (None, None):
+        raise SystemExit("error: Pass --node-cores and --node-mem (or --array).")
+    commands = {
+        engine: command
+        for engine, command in (
+            ("orca", args.orca_command),
+            ("gaussian", args.gaussian_command),
+        )
+        if command is not None
+    }
+    try:
+        specs = list(args.inputs)
+        if args.file_list is not None:
+            specs.extend(read_file_list(args.file_list))
+        inputs = collect_structure_paths(specs, suffixes=tuple(INPUT_ENGINES))
+        if not inputs:
+            raise ValueError("No input files given. Pass paths, globs, or --file-list.")
+        engines = tuple(dict.fromkeys(input_engine(path) for path in inputs))
+        # Resources are per engine ([orca], [gaussian]), shared by all kinds.
+        configs = load_all_configs(args.config, engines=engines)
+        resources = {
+            engine: job_resources(config, mem_overhead=args.mem_overhead)
+            for (engine, _), config in configs.items()
+        }
+        jobs = plan_jobs(inputs, resources)
+        if args.array:
+            if node is not None:
+                check_fits(jobs, cores=node[0], mem_mb=node[1])
+            groups = group_by_shape(jobs)
+        else:
+            groups = pack_nodes(jobs, cores=node[0], mem_mb=node[1])
+        output_dir = args.output_dir or inputs[0].parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for index, group in enumerate(groups, start=1):
+            options = {
+                "scheduler": args.scheduler,
+                "name": f"{args.name}-{index:04d}",
+                "workdir": output_dir,
+                "time": args.time,
+                "partition": args.partition,
+                "commands": commands,
+            }
+            if args.array:
+                text = render_array_script(group, **options)
+            else:
+                text = render_bundle_script(group, node=node, **options)
+            path = script_path(output_dir, args.name, index)
+            path.write_text(text, encoding="utf-8")
+            path.chmod(0o755)
+            print(path)
+    except (FileNotFoundError, OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    unit = "job arrays" if args.array else "node bundles"
+    print(f"{len(jobs)} jobs in {len(groups)} {unit}", file=sys.stderr)
+    return 0
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    import signal
+    import threading
+    import time
+    from functools import partial
+
+    from qcinput.watch import InputWatcher, StructureWatcher
+
+    missing = [path for path in args.directories if not path.is_dir()]
+    if missing:
+        raise SystemExit(f"error: Watch directory not found: {missing[0]}")
+    try:
+        if args.output_dir is not None:
+            args.output_dir.mkdir(parents=True, exist_ok=True)
+        watcher = InputWatcher(
+            StructureWatcher(args.directories, settle=0 if args.once else args.settle),
+            args.config,
+            partial(_load_configs, args),
+            output_dir=args.output_dir,
+            notify=lambda message: print(message, file=sys.stderr, flush=True),
+        )
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    failed = 0
+    try:
+        while True:
+            for result in watcher.poll():
+                if result.error is None:
+                    print(result.output, flush=True)
+                    continue
+                failed += 1
+                print(
+                    f"error: {result.structure}: {result.error}",
+                    file=sys.stderr,
+                    flush=True,
+                )
+            if args.once:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 1 if args.once and failed else 0
+
+
+def make_server(socket_path: Path) -> "QCInputServer":
+    from qcinput.server import QCInputServer
+
     parser = build_root_parser()
-    if argv and argv[0] not in {
-        "generate",
-        "init-config",
-        "-h",
-        "--help",
-        "-V",
-        "--version",
-    }:
+
+    def handle(argv: list[str]) -> int:
+        if argv and argv[0] in ("serve", "watch"):
+            raise SystemExit(f"error: `{argv[0]}` cannot be run through the server.")
+        return run(argv, parser=parser)
+
+    return QCInputServer(socket_path, handle)
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    import signal
+    import threading
+
+    from qcinput.server import default_socket_path
+
+    try:
+        socket_path = args.socket or default_socket_path()
+        server = make_server(socket_path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(socket_path, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+_COMMANDS = {
+    "generate",
+    "batch",
+    "init-config",
+    "serve",
+    "extract",
+    "verify-shards",
+    "split-pack",
+    "jobscripts",
+    "estimate",
+    "watch",
+    "-h",
+    "--help",
+    "-V",
+    "--version",
+}
+
+
+# Handled by main() only as the very first argument; argparse would accept
+# them after -h/-V or in a forwarded request and silently ignore them.
+_LEADING_FLAGS = ("--startup-profile", "--via-socket")
+
+
+def _reject_misplaced_flags(argv: Sequence[str]) -> None:
+    for arg in argv:
+        if arg == "--":
+            return
+        flag = arg.split("=", 1)[0]
+        if flag in _LEADING_FLAGS:
+            raise SystemExit(
+                f"error: {flag} must be the first argument, before the command."
+            )
+
+
+def run(argv: Sequence[str], *, parser: argparse.ArgumentParser | None = None) -> int:
+    argv = list(argv)
+    _reject_misplaced_flags(argv)
+    if parser is None:
+        parser = build_root_parser()
+    if argv and argv[0] not in _COMMANDS:
         argv = ["generate", *argv]
     args = parser.parse_args(argv)
+    if (
+        args.command in ("generate", "batch", "jobscripts", "estimate", "watch")
+        and args.config is None
+    ):
+        # Resolved per call, not at parser build time, so a parser reused by
+        # `serve` follows each request's working directory and QCINPUT_CONFIG.
+        from qcinput.config import default_config_path
+
+        args.config = default_config_path()
     if args.command == "init-config":
         return run_init_config(args)
     if args.command == "generate":
         return run_generate(args)
+    if args.command == "batch":
+        return run_batch(args)
+    if args.command == "serve":
+        return run_serve(args)
+    if args.command == "extract":
+        return run_extract(args)
+    if args.command == "verify-shards":
+        return run_verify_shards(args)
+    if args.command == "split-pack":
+        return run_split_pack(args)
+    if args.command == "jobscripts":
+        return run_jobscripts(args)
+    if args.command == "estimate":
+        return run_estimate(args)
+    if args.command == "watch":
+        return run_watch(args)
     parser.print_help()
     return 0
+
+
+_IMPORTTIME_PREFIX = "import time:"
+
+
+def run_startup_profile(argv: list[str], *, limit: int = 25) -> int:
+    # Runs the command in a fresh interpreter under -X importtime and reports
+    # the slowest imports (by cumulative time) in the same format.
+    import subprocess
+    import time
+
+    package_root = str(Path(__file__).resolve().parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, (package_root, env.get("PYTHONPATH")))
+    )
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        "import sys; from qcinput.cli import main; sys.exit(main())",
+        *argv,
+    ]
+    started = time.perf_counter()
+    proc = subprocess.run(command, env=env, stderr=subprocess.PIPE, text=True)
+    wall_ms = (time.perf_counter() - started) * 1e3
+
+    imports: list[tuple[int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            print(line, file=sys.stderr)
+            continue
+        self_us, cumulative_us, name = line[len(_IMPORTTIME_PREFIX) :].split("|")
+        if self_us.strip().isdigit():
+            imports.append((int(cumulative_us), int(self_us), name.rstrip()))
+
+    total_ms = sum(self_us for _, self_us, _ in imports) / 1e3
+    print(
+        f"startup profile: {wall_ms:.1f} ms wall, {total_ms:.1f} ms in "
+        f"{len(imports)} imports",
+        file=sys.stderr,
+    )
+    print(
+        f"{_IMPORTTIME_PREFIX} self [us] | cumulative | imported package",
+        file=sys.stderr,
+    )
+    for cumulative_us, self_us, name in sorted(imports, reverse=True)[:limit]:
+        print(
+            f"{_IMPORTTIME_PREFIX} {self_us:>9} | {cumulative_us:>10} |{name}",
+            file=sys.stderr,
+        )
+    return proc.returncode
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "--startup-profile":
+        return run_startup_profile(argv[1:])
+    if argv and argv[0].split("=", 1)[0] == "--via-socket":
+        from qcinput.server import default_socket_path, forward
+
+        _, _, socket_path = argv[0].partition("=")
+        _reject_misplaced_flags(argv[1:])
+        try:
+            path = Path(socket_path) if socket_path else default_socket_path()
+        except ValueError as exc:
+            raise SystemExit(f"error: {exc}") from exc
+        return forward(argv[1:], socket_path=path)
+    return run(argv)
@@ -1,10 +1,29 @@
+import hashlib
+import json
 import os
 import re
+import threading
+import time
 import tomllib
-from dataclasses import dataclass
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
+from qcinput import __version__
+
+CONFIG_CACHE_DIR_ENV = "QCINPUT_CONFIG_CACHE_DIR"
+# On-disk entries are <content sha256><suffix>, so a shared directory can
+# be cleaned without touching anything else in it.
+DISK_CACHE_SUFFIX = ".qcinput-config.json"
+_CONFIG_CACHE_SIZE = 128
+# Files modified this close to the moment they were parsed may change again
+# without a visible mtime/size change (coarse filesystem timestamps), so such
+# entries are re-verified by content hash until they age out of the window.
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 @dataclass(frozen=True)
 class QCInputConfig:
@@ -32,6 +51,10 @@ class QCInputConfig:
     gaussian_ts_step2_keywords: tuple[str, ...] = ()
 
 
+ENGINES = ("orca", "gaussian")
+KINDS = ("int", "ts", "sp")
+
+
 def default_config_path() -> Path:
     env_path = os.environ.get("QCINPUT_CONFIG")
     if env_path:
@@ -358,25 +381,277 @@ def _load_gaussian_config(
     )
 
 
-def load_config(path: Path) -> QCInputConfig:
-    if not path.exists():
-        raise FileNotFoundError(
-            f"Config file not found: {path}. "
-            "Run `qcinput init-config` or pass --config <path>."
-        )
-    content = path.read_bytes()
+def _load_raw(content: bytes) -> tuple[dict[str, Any], dict[str, Any]]:
     raw = tomllib.loads(content.decode("utf-8"))
     if not isinstance(raw, dict):
         raise ValueError("Config root must be a table.")
+    molecule = raw.get("molecule")
+    if not isinstance(molecule, dict):
+        raise ValueError("Missing [molecule] table in config.")
+    return raw, molecule
+
 
+def _parse_config(content: bytes) -> QCInputConfig:
+    raw, molecule = _load_raw(content)
     qcinput = raw.get("qcinput")
-    molecule = raw.get("molecule")
     if not isinstance(qcinput, dict):
         raise ValueError("Missing [qcinput] table in config.")
-    if not isinstance(molecule, dict):
-        raise ValueError("Missing [molecule] table in config.")
     engine = _as_engine(qcinput, "engine")
     kind = _as_kind(qcinput, "kind")
     if engine == "orca":
         return _load_orca_config(raw=raw, molecule=molecule, kind=kind)
     return _load_gaussian_config(raw=raw, molecule=molecule, kind=kind)
+
+
+@dataclass
+class _CacheEntry:
+    digest: str
+    configs: tuple[QCInputConfig, ...]
+    verified_ns: int
+
+
+# Keyed by (path, st_dev, st_ino, st_size, st_mtime_ns, variant), where the
+# variant tells load_config() and the load_all_configs() selections apart.
+_config_cache: OrderedDict[tuple[Any, ...], _CacheEntry] = OrderedDict()
+_config_cache_lock = threading.Lock()
+
+
+def _tuplify(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_tuplify(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=64)
+def config_digest(config: QCInputConfig) -> str:
+    # Hash of the resolved fields, so formatting-only edits to the TOML file
+    # (comments, key order, unused sections) do not change it. Cached: the
+    # manifest check of every `serve` request and batch task needs it.
+    payload = json.dumps(asdict(config), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _disk_cache_path(cache_dir: Path, digest: str, variant: tuple[Any, ...]) -> Path:
+    # <content sha256>[-<selection hash>]<suffix>
+    tag = ""
+    if variant:
+        selection = json.dumps(variant).encode("utf-8")
+        tag = f"-{hashlib.sha256(selection).hexdigest()[:16]}"
+    return cache_dir / f"{digest}{tag}{DISK_CACHE_SUFFIX}"
+
+
+def _read_disk_cache(
+    cache_dir: Path, digest: str, variant: tuple[Any, ...]
+) -> tuple[QCInputConfig, ...] | None:
+    try:
+        payload = json.loads(
+            _disk_cache_path(cache_dir, digest, variant).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("qcinput_version") != __version__:
+        return None
+    items = payload.get("configs")
+    names = {field.name for field in fields(QCInputConfig)}
+    if not isinstance(items, list) or not all(
+        isinstance(data, dict) and set(data) == names for data in items
+    ):
+        return None
+    return tuple(
+        QCInputConfig(**{key: _tuplify(value) for key, value in data.items()})
+        for data in items
+    )
+
+
+def _write_disk_cache(
+    cache_dir: Path,
+    digest: str,
+    variant: tuple[Any, ...],
+    configs: tuple[QCInputConfig, ...],
+) -> None:
+    payload = {
+        "qcinput_version": __version__,
+        "configs": [asdict(config) for config in configs],
+    }
+    target = _disk_cache_path(cache_dir, digest, variant)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        # The on-disk cache is an optimization; an unwritable directory
+        # only costs a re-parse next time.
+        tmp.unlink(missing_ok=True)
+
+
+def _default_cache_dir() -> Path | None:
+    env_path = os.environ.get(CONFIG_CACHE_DIR_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    return None
+
+
+def clear_config_cache(
+    path: Path | None = None, *, cache_dir: Path | None = None
+) -> None:
+    # With `cache_dir`, also deletes on-disk entries: those of `path`'s
+    # current and previously loaded contents, or all of them. Other files in
+    # the directory are never touched.
+    digests: set[str] = set()
+    with _config_cache_lock:
+        if path is None:
+            _config_cache.clear()
+        else:
+            name = os.fspath(path)
+            for key in [key for key in _config_cache if key[0] == name]:
+                digests.add(_config_cache.pop(key).digest)
+    if cache_dir is None:
+        return
+    if path is None:
+        for entry in cache_dir.glob(f"*{DISK_CACHE_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+        return
+    try:
+        digests.add(hashlib.sha256(path.read_bytes()).hexdigest())
+    except OSError:
+        pass
+    for digest in digests:
+        for entry in cache_dir.glob(f"{digest}*{DISK_CACHE_SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+
+def _config_not_found(path: Path) -> FileNotFoundError:
+    return FileNotFoundError(
+        f"Config file not found: {path}. "
+        "Run `qcinput init-config` or pass --config <path>."
+    )
+
+
+def _load_cached(
+    path: Path,
+    variant: tuple[Any, ...],
+    parse: Callable[[bytes], tuple[QCInputConfig, ...]],
+    *,
+    cache_dir: Path | None,
+) -> tuple[QCInputConfig, ...]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise _config_not_found(path) from None
+    key = (
+        os.fspath(path),
+        stat.st_dev,
+        stat.st_ino,
+        stat.st_size,
+        stat.st_mtime_ns,
+        variant,
+    )
+    with _config_cache_lock:
+        entry = _config_cache.get(key)
+        if entry is not None:
+            _config_cache.move_to_end(key)
+    if entry is not None and stat.st_mtime_ns < entry.verified_ns - _RACY_WINDOW_NS:
+        return entry.configs
+
+    now_ns = time.time_ns()
+    content = path.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    if entry is not None and entry.digest == digest:
+        entry.verified_ns = now_ns
+        return entry.configs
+
+    if cache_dir is None:
+        cache_dir = _default_cache_dir()
+    configs = (
+        None if cache_dir is None else _read_disk_cache(cache_dir, digest, variant)
+    )
+    if configs is None:
+        configs = parse(content)
+        if cache_dir is not None:
+            _write_disk_cache(cache_dir, digest, variant, configs)
+
+    with _config_cache_lock:
+        _config_cache[key] = _CacheEntry(
+            digest=digest, configs=configs, verified_ns=now_ns
+        )
+        _config_cache.move_to_end(key)
+        while len(_config_cache) > _CONFIG_CACHE_SIZE:
+            _config_cache.popitem(last=False)
+    return configs
+
+
+def load_config(path: Path, *, cache_dir: Path | None = None) -> QCInputConfig:
+    (config,) = _load_cached(
+        path, (), lambda content: (_parse_config(content),), cache_dir=cache_dir
+    )
+    return config
+
+
+def _parse_all_configs(
+    content: bytes,
+    *,
+    engines: tuple[str, ...] | None,
+    kinds: tuple[str, ...] | None,
+    active_defaults: bool,
+) -> tuple[QCInputConfig, ...]:
+    raw, molecule = _load_raw(content)
+    if active_defaults and (engines is None or kinds is None):
+        qcinput = raw.get("qcinput")
+        if not isinstance(qcinput, dict):
+            raise ValueError("Missing [qcinput] table in config.")
+        engines = engines or (_as_engine(qcinput, "engine"),)
+        kinds = kinds or (_as_kind(qcinput, "kind"),)
+
+    configs: list[QCInputConfig] = []
+    for engine in engines or ENGINES:
+        engine_section = raw.get(engine)
+        task_tables = (
+            engine_section.get("task") if isinstance(engine_section, dict) else None
+        )
+        for kind in kinds or KINDS:
+            # Without an explicit selection, every task table present is built;
+            # an explicitly requested pair must exist.
+            if (engines is None or kinds is None) and not (
+                isinstance(task_tables, dict) and kind in task_tables
+            ):
+                continue
+            if engine == "orca":
+                config = _load_orca_config(raw=raw, molecule=molecule, kind=kind)
+            else:
+                config = _load_gaussian_config(raw=raw, molecule=molecule, kind=kind)
+            configs.append(config)
+    if not configs:
+        raise ValueError("Config defines no [orca.task.*] or [gaussian.task.*] tables.")
+    return tuple(configs)
+
+
+def load_all_configs(
+    path: Path,
+    *,
+    engines: tuple[str, ...] | None = None,
+    kinds: tuple[str, ...] | None = None,
+    active_defaults: bool = False,
+    cache_dir: Path | None = None,
+) -> dict[tuple[str, str], QCInputConfig]:
+    # One parse of the TOML for every (engine, kind) selected. With
+    # active_defaults, a missing engine or kind selection falls back to the
+    # [qcinput] engine/kind instead of "every task table present".
+    for engine in engines or ():
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'; expected orca or gaussian.")
+    for kind in kinds or ():
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind '{kind}'; expected int, ts, or sp.")
+    configs = _load_cached(
+        path,
+        ("all", engines, kinds, active_defaults),
+        partial(
+            _parse_all_configs,
+            engines=engines,
+            kinds=kinds,
+            active_defaults=active_defaults,
+        ),
+        cache_dir=cache_dir,
+    )
+    return {(config.engine, config.kind): config for config in configs}
@@ -0,0 +1,284 @@
+import math
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from qcinput.config import QCInputConfig
+from qcinput.generate import iter_structure_items
+from qcinput.structure import StructureData
+
+# Approximate basis functions per atom by period: H-He, Li-Ne, Na-Ar, K-Kr,
+# Rb and heavier (ECP bases there). Row averages are enough for a relative
+# cost; Pople sets count Cartesian d functions like Gaussian does by default.
+_BASIS_TABLE = {
+    "STO-3G": (1, 5, 9, 18, 27),
+    "3-21G": (2, 9, 13, 23, 33),
+    "6-31G": (2, 9, 13, 23, 23),
+    "6-31G(d)": (2, 15, 19, 29, 29),
+    "6-31G(d,p)": (5, 15, 19, 29, 29),
+    "6-31+G(d)": (2, 19, 23, 33, 33),
+    "6-31+G(d,p)": (5, 19, 23, 33, 33),
+    "6-31++G(d,p)": (6, 19, 23, 33, 33),
+    "6-311G(d)": (3, 18, 26, 35, 35),
+    "6-311G(d,p)": (6, 18, 26, 35, 35),
+    "6-311+G(d,p)": (6, 22, 30, 39, 39),
+    "6-311++G(d,p)": (7, 22, 30, 39, 39),
+    "6-311++G(2d,2p)": (10, 27, 35, 44, 44),
+    "LANL2DZ": (2, 9, 13, 18, 18),
+    "def2-SVP": (5, 14, 18, 31, 31),
+    "def2-SVPD": (5, 18, 23, 36, 36),
+    "def2-mSVP": (5, 14, 18, 31, 31),
+    "def2-TZVP": (6, 31, 37, 45, 43),
+    "def2-TZVPD": (9, 36, 42, 50, 48),
+    "def2-mTZVP": (6, 24, 32, 40, 40),
+    "def2-mTZVPP": (6, 24, 32, 40, 40),
+    "def2-TZVPP": (14, 31, 37, 45, 45),
+    "def2-TZVPPD": (17, 36, 42, 50, 50),
+    "def2-QZVP": (30, 57, 70, 87, 80),
+    "def2-QZVPP": (30, 57, 70, 87, 80),
+    "cc-pVDZ": (5, 14, 18, 31, 31),
+    "cc-pVTZ": (14, 30, 34, 50, 50),
+    "cc-pVQZ": (30, 55, 59, 84, 84),
+    "aug-cc-pVDZ": (9, 23, 27, 40, 40),
+    "aug-cc-pVTZ": (23, 46, 50, 66, 66),
+    "aug-cc-pVQZ": (46, 80, 84, 109, 109),
+}
+# Composite methods bring their own basis.
+_COMPOSITE_BASIS = {
+    "r2scan-3c": "def2-mTZVPP",
+    "b97-3c": "def2-mTZVP",
+    "pbeh-3c": "def2-mSVP",
+    "hf-3c": "3-21G",
+    "wb97x-3c": "def2-SVP",
+}
+FALLBACK_BASIS = "def2-SVP"
+_PERIOD_STARTS = (3, 11, 19, 37)
+
+# (scaling class, prefactor relative to one SCF at the reference size).
+_METHODS = (
+    (re.compile(r"^(?:am1|pm3|pm6|pm7|mndo|g?fn\d?-?xtb|xtb\d?)$"), "scf", 0.001),
+    (re.compile(r"^dlpno-"), "scf", 10.0),
+    (re.compile(r"^(?:[ur]|ro)?(?:ccsd\(t\)|qcisd\(t\)|mp4)"), "n7", 60.0),
+    (re.compile(r"^(?:[ur]|ro)?(?:ccsd|qcisd|mp3)"), "n6", 30.0),
+    (re.compile(r"^(?:ri-|scs-|sos-|[ur])?mp2"), "n5", 2.0),
+    (
+        re.compile(r"^(?:b2plyp|b2gp-plyp|dsd-|revdsd-|pwpb95|wb2plyp|wb97x-2)"),
+        "n5",
+        3.0,
+    ),
+)
+_REFERENCE_BASIS_FUNCTIONS = 100
+_REFERENCE_OCCUPIED = 10
+
+OPT_BASE_CYCLES = 10
+OPT_CYCLES_PER_ATOM = 0.25
+GRADIENT_COST = 1.5
+HESSIAN_COST_PER_ATOM = 0.5
+OPEN_SHELL_FACTOR = 1.5
+SOLVATION_FACTOR = 1.2
+# Wall seconds of one cost unit (one SCF on 100 basis functions) on one core.
+SECONDS_PER_UNIT = 30.0
+WALLTIME_STEP_MINUTES = 15
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    atoms: int
+    electrons: int
+    basis: str
+    basis_functions: int
+    method: str
+    cost: float
+
+
+def _basis_key(name: str) -> str:
+    key = name.casefold().replace("**", "(d,p)").replace("*", "(d)")
+    return re.sub(r"[-(), ]", "", key)
+
+
+_BASIS_FUNCTIONS = {_basis_key(name): (name, row) for name, row in _BASIS_TABLE.items()}
+
+
+def _tokens(keywords: Iterable[str]) -> list[str]:
+    # Route/keyword tokens, with Gaussian's method/basis split apart.
+    return [
+        token
+        for keyword in keywords
+        for part in keyword.casefold().split()
+        for token in part.split("/")
+        if token
+    ]
+
+
+def _period(number: int) -> int:
+    return sum(number >= start for start in _PERIOD_STARTS)
+
+
+def basis_functions(numbers: Iterable[int], basis: str) -> int:
+    row = _BASIS_FUNCTIONS[_basis_key(basis)][1]
+    return sum(row[_period(number)] for number in numbers if number > 0)
+
+
+def find_basis(tokens: Iterable[str]) -> str | None:
+    for token in tokens:
+        if token in _COMPOSITE_BASIS:
+            return _COMPOSITE_BASIS[token]
+        known = _BASIS_FUNCTIONS.get(_basis_key(token))
+        if known is not None:
+            return known[0]
+    return None
+
+
+def find_method(tokens: Iterable[str]) -> tuple[str, str, float]:
+    # (method token, scaling class, prefactor); HF/DFT unless a correlated
+    # or semiempirical method is named.
+    for token in tokens:
+        for pattern, scaling, prefactor in _METHODS:
+            if pattern.match(token):
+                return token, scaling, prefactor
+    return "hf/dft", "scf", 1.0
+
+
+def _scaling(scaling: str, functions: int, occupied: int) -> float:
+    virtual = max(functions - occupied, 1)
+    if scaling == "n5":
+        return occupied**2 * virtual**2 * functions
+    if scaling == "n6":
+        return occupied**2 * virtual**4
+    if scaling == "n7":
+        return occupied**3 * virtual**4
+    return functions**2 * occupied
+
+
+def _step_cost(tokens: list[str], atoms: int, *, initial_hessian: bool) -> float:
+    # In single-point equivalents: optimizations take a gradient per cycle
+    # and more cycles for bigger molecules; Hessians grow with the atoms.
+    cost = 1.0
+    if any("opt" in token for token in tokens):
+        cycles = OPT_BASE_CYCLES + OPT_CYCLES_PER_ATOM * atoms
+        cost += cycles * GRADIENT_COST
+    if initial_hessian or any(
+        "freq" in token or "calcfc" in token or "calcall" in token for token in tokens
+    ):
+        cost += HESSIAN_COST_PER_ATOM * atoms
+    return cost
+
+
+def _config_steps(config: QCInputConfig) -> list[tuple[list[str], bool]]:
+    # (keyword tokens, computes an initial Hessian) per job step.
+    if config.engine == "orca":
+        base = (*config.base_keywords, *config.orca_extra_keywords)
+        ts_steps = (config.orca_ts_step1_keywords, config.orca_ts_step2_keywords)
+        calc_hess = bool(config.orca_ts_calc_hess)
+    else:
+        base = (*config.gaussian_base_keywords, *config.gaussian_extra_keywords)
+        ts_steps = (
+            config.gaussian_ts_step1_keywords,
+            config.gaussian_ts_step2_keywords,
+        )
+        calc_hess = False
+    if config.kind == "ts":
+        return [
+            (_tokens((*base, *ts_steps[0])), False),
+            (_tokens((*base, *ts_steps[1])), calc_hess),
+        ]
+    return [(_tokens((*base, *config.task_keywords)), False)]
+
+
+def estimate_cost(structure: StructureData, config: QCInputConfig) -> CostEstimate:
+    # Relative cost of one input: 1.0 is a single-point SCF on 100 basis
+    # functions and 10 occupied orbitals. Meant for ordering jobs and rough
+    # walltimes, not for absolute timings.
+    numbers = structure.geometry.numbers
+    atoms = len(numbers)
+    charge = config.charge if structure.charge is None else structure.charge
+    multiplicity = (
+        config.multiplicity
+        if structure.multiplicity is None
+        else structure.multiplicity
+    )
+    electrons = max(sum(numbers) - charge, 0)
+    steps = _config_steps(config)
+    tokens = [token for step, _ in steps for token in step]
+    basis = find_basis(tokens) or FALLBACK_BASIS
+    method, scaling, prefactor = find_method(tokens)
+    functions = basis_functions(numbers, basis)
+    occupied = max(math.ceil(electrons / 2), 1)
+    cost = prefactor * (
+        _scaling(scaling, functions, occupied)
+        / _scaling(scaling, _REFERENCE_BASIS_FUNCTIONS, _REFERENCE_OCCUPIED)
+    )
+    cost *= sum(
+        _step_cost(step, atoms, initial_hessian=hessian) for step, hessian in steps
+    )
+    if multiplicity > 1:
+        cost *= OPEN_SHELL_FACTOR
+    if config.orca_smd or any(
+        token.startswith(("scrf", "cpcm", "smd")) for token in tokens
+    ):
+        cost *= SOLVATION_FACTOR
+    return CostEstimate(
+        atoms=atoms,
+        electrons=electrons,
+        basis=basis,
+        basis_functions=functions,
+        method=method,
+        cost=cost,
+    )
+
+
+def job_cores(config: QCInputConfig) -> int:
+    cores = config.nprocs if config.engine == "orca" else config.nprocshared
+    return cores or 1
+
+
+def suggest_walltime(
+    cost: float,
+    *,
+    cores: int = 1,
+    seconds_per_unit: float = SECONDS_PER_UNIT,
+    safety: float = 3.0,
+) -> str:
+    # HH:MM:SS, rounded up to whole steps; parallel speedup is sublinear.
+    seconds = cost * seconds_per_unit * safety / cores**0.85
+    step = WALLTIME_STEP_MINUTES * 60
+    seconds = max(math.ceil(seconds / step), 1) * step
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:00"
+
+
+def iter_estimates(
+    structures: Iterable[Path],
+    config: QCInputConfig,
+    *,
+    frames: slice | None = None,
+) -> Iterator[tuple[Path, str, CostEstimate]]:
+    # (structure file, structure name, estimate) for every structure, frames
+    # of multi-frame XYZ files included.
+    for path in structures:
+        try:
+            for name, _, structure in iter_structure_items(path, path, frames=frames):
+                yield path, name, estimate_cost(structure, config)
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+
+
+def order_by_cost(
+    structures: Iterable[Path],
+    configs: Sequence[QCInputConfig],
+    *,
+    frames: slice | None = None,
+) -> list[Path]:
+    # Most expensive file first (all frames and configs summed). Files that
+    # cannot be read go last and fail when they are generated.
+    totals: dict[Path, float] = {}
+    for path in structures:
+        try:
+            totals[path] = sum(
+                estimate.cost
+                for config in configs
+                for _, _, estimate in iter_estimates([path], config, frames=frames)
+            )
+        except ValueError:
+            totals[path] = -1.0
+    return sorted(totals, key=lambda path: -totals[path])
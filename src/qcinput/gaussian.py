@@ -1,7 +1,16 @@
-from pathlib import Path
+import io
+import os
+from typing import IO
 
 from qcinput import __generator_banner__
 from qcinput.config import QCInputConfig
+from qcinput.template import InputTemplate, slot
+
+
+def chk_name(source_structure_name: str) -> str:
+    # Same result as Path(name).stem, without a Path object per structure.
+    stem = os.path.splitext(os.path.basename(source_structure_name))[0]
+    return f"{stem}.chk"
 
 
 def render_gaussian_input(
@@ -10,13 +19,35 @@ def render_gaussian_input(
     config: QCInputConfig,
     source_structure_name: str,
 ) -> str:
+    buffer = io.StringIO()
+    write_gaussian_input(
+        buffer,
+        xyz_text=xyz_text,
+        config=config,
+        source_structure_name=source_structure_name,
+    )
+    return buffer.getvalue()
+
+
+def write_gaussian_input(
+    stream: IO,
+    *,
+    xyz_text: str,
+    config: QCInputConfig,
+    source_structure_name: str,
+) -> None:
+    gaussian_input_template(config).write(
+        stream, xyz=xyz_text, chk=chk_name(source_structure_name)
+    )
+
+
+def gaussian_input_template(config: QCInputConfig) -> InputTemplate:
     if (
         config.nprocshared is None
         or config.mem is None
         or not config.gaussian_base_keywords
     ):
         raise ValueError("Gaussian config is incomplete.")
-    chk_name = f"{Path(source_structure_name).stem}.chk"
     keywords = " ".join(
         (
             *config.gaussian_base_keywords,
@@ -25,7 +56,7 @@ def render_gaussian_input(
         )
     )
     lines = [
-        f"%chk={chk_name}",
+        f"%chk={slot('chk')}",
         f"%NProcShared={config.nprocshared}",
         f"%Mem={config.mem}",
         f"#P {keywords}",
@@ -33,12 +64,12 @@ def render_gaussian_input(
         __generator_banner__,
         "",
         f"{config.charge} {config.multiplicity}",
-        xyz_text,
+        slot("xyz"),
         "",
         "",
         "",
     ]
-    return "\n".join(lines)
+    return InputTemplate("\n".join(lines))
 
 
 def render_gaussian_two_step_ts_input(
@@ -47,6 +78,29 @@ def render_gaussian_two_step_ts_input(
     config: QCInputConfig,
     source_structure_name: str,
 ) -> str:
+    buffer = io.StringIO()
+    write_gaussian_two_step_ts_input(
+        buffer,
+        xyz_text=xyz_text,
+        config=config,
+        source_structure_name=source_structure_name,
+    )
+    return buffer.getvalue()
+
+
+def write_gaussian_two_step_ts_input(
+    stream: IO,
+    *,
+    xyz_text: str,
+    config: QCInputConfig,
+    source_structure_name: str,
+) -> None:
+    gaussian_two_step_ts_template(config).write(
+        stream, xyz=xyz_text, chk=chk_name(source_structure_name)
+    )
+
+
+def gaussian_two_step_ts_template(config: QCInputConfig) -> InputTemplate:
     if (
         config.nprocshared is None
         or config.mem is None
@@ -60,7 +114,6 @@ def render_gaussian_two_step_ts_input(
     ):
         raise ValueError("Gaussian ts config is incomplete.")
 
-    chk_name = f"{Path(source_structure_name).stem}.chk"
     step1_keywords = " ".join(
         (
             *config.gaussian_base_keywords,
@@ -76,7 +129,7 @@ def render_gaussian_two_step_ts_input(
         )
     )
     lines = [
-        f"%chk={chk_name}",
+        f"%chk={slot('chk')}",
         f"%nprocshared={config.nprocshared}",
         f"%mem={config.mem}",
         f"#p {step1_keywords}",
@@ -84,7 +137,7 @@ def render_gaussian_two_step_ts_input(
         __generator_banner__,
         "",
         f"{config.charge} {config.multiplicity}",
-        xyz_text,
+        slot("xyz"),
         "",
     ]
     lines.extend(config.gaussian_ts_modredundant)
@@ -92,7 +145,7 @@ def render_gaussian_two_step_ts_input(
         [
             "",
             "--Link1--",
-            f"%chk={chk_name}",
+            f"%chk={slot('chk')}",
             f"%nprocshared={config.nprocshared}",
             f"%mem={config.mem}",
             f"#p {step2_keywords}",
@@ -100,4 +153,37 @@ def render_gaussian_two_step_ts_input(
             "",
         ]
     )
-    return "\n".join(lines)
+    return InputTemplate("\n".join(lines))
+
+
+def gaussian_pack_job_template(config: QCInputConfig) -> InputTemplate:
+    # One --Link1-- job of a packed input: its own %chk, title label, charge
+    # and multiplicity; %NProcShared/%Mem/route come from the shared config.
+    if (
+        config.nprocshared is None
+        or config.mem is None
+        or not config.gaussian_base_keywords
+    ):
+        raise ValueError("Gaussian config is incomplete.")
+    keywords = " ".join(
+        (
+            *config.gaussian_base_keywords,
+            *config.task_keywords,
+            *config.gaussian_extra_keywords,
+        )
+    )
+    lines = [
+        f"%chk={slot('chk')}",
+        f"%NProcShared={config.nprocshared}",
+        f"%Mem={config.mem}",
+        f"#P {keywords}",
+        "",
+        __generator_banner__,
+        slot("label"),
+        "",
+        f"{slot('charge')} {slot('multiplicity')}",
+        slot("xyz"),
+        "",
+        "",
+    ]
+    return InputTemplate("\n".join(lines))
@@ -0,0 +1,409 @@
+import hashlib
+from collections.abc import Container, Iterable, Iterator, Sequence
+from dataclasses import replace
+from functools import lru_cache, partial
+from itertools import chain
+from pathlib import Path
+from typing import IO
+
+from qcinput.config import QCInputConfig
+from qcinput.gaussian import (
+    chk_name,
+    gaussian_input_template,
+    gaussian_two_step_ts_template,
+)
+from qcinput.orca import orca_input_template, orca_two_step_ts_template
+from qcinput.structure import StructureData, iter_structures
+from qcinput.structure.xyz_index import XYZFrameIndex
+from qcinput.template import InputTemplate
+from qcinput.timings import active_timer
+
+# Geometry size (atoms, about 1 MiB of coordinate text) from which outputs
+# are streamed to disk.
+STREAM_MIN_ATOMS = 1 << 15
+
+
+def _merge_keywords(*keyword_groups: tuple[str, ...]) -> tuple[str, ...]:
+    merged: list[str] = []
+    for group in keyword_groups:
+        for kw in group:
+            if kw not in merged:
+                merged.append(kw)
+    return tuple(merged)
+
+
+def default_output_suffix(engine: str) -> str:
+    return ".inp" if engine == "orca" else ".gjf"
+
+
+def resolve_structure_config(
+    config: QCInputConfig, structure: StructureData
+) -> QCInputConfig:
+    if (
+        structure.source_format != "gjf"
+        or structure.charge is None
+        or structure.multiplicity is None
+    ):
+        return config
+    if (
+        config.charge != structure.charge
+        or config.multiplicity != structure.multiplicity
+    ):
+        raise ValueError(
+            "GJF charge/multiplicity mismatch with config: "
+            f"gjf={structure.charge}/{structure.multiplicity}, "
+            f"config={config.charge}/{config.multiplicity}. "
+            "Please align [molecule] in config with the GJF file."
+        )
+    return replace(
+        config,
+        charge=structure.charge,
+        multiplicity=structure.multiplicity,
+    )
+
+
+class CompiledRenderer:
+    # Everything that depends only on the config (keyword joins, NoPop scan,
+    # %pal/%cpcm/%geom blocks) is rendered once; per structure only the
+    # geometry and the structure-dependent file names are spliced in.
+    __slots__ = ("config", "_template")
+
+    def __init__(self, config: QCInputConfig) -> None:
+        self.config = config
+        if config.engine == "orca":
+            self._template = _compile_orca_template(config)
+        elif config.kind == "ts":
+            self._template = gaussian_two_step_ts_template(config)
+        else:
+            self._template = gaussian_input_template(config)
+
+    def _values(
+        self,
+        structure: StructureData,
+        *,
+        source_structure_name: str,
+        output_stem: str,
+        stream: bool = False,
+    ) -> dict[str, str | Iterable[str]]:
+        resolve_structure_config(self.config, structure)
+        values: dict[str, str | Iterable[str]] = {
+            "xyz": structure.geometry.iter_text() if stream else structure.xyz_text
+        }
+        if self.config.engine == "gaussian":
+            values["chk"] = chk_name(source_structure_name)
+        elif self.config.kind == "ts":
+            # ORCA compound task writes <input_stem>_Compound_1.xyz after step 1.
+            values["step2_xyzfile"] = f"{output_stem}_Compound_1.xyz"
+        return values
+
+    def render(
+        self,
+        structure: StructureData,
+        *,
+        source_structure_name: str,
+        output_stem: str,
+    ) -> str:
+        return self._template.render(
+            **self._values(
+                structure,
+                source_structure_name=source_structure_name,
+                output_stem=output_stem,
+            )
+        )
+
+    def write(
+        self,
+        stream: IO,
+        structure: StructureData,
+        *,
+        source_structure_name: str,
+        output_stem: str,
+    ) -> None:
+        # Streams the input into a text or binary file object in chunks.
+        self._template.write(
+            stream,
+            **self._values(
+                structure,
+                source_structure_name=source_structure_name,
+                output_stem=output_stem,
+                stream=True,
+            ),
+        )
+
+
+def _compile_orca_template(config: QCInputConfig) -> InputTemplate:
+    if config.kind != "ts":
+        return orca_input_template(config)
+    if not config.orca_ts_constraint_atoms:
+        raise ValueError("ORCA ts config is missing constraint_atoms.")
+    if (
+        config.nprocs is None
+        or config.maxcore is None
+        or config.orca_ts_calc_hess is None
+    ):
+        raise ValueError("ORCA ts config is incomplete.")
+    return orca_two_step_ts_template(
+        charge=config.charge,
+        multiplicity=config.multiplicity,
+        step1_keywords=_merge_keywords(
+            config.base_keywords,
+            config.orca_ts_step1_keywords,
+            config.orca_extra_keywords,
+        ),
+        step2_keywords=_merge_keywords(
+            config.base_keywords,
+            config.orca_ts_step2_keywords,
+            config.orca_extra_keywords,
+        ),
+        constraint_atom_pairs=config.orca_ts_constraint_atoms,
+        nprocs=config.nprocs,
+        maxcore=config.maxcore,
+        calc_hess=config.orca_ts_calc_hess,
+        smd=config.orca_smd,
+        smd_solvent=config.orca_smd_solvent,
+    )
+
+
+@lru_cache(maxsize=64)
+def compile_renderer(config: QCInputConfig) -> CompiledRenderer:
+    return CompiledRenderer(config)
+
+
+def render_structure(
+    structure: StructureData,
+    config: QCInputConfig,
+    *,
+    source_structure_name: str,
+    output_stem: str,
+) -> str:
+    return compile_renderer(config).render(
+        structure,
+        source_structure_name=source_structure_name,
+        output_stem=output_stem,
+    )
+
+
+def write_structure(
+    stream: IO,
+    structure: StructureData,
+    config: QCInputConfig,
+    *,
+    source_structure_name: str,
+    output_stem: str,
+) -> None:
+    compile_renderer(config).write(
+        stream,
+        structure,
+        source_structure_name=source_structure_name,
+        output_stem=output_stem,
+    )
+
+
+def frame_output_path(output: Path, index: int) -> Path:
+    return output.with_name(f"{output.stem}_{index:04d}{output.suffix}")
+
+
+def _frame_structure_name(structure_path: Path, index: int) -> str:
+    return f"{structure_path.stem}_{index:04d}{structure_path.suffix}"
+
+
+def iter_structure_items(
+    structure_path: Path,
+    output: Path,
+    *,
+    frames: slice | None = None,
+) -> Iterator[tuple[str, Path, StructureData]]:
+    # Yields (source_structure_name, output_path, structure) per structure.
+    if frames is not None:
+        yield from _iter_selected_frames(structure_path, output, frames)
+        return
+    structures = iter_structures(structure_path)
+    first = next(structures)
+    second = next(structures, None)
+    if second is None:
+        yield structure_path.name, output, first
+        return
+    # Multi-frame XYZ: one numbered input per frame, read as it is rendered.
+    for index, structure in enumerate(chain((first, second), structures), start=1):
+        yield (
+            _frame_structure_name(structure_path, index),
+            frame_output_path(output, index),
+            structure,
+        )
+
+
+def _iter_selected_frames(
+    structure_path: Path,
+    output: Path,
+    frames: slice,
+) -> Iterator[tuple[str, Path, StructureData]]:
+    if structure_path.suffix.lower() != ".xyz":
+        raise ValueError(
+            f"Frame selection requires an .xyz structure file: {structure_path}"
+        )
+    # Frame numbers in output names stay absolute (1-based) so that shards of
+    # one trajectory never collide.
+    with XYZFrameIndex.open(structure_path) as index:
+        for frame, geometry in index.iter_frames(frames):
+            structure = StructureData(
+                geometry=geometry,
+                charge=None,
+                multiplicity=None,
+                source_format="xyz",
+            )
+            yield (
+                _frame_structure_name(structure_path, frame + 1),
+                frame_output_path(output, frame + 1),
+                structure,
+            )
+
+
+def tagged_output_path(output: Path, config: QCInputConfig) -> Path:
+    return output.with_name(
+        f"{output.stem}_{config.kind}{default_output_suffix(config.engine)}"
+    )
+
+
+def _iter_output_items(
+    structure_path: Path,
+    output: Path,
+    config: QCInputConfig | Sequence[QCInputConfig],
+    *,
+    frames: slice | None,
+    skip: Container[Path],
+) -> Iterator[tuple[Path, StructureData, QCInputConfig, str]]:
+    # (target, structure, config, source structure name) per output.
+    timer = active_timer()
+    items = iter_structure_items(structure_path, output, frames=frames)
+    if timer is not None:
+        items = timer.iterate("load_structure", items, structure=str(structure_path))
+    return expand_output_items(items, config, skip=skip)
+
+
+def expand_output_items(
+    items: Iterable[tuple[str, Path, StructureData]],
+    config: QCInputConfig | Sequence[QCInputConfig],
+    *,
+    skip: Container[Path] = (),
+) -> Iterator[tuple[Path, StructureData, QCInputConfig, str]]:
+    # Pairs iter_structure_items() results with the config(s) to render.
+    tagged = not isinstance(config, QCInputConfig)
+    configs = tuple(config) if tagged else (config,)
+    for source_name, item_output, structure in items:
+        for item_config in configs:
+            target = item_output
+            structure_name = source_name
+            if tagged:
+                target = tagged_output_path(item_output, item_config)
+                name = Path(source_name)
+                structure_name = f"{name.stem}_{item_config.kind}{name.suffix}"
+            if target in skip:
+                continue
+            yield target, structure, item_config, structure_name
+
+
+def iter_rendered_outputs(
+    structure_path: Path,
+    output: Path,
+    config: QCInputConfig | Sequence[QCInputConfig],
+    *,
+    frames: slice | None = None,
+    skip: Container[Path] = (),
+) -> Iterator[tuple[Path, str]]:
+    # A sequence of configs renders every (engine, kind) combination from the
+    # same in-memory structure; outputs are tagged <stem>_<kind>.inp|.gjf.
+    # Outputs in `skip` are not rendered (resuming an interrupted run).
+    timer = active_timer()
+    for target, structure, item_config, structure_name in _iter_output_items(
+        structure_path, output, config, frames=frames, skip=skip
+    ):
+        render = partial(
+            render_structure,
+            structure,
+            item_config,
+            source_structure_name=structure_name,
+            output_stem=target.stem,
+        )
+        if timer is None:
+            yield target, render()
+        else:
+            yield target, timer.measure("render", render, output=str(target))
+
+
+class _HashingWriter:
+    __slots__ = ("_raw", "digest")
+
+    def __init__(self, raw: IO[bytes]) -> None:
+        self._raw = raw
+        self.digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        return self._raw.write(data)
+
+
+def _stream_output(
+    target: Path,
+    structure: StructureData,
+    config: QCInputConfig,
+    *,
+    source_structure_name: str,
+) -> str:
+    with open(target, "wb") as raw:
+        stream = _HashingWriter(raw)
+        write_structure(
+            stream,
+            structure,
+            config,
+            source_structure_name=source_structure_name,
+            output_stem=target.stem,
+        )
+    return stream.digest.hexdigest()
+
+
+def write_rendered_outputs(
+    structure_path: Path,
+    output: Path,
+    config: QCInputConfig | Sequence[QCInputConfig],
+    *,
+    frames: slice | None = None,
+    skip: Container[Path] = (),
+) -> Iterator[tuple[Path, str]]:
+    # Like iter_rendered_outputs(), but writes each output and yields its
+    # SHA-256. Geometries of STREAM_MIN_ATOMS or more are formatted and
+    # streamed into the file in chunks instead of being rendered and encoded
+    # as whole strings first; their render time is then part of the "write"
+    # stage.
+    timer = active_timer()
+    for target, structure, item_config, structure_name in _iter_output_items(
+        structure_path, output, config, frames=frames, skip=skip
+    ):
+        if len(structure.geometry) >= STREAM_MIN_ATOMS:
+            write = partial(
+                _stream_output,
+                target,
+                structure,
+                item_config,
+                source_structure_name=structure_name,
+            )
+            digest = (
+                write()
+                if timer is None
+                else timer.measure("write", write, output=str(target))
+            )
+            yield target, digest
+            continue
+        render = partial(
+            render_structure,
+            structure,
+            item_config,
+            source_structure_name=structure_name,
+            output_stem=target.stem,
+        )
+        if timer is None:
+            data = render().encode("utf-8")
+            target.write_bytes(data)
+        else:
+            data = timer.measure("render", render, output=str(target)).encode("utf-8")
+            timer.measure("write", target.write_bytes, data, output=str(target))
+        yield target, hashlib.sha256(data).hexdigest()
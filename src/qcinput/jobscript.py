@@ -0,0 +1,302 @@
+import math
+import os
+import re
+import shlex
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from qcinput import __generator_banner__
+from qcinput.config import QCInputConfig
+
+SCHEDULERS = ("slurm", "pbs")
+INPUT_ENGINES = {".inp": "orca", ".gjf": "gaussian"}
+DEFAULT_COMMANDS = {"orca": '"$(command -v orca)"', "gaussian": "g16"}
+_OUTPUT_SUFFIXES = {"orca": ".out", "gaussian": ".log"}
+_ARRAY_INDEX = {"slurm": "SLURM_ARRAY_TASK_ID", "pbs": "PBS_ARRAY_INDEX"}
+# ORCA's mpirun (Open MPI 4) pins ranks to the first cores of the node by
+# default; concurrent jobs in one bundle would all share those cores.
+_UNBOUND = {"orca": "OMPI_MCA_hwloc_base_binding_policy=none"}
+# Memory a job is given on top of %maxcore/%Mem: both programs use more than
+# that (ORCA's manual suggests %maxcore at 75% of the memory per core).
+DEFAULT_MEM_OVERHEAD = 1.25
+# "8GB", "256G", "4000MB", "1GW" (8-byte words, Gaussian); binary units.
+_MEMORY = re.compile(r"^(\d+(?:\.\d+)?)([kmgt]?)([bw]?)$", re.IGNORECASE)
+_MEMORY_POWERS = {"": 0, "k": 1, "m": 2, "g": 3, "t": 4}
+
+
+@dataclass(frozen=True)
+class Job:
+    input: Path
+    engine: str
+    cores: int
+    mem_mb: int
+
+
+def parse_memory_mb(value: str, *, default_unit: str = "MB") -> int:
+    # Megabytes (rounded up). A bare number is in default_unit: MB for node
+    # shapes (as in `sbatch --mem`), words ("W") for Gaussian %Mem.
+    text = value.strip().replace(" ", "")
+    if text.isdigit():
+        text += default_unit
+    match = _MEMORY.match(text)
+    if match is None:
+        raise ValueError(f"Invalid memory size {value!r}; expected e.g. 4000MB or 8GB.")
+    number, prefix, unit = match.groups()
+    size = float(number) * 1024 ** _MEMORY_POWERS[prefix.lower()]
+    if unit.lower() == "w":
+        size *= 8
+    return math.ceil(size / 1024**2)
+
+
+def job_resources(
+    config: QCInputConfig, *, mem_overhead: float = DEFAULT_MEM_OVERHEAD
+) -> tuple[int, int]:
+    # (cores, memory in MB) one input of this config's engine uses. ORCA's
+    # %maxcore is per process, Gaussian's %Mem is for the whole job; both
+    # are scaled by mem_overhead.
+    if mem_overhead < 1:
+        raise ValueError(f"Memory overhead must be at least 1, got {mem_overhead}.")
+    if config.engine == "orca":
+        if config.nprocs is None or config.maxcore is None:
+            raise ValueError("ORCA config is incomplete.")
+        cores, mem_mb = config.nprocs, config.nprocs * config.maxcore
+    else:
+        if config.nprocshared is None or config.mem is None:
+            raise ValueError("Gaussian config is incomplete.")
+        cores = config.nprocshared
+        mem_mb = parse_memory_mb(config.mem, default_unit="W")
+    return cores, math.ceil(round(mem_mb * mem_overhead, 6))
+
+
+def input_engine(path: Path) -> str:
+    engine = INPUT_ENGINES.get(path.suffix.lower())
+    if engine is None:
+        raise ValueError(f"Not an ORCA or Gaussian input (.inp, .gjf): {path}")
+    return engine
+
+
+def plan_jobs(
+    inputs: Iterable[Path], resources: Mapping[str, tuple[int, int]]
+) -> list[Job]:
+    jobs = []
+    for path in inputs:
+        engine = input_engine(path)
+        if engine not in resources:
+            raise ValueError(f"No {engine} resources configured for {path}.")
+        cores, mem_mb = resources[engine]
+        jobs.append(Job(input=path, engine=engine, cores=cores, mem_mb=mem_mb))
+    return jobs
+
+
+def check_fits(jobs: Iterable[Job], *, cores: int, mem_mb: int) -> None:
+    for job in jobs:
+        if job.cores > cores or job.mem_mb > mem_mb:
+            raise ValueError(
+                f"{job.input} needs {job.cores} cores and {job.mem_mb} MB; "
+                f"a node has {cores} cores and {mem_mb} MB."
+            )
+
+
+def pack_nodes(jobs: Sequence[Job], *, cores: int, mem_mb: int) -> list[list[Job]]:
+    # First-fit decreasing on (cores, memory). Nodes that cannot take even
+    # the smallest job are closed, so uniform jobs pack in linear time. Each
+    # bundle keeps the input order of its jobs.
+    check_fits(jobs, cores=cores, mem_mb=mem_mb)
+    if not jobs:
+        return []
+    min_cores = min(job.cores for job in jobs)
+    min_mem = min(job.mem_mb for job in jobs)
+    order = sorted(range(len(jobs)), key=lambda i: (-jobs[i].cores, -jobs[i].mem_mb))
+    bundles: list[list[int]] = []
+    # [bundle index, free cores, free memory] of nodes that still have room.
+    open_nodes: list[list[int]] = []
+    for i in order:
+        job = jobs[i]
+        for node in open_nodes:
+            if job.cores <= node[1] and job.mem_mb <= node[2]:
+                break
+        else:
+            bundles.append([])
+            node = [len(bundles) - 1, cores, mem_mb]
+            open_nodes.append(node)
+        bundles[node[0]].append(i)
+        node[1] -= job.cores
+        node[2] -= job.mem_mb
+        if node[1] < min_cores or node[2] < min_mem:
+            open_nodes.remove(node)
+    return [[jobs[i] for i in sorted(bundle)] for bundle in bundles]
+
+
+def group_by_shape(jobs: Iterable[Job]) -> list[list[Job]]:
+    # One job array per (cores, memory) shape, in order of first appearance.
+    groups: dict[tuple[int, int], list[Job]] = {}
+    for job in jobs:
+        groups.setdefault((job.cores, job.mem_mb), []).append(job)
+    return list(groups.values())
+
+
+def job_command(job: Job, *, commands: Mapping[str, str] | None = None) -> str:
+    # Runs the program on the input (by name, from its directory) and writes
+    # <stem>.out (ORCA) or <stem>.log (Gaussian) next to it. Commands are
+    # inserted as shell text, so `"$(command -v orca)"` expands on the node.
+    program = {**DEFAULT_COMMANDS, **(commands or {})}[job.engine]
+    name = shlex.quote(job.input.name)
+    output = shlex.quote(job.input.with_suffix(_OUTPUT_SUFFIXES[job.engine]).name)
+    if job.engine == "orca":
+        return f"{program} {name} > {output}"
+    return f"{program} < {name} > {output}"
+
+
+def _job_directory(job: Job, workdir: Path) -> str | None:
+    directory = os.path.relpath(job.input.parent.absolute(), workdir.absolute())
+    return None if directory == "." else shlex.quote(directory)
+
+
+def _directives(
+    scheduler: str,
+    *,
+    name: str,
+    cores: int,
+    mem_mb: int,
+    time: str | None,
+    partition: str | None,
+    array: int | None = None,
+) -> list[str]:
+    # One slot per core: ORCA starts nprocs MPI ranks, which mpirun only
+    # places on allocated task slots; Gaussian threads use them as well.
+    if scheduler == "slurm":
+        lines = [
+            f"#SBATCH --job-name={name}",
+            "#SBATCH --nodes=1",
+            f"#SBATCH --ntasks={cores}",
+            f"#SBATCH --mem={mem_mb}M",
+        ]
+        if time is not None:
+            lines.append(f"#SBATCH --time={time}")
+        if partition is not None:
+            lines.append(f"#SBATCH --partition={partition}")
+        if array is not None:
+            lines.append(f"#SBATCH --array=1-{array}")
+        return lines
+    if scheduler != "pbs":
+        raise ValueError(f"Unknown scheduler: {scheduler}")
+    lines = [
+        f"#PBS -N {name}",
+        f"#PBS -l select=1:ncpus={cores}:mpiprocs={cores}:mem={mem_mb}mb",
+    ]
+    if time is not None:
+        lines.append(f"#PBS -l walltime={time}")
+    if partition is not None:
+        lines.append(f"#PBS -q {partition}")
+    # PBS Pro rejects single-subjob arrays; the index then defaults to 1.
+    if array is not None and array > 1:
+        lines.append(f"#PBS -J 1-{array}")
+    return lines
+
+
+def render_bundle_script(
+    jobs: Sequence[Job],
+    *,
+    scheduler: str,
+    name: str,
+    workdir: Path,
+    time: str | None = None,
+    partition: str | None = None,
+    commands: Mapping[str, str] | None = None,
+    node: tuple[int, int] | None = None,
+) -> str:
+    # One node running all jobs concurrently; fails if any of them fails.
+    # MPI ranks are left unbound so the jobs spread over all allocated cores.
+    cores = sum(job.cores for job in jobs)
+    mem_mb = sum(job.mem_mb for job in jobs)
+    usage = f"{cores} cores, {mem_mb} MB"
+    if node is not None:
+        usage = f"{cores} of {node[0]} cores, {mem_mb} of {node[1]} MB"
+    lines = [
+        "#!/bin/bash",
+        *_directives(
+            scheduler,
+            name=name,
+            cores=cores,
+            mem_mb=mem_mb,
+            time=time,
+            partition=partition,
+        ),
+        f"# {__generator_banner__}",
+        f"# {len(jobs)} jobs: {usage}",
+        f"cd {shlex.quote(os.fspath(workdir.absolute()))} || exit 1",
+        "pids=()",
+    ]
+    for job in jobs:
+        command = job_command(job, commands=commands)
+        directory = _job_directory(job, workdir)
+        if directory is not None:
+            command = f"exec {command}"
+        if job.engine in _UNBOUND:
+            command = f"{_UNBOUND[job.engine]} {command}"
+        if directory is not None:
+            command = f"(cd {directory} && {command})"
+        lines.extend([f"{command} &", "pids+=($!)"])
+    lines.extend(
+        [
+            "status=0",
+            'for pid in "${pids[@]}"; do',
+            '  wait "$pid" || status=1',
+            "done",
+            'exit "$status"',
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def render_array_script(
+    jobs: Sequence[Job],
+    *,
+    scheduler: str,
+    name: str,
+    workdir: Path,
+    time: str | None = None,
+    partition: str | None = None,
+    commands: Mapping[str, str] | None = None,
+) -> str:
+    # One array task per job; all jobs must have the same shape.
+    shapes = {(job.cores, job.mem_mb) for job in jobs}
+    if len(shapes) != 1:
+        raise ValueError("A job array needs jobs of one shape (cores, memory).")
+    ((cores, mem_mb),) = shapes
+    index = _ARRAY_INDEX.get(scheduler, "")
+    lines = [
+        "#!/bin/bash",
+        *_directives(
+            scheduler,
+            name=name,
+            cores=cores,
+            mem_mb=mem_mb,
+            time=time,
+            partition=partition,
+            array=len(jobs),
+        ),
+        f"# {__generator_banner__}",
+        f"cd {shlex.quote(os.fspath(workdir.absolute()))} || exit 1",
+        f'case "${{{index}:-1}}" in',
+    ]
+    for task, job in enumerate(jobs, start=1):
+        command = f"exec {job_command(job, commands=commands)}"
+        directory = _job_directory(job, workdir)
+        if directory is not None:
+            command = f"cd {directory} && {command}"
+        lines.append(f"  {task}) {command} ;;")
+    lines.extend(
+        [
+            f'  *) echo "no job for array index ${index}" >&2; exit 1 ;;',
+            "esac",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def script_path(directory: Path, name: str, index: int) -> Path:
+    return directory / f"{name}-{index:04d}.sh"
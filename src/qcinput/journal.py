@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from qcinput.manifest import ManifestEntry
+
+try:
+    import fcntl
+except ImportError:  # Windows: runs are not locked against each other.
+    fcntl = None
+
+if TYPE_CHECKING:
+    from qcinput.batch import BatchTask
+
+JOURNAL_NAME = ".qcinput-journal.jsonl"
+
+
+def default_journal_path(directory: Path, key: str) -> Path:
+    # `key` is the output name for `generate` and batch_journal_key() for
+    # `batch`, so concurrent runs in one directory do not share a journal.
+    return directory / f".{key}{JOURNAL_NAME}"
+
+
+def batch_journal_key(tasks: Iterable["BatchTask"]) -> str:
+    # Digest of where a batch writes (and which frames), so a rerun of the
+    # same command finds its journal and other batches started from the
+    # same directory do not.
+    lines = sorted(f"{os.path.abspath(task.output)}\t{task.frames}" for task in tasks)
+    digest = hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+    return f"batch-{digest[:16]}"
+
+
+class Journal:
+    # Append-only JSON-lines log of written outputs and finished jobs, so an
+    # interrupted run can be resumed. Records are buffered and written with
+    # one fsync per `flush_every` records or `flush_interval` seconds; the
+    # file is only created on the first flush and removed once the run
+    # completes, so short runs never touch the disk for it. The open file is
+    # locked (flock), so a run never truncates a journal another live run
+    # is writing.
+    def __init__(
+        self,
+        path: Path,
+        *,
+        append: bool = False,
+        flush_every: int = 256,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._handle = None
+        self._last_flush = time.monotonic()
+        if path.exists():
+            self._handle = self._open()
+            if not append:
+                self._handle.truncate(0)
+
+    def output_done(self, task_output: Path, output: Path, sha256: str) -> None:
+        self._add(
+            {
+                "task": os.fspath(task_output),
+                "output": os.fspath(output),
+                "sha256": sha256,
+            }
+        )
+
+    def task_done(self, task_output: Path, entry: ManifestEntry) -> None:
+        self._add({"task": os.fspath(task_output), "entry": asdict(entry)})
+
+    def _add(self, record: dict) -> None:
+        self._buffer.append(json.dumps(record, separators=(",", ":")) + "\n")
+        if (
+            len(self._buffer) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            if self._handle is None:
+                self._handle = self._open()
+            self._handle.write("".join(self._buffer).encode("utf-8"))
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def _open(self):
+        handle = self.path.open("a+b")
+        if fcntl is not None:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError as exc:
+                handle.close()
+                raise OSError(
+                    f"Journal is in use by another qcinput run: {self.path}"
+                ) from exc
+        # Start on a fresh line if the previous run died mid-record.
+        if handle.seek(0, os.SEEK_END):
+            handle.seek(-1, os.SEEK_END)
+            if handle.read(1) != b"\n":
+                handle.write(b"\n")
+        return handle
+
+    def close(self, *, complete: bool) -> None:
+        if complete:
+            self._buffer.clear()
+            # Removed while still locked.
+            self.path.unlink(missing_ok=True)
+        else:
+            self.flush()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def replay_journal(
+    path: Path,
+) -> tuple[dict[str, ManifestEntry], dict[str, dict[Path, str]]]:
+    # Returns (finished jobs -> manifest entry, unfinished jobs -> digests of
+    # the outputs they already wrote), keyed by the job's base output path.
+    # A torn last line from a crash is ignored.
+    finished: dict[str, ManifestEntry] = {}
+    written: dict[str, dict[Path, str]] = {}
+    try:
+        handle = path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return finished, written
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+                task = record["task"]
+                if "entry" in record:
+                    finished[task] = ManifestEntry(**record["entry"])
+                else:
+                    written.setdefault(task, {})[Path(record["output"])] = record[
+                        "sha256"
+                    ]
+            except (KeyError, TypeError, ValueError):
+                continue
+    for task in finished:
+        written.pop(task, None)
+    return finished, written
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+
+from qcinput import __version__
+from qcinput.config import QCInputConfig, config_digest
+
+MANIFEST_NAME = ".qcinput-manifest.json"
+_MANIFEST_FORMAT = 1
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    # Inputs of one structure -> output(s) job. `outputs` maps output file
+    # names (in the manifest's directory) to their content hashes.
+    structure: str
+    structure_sha256: str
+    config_sha256: str
+    frames: str | None
+    version: str = __version__
+    outputs: dict[str, str] = field(default_factory=dict, compare=False)
+
+
+def manifest_entry(
+    structure: Path,
+    config: QCInputConfig | Iterable[QCInputConfig],
+    *,
+    frames: slice | None = None,
+) -> ManifestEntry:
+    configs = (config,) if isinstance(config, QCInputConfig) else tuple(config)
+    return ManifestEntry(
+        structure=os.fspath(structure),
+        structure_sha256=file_digest(structure),
+        config_sha256=hashlib.sha256(
+            ",".join(config_digest(item) for item in configs).encode("ascii")
+        ).hexdigest(),
+        frames=(
+            None if frames is None else f"{frames.start}:{frames.stop}:{frames.step}"
+        ),
+    )
+
+
+class Manifest:
+    # One JSON file per output directory, keyed by the job's base output
+    # name. Unreadable or foreign manifests are treated as empty, which only
+    # costs a rebuild.
+    def __init__(self, directory: Path) -> None:
+        self.path = directory / MANIFEST_NAME
+        self.entries: dict[str, ManifestEntry] = {}
+        self._dirty = False
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(payload, dict) or payload.get("format") != _MANIFEST_FORMAT:
+            return
+        for key, data in payload.get("entries", {}).items():
+            try:
+                self.entries[key] = ManifestEntry(**data)
+            except TypeError:
+                continue
+
+    def current_outputs(self, output: Path, entry: ManifestEntry) -> tuple[str, ...]:
+        # Names of the recorded outputs if `entry` matches and every output
+        # is still on disk unmodified; empty if the job must be rebuilt.
+        stored = self.entries.get(output.name)
+        if stored is None or stored != entry or not stored.outputs:
+            return ()
+        directory = self.path.parent
+        for name, digest in stored.outputs.items():
+            try:
+                if file_digest(directory / name) != digest:
+                    return ()
+            except OSError:
+                return ()
+        return tuple(stored.outputs)
+
+    def record(
+        self, output: Path, entry: ManifestEntry, digests: Mapping[Path, str]
+    ) -> ManifestEntry:
+        # `digests` maps each written output to the SHA-256 of its content.
+        recorded = replace(
+            entry, outputs={path.name: digest for path, digest in digests.items()}
+        )
+        self.entries[output.name] = recorded
+        self._dirty = True
+        return recorded
+
+    def discard(self, output: Path) -> None:
+        if self.entries.pop(output.name, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "format": _MANIFEST_FORMAT,
+            "entries": {
+                key: asdict(entry) for key, entry in sorted(self.entries.items())
+            },
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+class ManifestSet:
+    # Manifests for every output directory touched by one run.
+    def __init__(self) -> None:
+        self._manifests: dict[Path, Manifest] = {}
+
+    def for_output(self, output: Path) -> Manifest:
+        directory = output.parent
+        manifest = self._manifests.get(directory)
+        if manifest is None:
+            manifest = self._manifests[directory] = Manifest(directory)
+        return manifest
+
+    def save(self) -> None:
+        for manifest in self._manifests.values():
+            manifest.save()
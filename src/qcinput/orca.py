@@ -1,5 +1,9 @@
+import io
+from typing import IO
+
 from qcinput import __generator_banner__
 from qcinput.config import QCInputConfig
+from qcinput.template import InputTemplate, slot
 
 
 def _with_nopop(keywords: tuple[str, ...]) -> str:
@@ -13,6 +17,21 @@ def render_orca_input(
     xyz_text: str,
     config: QCInputConfig,
 ) -> str:
+    buffer = io.StringIO()
+    write_orca_input(buffer, xyz_text=xyz_text, config=config)
+    return buffer.getvalue()
+
+
+def write_orca_input(
+    stream: IO,
+    *,
+    xyz_text: str,
+    config: QCInputConfig,
+) -> None:
+    orca_input_template(config).write(stream, xyz=xyz_text)
+
+
+def orca_input_template(config: QCInputConfig) -> InputTemplate:
     if config.nprocs is None or config.maxcore is None:
         raise ValueError("ORCA config is incomplete.")
     keywords = _with_nopop(
@@ -38,12 +57,12 @@ def render_orca_input(
     lines.extend(
         [
             f"* xyz {config.charge} {config.multiplicity}",
-            xyz_text,
+            slot("xyz"),
             "*",
             "",
         ]
     )
-    return "\n".join(lines)
+    return InputTemplate("\n".join(lines))
 
 
 def render_orca_two_step_ts_input(
@@ -61,6 +80,69 @@ def render_orca_two_step_ts_input(
     smd: bool,
     smd_solvent: str,
 ) -> str:
+    buffer = io.StringIO()
+    write_orca_two_step_ts_input(
+        buffer,
+        xyz_text=xyz_text,
+        step2_xyzfile_name=step2_xyzfile_name,
+        charge=charge,
+        multiplicity=multiplicity,
+        step1_keywords=step1_keywords,
+        step2_keywords=step2_keywords,
+        constraint_atom_pairs=constraint_atom_pairs,
+        nprocs=nprocs,
+        maxcore=maxcore,
+        calc_hess=calc_hess,
+        smd=smd,
+        smd_solvent=smd_solvent,
+    )
+    return buffer.getvalue()
+
+
+def write_orca_two_step_ts_input(
+    stream: IO,
+    *,
+    xyz_text: str,
+    step2_xyzfile_name: str,
+    charge: int,
+    multiplicity: int,
+    step1_keywords: tuple[str, ...],
+    step2_keywords: tuple[str, ...],
+    constraint_atom_pairs: tuple[tuple[int, int], ...],
+    nprocs: int,
+    maxcore: int,
+    calc_hess: bool,
+    smd: bool,
+    smd_solvent: str,
+) -> None:
+    template = orca_two_step_ts_template(
+        charge=charge,
+        multiplicity=multiplicity,
+        step1_keywords=step1_keywords,
+        step2_keywords=step2_keywords,
+        constraint_atom_pairs=constraint_atom_pairs,
+        nprocs=nprocs,
+        maxcore=maxcore,
+        calc_hess=calc_hess,
+        smd=smd,
+        smd_solvent=smd_solvent,
+    )
+    template.write(stream, xyz=xyz_text, step2_xyzfile=step2_xyzfile_name)
+
+
+def orca_two_step_ts_template(
+    *,
+    charge: int,
+    multiplicity: int,
+    step1_keywords: tuple[str, ...],
+    step2_keywords: tuple[str, ...],
+    constraint_atom_pairs: tuple[tuple[int, int], ...],
+    nprocs: int,
+    maxcore: int,
+    calc_hess: bool,
+    smd: bool,
+    smd_solvent: str,
+) -> InputTemplate:
     step1_kw = _with_nopop(step1_keywords)
     step2_kw = _with_nopop(step2_keywords)
     calc_hess_value = "true" if calc_hess else "false"
@@ -96,7 +178,7 @@ def render_orca_two_step_ts_input(
             "      end",
             "    end",
             f"    * xyz {charge} {multiplicity}",
-            xyz_text,
+            slot("xyz"),
             "    *",
             "  Step_End",
             "",
@@ -118,10 +200,58 @@ def render_orca_two_step_ts_input(
             "    %geom",
             f"      calc_hess {calc_hess_value}",
             "    end",
-            f"    * xyzfile {charge} {multiplicity} {step2_xyzfile_name} *",
+            f"    * xyzfile {charge} {multiplicity} {slot('step2_xyzfile')} *",
             "  Step_End",
             "end",
             "",
         ]
     )
+    return InputTemplate("\n".join(lines))
+
+
+def orca_pack_header(config: QCInputConfig) -> str:
+    if config.nprocs is None or config.maxcore is None:
+        raise ValueError("ORCA config is incomplete.")
+    lines = [
+        f"# {__generator_banner__}",
+        "%pal",
+        f"  nprocs {config.nprocs}",
+        "end",
+        f"%maxcore {config.maxcore}",
+        "%compound",
+        "",
+    ]
     return "\n".join(lines)
+
+
+def orca_pack_step_template(config: QCInputConfig) -> InputTemplate:
+    # One New_Step of a packed %compound input. Charge and multiplicity are
+    # slots so every structure keeps its own; the label comment names the
+    # source structure for qcinput.pack.split_pack_output().
+    keywords = _with_nopop(
+        (*config.task_keywords, *config.base_keywords, *config.orca_extra_keywords)
+    )
+    lines = [
+        "  New_Step",
+        f"    # {slot('label')}",
+        f"    ! {keywords}",
+    ]
+    if config.orca_smd:
+        lines.extend(
+            [
+                "    %cpcm",
+                "      SMD true",
+                f'      SMDsolvent "{config.orca_smd_solvent}"',
+                "    end",
+            ]
+        )
+    lines.extend(
+        [
+            f"    * xyz {slot('charge')} {slot('multiplicity')}",
+            slot("xyz"),
+            "    *",
+            "  Step_End",
+            "",
+        ]
+    )
+    return InputTemplate("\n".join(lines))
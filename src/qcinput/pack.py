@@ -0,0 +1,179 @@
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+from qcinput.config import QCInputConfig
+from qcinput.gaussian import chk_name, gaussian_pack_job_template
+from qcinput.generate import (
+    default_output_suffix,
+    iter_structure_items,
+    resolve_structure_config,
+)
+from qcinput.orca import orca_pack_header, orca_pack_step_template
+from qcinput.structure import StructureData
+from qcinput.template import InputTemplate
+
+# Where each packed job starts in the program output. ORCA: a compound step
+# banner line ("COMPOUND JOB 3", "* Step 3 *", ...), group 1 is the step.
+# Gaussian: every --Link1-- job starts by entering link 1.
+STEP_MARKERS = {
+    "orca": (
+        r"^[ \t*=#-]*"
+        r"(?:compound[ \t]+job[ \t]*(?:step[ \t]*)?|(?:compound[ \t]+)?step[ \t]*)"
+        r"[:#]?[ \t]*(\d+)[ \t*=#-]*$"
+    ),
+    "gaussian": r"^ Entering Link 1 = ",
+}
+_OUTPUT_SUFFIXES = {"orca": ".out", "gaussian": ".log"}
+# ORCA writes the label as a "# ..." comment, Gaussian as a title line.
+_STEP_LABEL = re.compile(r"^\s*(?:# )?qcinput-step (\d+): (.+?)\s*$")
+
+
+def pack_output_path(output_dir: Path, index: int, engine: str) -> Path:
+    return output_dir / f"pack_{index:04d}{default_output_suffix(engine)}"
+
+
+def iter_pack_items(
+    structures: Iterable[Path], *, frames: slice | None = None
+) -> Iterator[tuple[str, StructureData]]:
+    # Every structure of every file, frames of multi-frame XYZ included.
+    # Job names (%chk files, split-pack outputs) come from the stems, so
+    # two structures may not share one.
+    seen: dict[str, str] = {}
+    for path in structures:
+        try:
+            for name, _, structure in iter_structure_items(path, path, frames=frames):
+                stem = Path(name).stem
+                if stem in seen:
+                    raise ValueError(
+                        f"{name} has the same job name ({stem}) as {seen[stem]}; "
+                        "rename one of them."
+                    )
+                seen[stem] = str(path)
+                yield name, structure
+        except (OSError, ValueError) as exc:
+            raise ValueError(f"{path}: {exc}") from exc
+
+
+def check_pack_config(config: QCInputConfig) -> None:
+    if config.kind == "ts":
+        raise ValueError(
+            "Packing supports single-step kinds (int, sp); "
+            "ts inputs are already multi-step jobs."
+        )
+
+
+@lru_cache(maxsize=16)
+def _pack_parts(config: QCInputConfig) -> tuple[str, InputTemplate, str, str]:
+    # (header, per-structure template, separator, footer)
+    if config.engine == "orca":
+        return orca_pack_header(config), orca_pack_step_template(config), "\n", "end\n"
+    return "", gaussian_pack_job_template(config), "--Link1--\n", "\n"
+
+
+def render_pack(
+    items: Sequence[tuple[str, StructureData]], config: QCInputConfig
+) -> str:
+    # ORCA: one %compound input with a New_Step per structure under a shared
+    # %pal/%maxcore header. Gaussian: one --Link1-- job per structure, each
+    # with its own %chk and title. A GJF's charge and multiplicity must match
+    # the config's, as in generate and batch.
+    check_pack_config(config)
+    header, template, separator, footer = _pack_parts(config)
+    jobs = []
+    for index, (name, structure) in enumerate(items, start=1):
+        try:
+            item_config = resolve_structure_config(config, structure)
+        except ValueError as exc:
+            raise ValueError(f"{name}: {exc}") from exc
+        jobs.append(
+            template.render(
+                label=f"qcinput-step {index}: {name}",
+                chk=chk_name(name),
+                charge=str(item_config.charge),
+                multiplicity=str(item_config.multiplicity),
+                xyz=structure.xyz_text,
+            )
+        )
+    return "".join((header, separator.join(jobs), footer))
+
+
+def iter_packs(
+    structures: Iterable[Path],
+    config: QCInputConfig,
+    *,
+    size: int,
+    output_dir: Path,
+    frames: slice | None = None,
+) -> Iterator[tuple[Path, str]]:
+    # (pack path, input text) for consecutive groups of `size` structures.
+    check_pack_config(config)
+    items = iter_pack_items(structures, frames=frames)
+    index = 0
+    while chunk := list(islice(items, size)):
+        index += 1
+        yield (
+            pack_output_path(output_dir, index, config.engine),
+            render_pack(chunk, config),
+        )
+
+
+def pack_engine(input_path: Path) -> str:
+    return "orca" if input_path.suffix.lower() == ".inp" else "gaussian"
+
+
+def read_pack_names(input_text: str) -> list[str]:
+    names = []
+    for line in input_text.splitlines():
+        match = _STEP_LABEL.match(line)
+        if match is not None:
+            names.append(match.group(2))
+    if not names:
+        raise ValueError("Not a packed qcinput input: no step labels found.")
+    return names
+
+
+def split_steps(text: str, steps: int, *, marker: str) -> list[str]:
+    # With a numbered marker, cuts at the first banner of each step in
+    # order, so repeated banners do not start new sections; otherwise at
+    # every match. Anything before the first step is dropped.
+    pattern = re.compile(marker, re.IGNORECASE | re.MULTILINE)
+    starts: list[int] = []
+    for match in pattern.finditer(text):
+        step = int(match.group(1)) if pattern.groups else len(starts) + 1
+        if step == len(starts) + 1:
+            starts.append(match.start())
+    if len(starts) != steps:
+        raise ValueError(
+            f"Found {len(starts)} of {steps} job markers in the output; "
+            "the run may have stopped early (or pass --marker)."
+        )
+    ends = [*starts[1:], len(text)]
+    return [text[start:end] for start, end in zip(starts, ends)]
+
+
+def split_pack_output(
+    output_text: str,
+    input_text: str,
+    *,
+    engine: str,
+    marker: str | None = None,
+) -> list[tuple[str, str]]:
+    # (per-structure output name, text); names are <structure stem>.out for
+    # ORCA and .log for Gaussian.
+    names = read_pack_names(input_text)
+    sections = split_steps(
+        output_text, len(names), marker=marker or STEP_MARKERS[engine]
+    )
+    suffix = _OUTPUT_SUFFIXES[engine]
+    results: list[tuple[str, str]] = []
+    seen: set[str] = set()
+    for name, section in zip(names, sections):
+        out_name = f"{Path(name).stem}{suffix}"
+        if out_name in seen:
+            raise ValueError(f"Two packed structures map to {out_name}.")
+        seen.add(out_name)
+        results.append((out_name, section))
+    return results
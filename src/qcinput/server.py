@@ -0,0 +1,226 @@
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+
+SOCKET_ENV = "QCINPUT_SOCKET"
+_ENV_PREFIX = "QCINPUT_"
+
+# One request per connection: the client sends a JSON object and shuts down
+# its write side, the server answers with a JSON object and closes.
+#   request:  {"argv": [...], "cwd": "/abs/dir", "env": {"QCINPUT_CONFIG": ...}}
+#   response: {"exit_code": 0, "stdout": "...", "stderr": "..."}
+
+
+def default_socket_path() -> Path:
+    # No fallback to the shared temp directory: anyone there could claim the
+    # predictable path before the server does.
+    env_path = os.environ.get(SOCKET_ENV)
+    if env_path:
+        return Path(env_path).expanduser()
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        raise ValueError(
+            f"XDG_RUNTIME_DIR is not set; pass a socket path or set {SOCKET_ENV}."
+        )
+    return Path(runtime_dir) / "qcinput" / "qcinput.sock"
+
+
+def _client_env() -> dict[str, str]:
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if key.startswith(_ENV_PREFIX) and key != SOCKET_ENV
+    }
+
+
+def _recv_all(sock: socket.socket) -> bytes:
+    return b"".join(iter(lambda: sock.recv(65536), b""))
+
+
+def send_request(
+    argv: list[str],
+    *,
+    socket_path: Path,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+) -> dict:
+    request = {
+        "argv": list(argv),
+        "cwd": os.getcwd() if cwd is None else cwd,
+        "env": _client_env() if env is None else env,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(os.fspath(socket_path))
+        sock.sendall(json.dumps(request).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        response = json.loads(_recv_all(sock))
+    if not isinstance(response, dict) or not isinstance(response.get("exit_code"), int):
+        raise ValueError("Malformed response from qcinput server.")
+    return response
+
+
+def forward(argv: list[str], *, socket_path: Path) -> int:
+    try:
+        response = send_request(argv, socket_path=socket_path)
+    except (OSError, ValueError) as exc:
+        raise SystemExit(
+            f"error: Cannot reach qcinput server at {socket_path}: {exc}. "
+            "Start one with `qcinput serve`."
+        ) from exc
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response["exit_code"]
+
+
+def _exit_code(exc: SystemExit, stderr: io.StringIO) -> int:
+    # Mirrors the interpreter: None is success, a message means exit code 1.
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=stderr)
+    return 1
+
+
+def run_request(
+    request: object,
+    handle: Callable[[list[str]], int],
+    *,
+    env_keys: tuple[str, ...] | None = None,
+) -> dict:
+    # env_keys: QCINPUT_* variables of the serving process, cleared while a
+    # request runs; scanning os.environ on every request costs more than
+    # rendering a small molecule.
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    if not (
+        isinstance(request, dict)
+        and isinstance(request.get("argv"), list)
+        and all(isinstance(arg, str) for arg in request["argv"])
+        and isinstance(request.get("cwd"), str)
+        and isinstance(request.get("env", {}), dict)
+    ):
+        return {"exit_code": 2, "stdout": "", "stderr": "error: Malformed request.\n"}
+    env = {
+        key: value
+        for key, value in request.get("env", {}).items()
+        if key.startswith(_ENV_PREFIX) and isinstance(value, str)
+    }
+    if env_keys is None:
+        env_keys = tuple(_client_env())
+
+    # Requests run one at a time, so the client's working directory and
+    # QCINPUT_* variables can be swapped into this process for each call.
+    saved_cwd = os.getcwd()
+    saved_env = {key: os.environ.get(key) for key in {*env_keys, *env}}
+    try:
+        for key in saved_env:
+            os.environ.pop(key, None)
+        os.environ.update(env)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                os.chdir(request["cwd"])
+                exit_code = handle(list(request["argv"]))
+            except SystemExit as exc:
+                exit_code = _exit_code(exc, stderr)
+            except OSError as exc:
+                print(f"error: {exc}", file=stderr)
+                exit_code = 1
+            except Exception:
+                # Keep serving; the client gets the traceback.
+                traceback.print_exc(file=stderr)
+                exit_code = 1
+    finally:
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+    return {
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        data = self.rfile.read()
+        if not data:
+            return  # liveness probe, see _remove_stale_socket()
+        try:
+            request = json.loads(data)
+        except ValueError:
+            request = None
+        response = run_request(
+            request, self.server.handle_argv, env_keys=self.server.env_keys
+        )
+        with contextlib.suppress(BrokenPipeError, ConnectionResetError):
+            self.wfile.write(json.dumps(response).encode("utf-8"))
+
+
+class QCInputServer(socketserver.UnixStreamServer):
+    # Single-threaded on purpose: requests change the working directory and
+    # environment, and configs/compiled templates stay warm across requests
+    # through the regular in-process caches (reloaded when mtime changes).
+    def __init__(
+        self, socket_path: Path, handle_argv: Callable[[list[str]], int]
+    ) -> None:
+        # Anyone who can connect runs commands as this user, so the socket
+        # is created owner-only (not chmod-ed after bind) in a directory
+        # only this user can enter.
+        _ensure_private_dir(socket_path.parent)
+        _remove_stale_socket(socket_path)
+        self.socket_path = socket_path
+        self.handle_argv = handle_argv
+        self.env_keys = tuple(_client_env())
+        umask = os.umask(0o077)
+        try:
+            super().__init__(os.fspath(socket_path), _RequestHandler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    with contextlib.suppress(FileExistsError):
+        directory.mkdir(mode=0o700)
+    info = directory.lstat()
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise ValueError(
+            f"Socket directory must be a directory only you can access "
+            f"(owned by you, mode 0700): {directory}"
+        )
+
+
+def _remove_stale_socket(socket_path: Path) -> None:
+    try:
+        mode = socket_path.stat().st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise ValueError(f"Socket path exists and is not a socket: {socket_path}")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(os.fspath(socket_path))
+        except OSError:
+            socket_path.unlink()
+            return
+    raise ValueError(f"A qcinput server is already listening on {socket_path}")
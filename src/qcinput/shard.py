@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from qcinput.structure.xyz_index import XYZFrameIndex
+
+SHARD_STRATEGIES = ("index", "hash")
+_RECORD_FORMAT = 1
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    # "3/16" -> (3, 16); shards are numbered from 1 like job array tasks.
+    index, sep, count = value.partition("/")
+    try:
+        shard, shards = int(index), int(count)
+    except ValueError:
+        shard = shards = 0
+    if not sep or shards < 1 or not 1 <= shard <= shards:
+        raise ValueError(f"Invalid shard {value!r}. Expected I/N with 1 <= I <= N.")
+    return shard, shards
+
+
+def shard_key(structure: Path) -> str:
+    return structure.as_posix()
+
+
+def _hash_bucket(structure: Path, shards: int) -> int:
+    # Hash of the file name only, so a structure stays on the same shard
+    # when it is reached through a different directory prefix.
+    digest = hashlib.sha256(structure.name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def frame_ranges(
+    structures: Iterable[Path], *, frames: slice | None = None
+) -> dict[Path, range]:
+    # Absolute numbers of the frames to generate from each multi-frame XYZ
+    # file (all of them, or the --frames selection). Files that cannot be
+    # indexed are left out and fail when they are generated.
+    ranges: dict[Path, range] = {}
+    for path in structures:
+        if path.suffix.lower() != ".xyz":
+            continue
+        try:
+            with XYZFrameIndex.open(path, write_sidecar=False) as index:
+                count = len(index)
+        except (OSError, ValueError):
+            continue
+        if count > 1:
+            ranges[path] = range(count)[frames or slice(None)]
+    return ranges
+
+
+def select_shard(
+    structures: Iterable[Path],
+    *,
+    shard: int,
+    shards: int,
+    by: str = "index",
+    frames: Mapping[Path, range] | None = None,
+) -> dict[Path, range | None]:
+    # Deterministic for a given input set. Each structure is one unit,
+    # except those in `frames`, whose frames are units of their own.
+    # "index" deals the units, sorted by path and frame, round-robin
+    # (balanced); "hash" starts each file at a bucket of its name and deals
+    # its frames on from there (stable when structures are added or
+    # removed). Maps the selected structures, sorted by path, to the frames
+    # this shard generates from them (None: the whole file).
+    if by not in SHARD_STRATEGIES:
+        raise ValueError(f"Unknown shard strategy: {by}")
+    frames = frames or {}
+    selected: dict[Path, range | None] = {}
+    unit = 0
+    for path in sorted(structures, key=shard_key):
+        start = unit if by == "index" else _hash_bucket(path, shards)
+        numbers = frames.get(path)
+        if numbers is None:
+            unit += 1
+            if start % shards == shard - 1:
+                selected[path] = None
+            continue
+        unit += len(numbers)
+        mine = numbers[(shard - 1 - start) % shards :: shards]
+        if mine:
+            selected[path] = mine
+    return selected
+
+
+def format_frames(numbers: range) -> str:
+    # Stop right after the last frame, so equal ranges read the same in
+    # every record.
+    stop = numbers.start
+    if numbers:
+        stop = numbers[-1] + (1 if numbers.step > 0 else -1)
+    return f"{numbers.start}:{stop}:{numbers.step}"
+
+
+def parse_frames(text: str) -> range:
+    start, stop, step = map(int, text.split(":"))
+    return range(start, stop, step)
+
+
+def inputs_digest(structures: Iterable[Path]) -> str:
+    keys = sorted(shard_key(path) for path in structures)
+    return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()
+
+
+def default_record_path(directory: Path, shard: int, shards: int) -> Path:
+    width = len(str(shards))
+    return directory / f"qcinput-shard-{shard:0{width}d}-of-{shards}.json"
+
+
+@dataclass(frozen=True)
+class ShardRecord:
+    shard: int
+    shards: int
+    by: str
+    inputs: int
+    inputs_sha256: str
+    emitted: tuple[str, ...]
+    failed: tuple[str, ...] = ()
+    # Multi-frame structures dealt frame by frame: every frame to cover and
+    # the frames this shard emitted, as absolute "start:stop:step" ranges.
+    split: dict[str, str] = field(default_factory=dict)
+    emitted_frames: dict[str, str] = field(default_factory=dict)
+
+
+def write_shard_record(path: Path, record: ShardRecord) -> None:
+    payload = {"format": _RECORD_FORMAT, **asdict(record)}
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_shard_record(path: Path) -> ShardRecord:
+    if not path.exists():
+        raise FileNotFoundError(f"Shard record not found: {path}")
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if payload.pop("format") != _RECORD_FORMAT:
+            raise ValueError
+        payload["emitted"] = tuple(payload["emitted"])
+        payload["failed"] = tuple(payload.get("failed", ()))
+        for name in ("split", "emitted_frames"):
+            payload[name] = dict(payload.get(name, {}))
+            for text in payload[name].values():
+                parse_frames(text)
+        return ShardRecord(**payload)
+    except (KeyError, TypeError, ValueError, AttributeError) as exc:
+        raise ValueError(f"Invalid shard record: {path}") from exc
+
+
+def verify_shards(records: Sequence[ShardRecord]) -> list[str]:
+    # Problems that stop the shards from covering the input set exactly
+    # once; empty when the merge is complete.
+    if not records:
+        return ["No shard records given."]
+    first = records[0]
+    problems = [
+        f"shard {record.shard}/{record.shards} was generated from a different "
+        "input set or shard layout"
+        for record in records[1:]
+        if (record.shards, record.by, record.inputs, record.inputs_sha256, record.split)
+        != (first.shards, first.by, first.inputs, first.inputs_sha256, first.split)
+    ]
+    if problems:
+        return problems
+
+    seen = Counter(record.shard for record in records)
+    problems += [
+        f"shard {shard}/{first.shards} recorded {count} times"
+        for shard, count in sorted(seen.items())
+        if count > 1
+    ]
+    missing = [str(shard) for shard in range(1, first.shards + 1) if shard not in seen]
+    if missing:
+        problems.append(f"missing shards: {', '.join(missing)} of {first.shards}")
+
+    emitted = Counter(key for record in records for key in record.emitted)
+    problems += [
+        f"{key} emitted {count} times"
+        for key, count in sorted(emitted.items())
+        if count > 1
+    ]
+    problems += [
+        f"{key} failed in shard {record.shard}/{record.shards}"
+        for record in records
+        for key in record.failed
+    ]
+    for key, text in sorted(first.split.items()):
+        expected = set(parse_frames(text))
+        counts = Counter(
+            frame
+            for record in records
+            if key in record.emitted_frames
+            for frame in parse_frames(record.emitted_frames[key])
+        )
+        repeated = sum(1 for count in counts.values() if count > 1)
+        if repeated:
+            problems.append(f"{key}: {repeated} frames emitted more than once")
+        missing = len(expected - counts.keys())
+        if missing and not any(key in record.failed for record in records):
+            problems.append(f"{key}: {missing} of {len(expected)} frames not emitted")
+    whole = first.inputs - len(first.split)
+    if not problems and len(emitted) != whole:
+        problems.append(f"{len(emitted)} of {whole} structures emitted across shards")
+    return problems
@@ -1,31 +1,46 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from qcinput.structure.gjf import load_gjf_data
-from qcinput.structure.xyz import load_xyz_text
+from qcinput.structure.geometry import Geometry
+from qcinput.structure.gjf import load_gjf_geometry
+from qcinput.structure.xyz import iter_xyz_frames, load_xyz_geometry, parse_atom_block
+
+__all__ = [
+    "Geometry",
+    "StructureData",
+    "iter_structures",
+    "load_structure",
+    "load_structure_text",
+    "parse_atom_block",
+]
 
 
 @dataclass(frozen=True)
 class StructureData:
-    xyz_text: str
+    geometry: Geometry
     charge: int | None
     multiplicity: int | None
     source_format: str
 
+    @property
+    def xyz_text(self) -> str:
+        return self.geometry.text
+
 
 def load_structure(path: Path) -> StructureData:
     suffix = path.suffix.lower()
     if suffix == ".xyz":
         return StructureData(
-            xyz_text=load_xyz_text(path),
+            geometry=load_xyz_geometry(path),
             charge=None,
             multiplicity=None,
             source_format="xyz",
         )
     if suffix == ".gjf":
-        xyz_text, charge, multiplicity = load_gjf_data(path)
+        geometry, charge, multiplicity = load_gjf_geometry(path)
         return StructureData(
-            xyz_text=xyz_text,
+            geometry=geometry,
             charge=charge,
             multiplicity=multiplicity,
             source_format="gjf",
@@ -35,5 +50,18 @@ def load_structure(path: Path) -> StructureData:
     )
 
 
+def iter_structures(path: Path) -> Iterator[StructureData]:
+    if path.suffix.lower() != ".xyz":
+        yield load_structure(path)
+        return
+    for geometry in iter_xyz_frames(path):
+        yield StructureData(
+            geometry=geometry,
+            charge=None,
+            multiplicity=None,
+            source_format="xyz",
+        )
+
+
 def load_structure_text(path: Path) -> str:
     return load_structure(path).xyz_text
@@ -0,0 +1,42 @@
+SYMBOLS = (
+    "X",
+    "H", "He",
+    "Li", "Be", "B", "C", "N", "O", "F", "Ne",
+    "Na", "Mg", "Al", "Si", "P", "S", "Cl", "Ar",
+    "K", "Ca", "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn",
+    "Ga", "Ge", "As", "Se", "Br", "Kr",
+    "Rb", "Sr", "Y", "Zr", "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd",
+    "In", "Sn", "Sb", "Te", "I", "Xe",
+    "Cs", "Ba", "La", "Ce", "Pr", "Nd", "Pm", "Sm", "Eu", "Gd", "Tb", "Dy",
+    "Ho", "Er", "Tm", "Yb", "Lu", "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt",
+    "Au", "Hg", "Tl", "Pb", "Bi", "Po", "At", "Rn",
+    "Fr", "Ra", "Ac", "Th", "Pa", "U", "Np", "Pu", "Am", "Cm", "Bk", "Cf",
+    "Es", "Fm", "Md", "No", "Lr", "Rf", "Db", "Sg", "Bh", "Hs", "Mt", "Ds",
+    "Rg", "Cn", "Nh", "Fl", "Mc", "Lv", "Ts", "Og",
+)  # fmt: skip
+
+_NUMBERS = {symbol.casefold(): number for number, symbol in enumerate(SYMBOLS)}
+# Ghost/dummy atom labels used by Gaussian and ORCA map to 0 ("X").
+_NUMBERS.update(bq=0, gh=0, xx=0, du=0)
+# Labels seen so far (e.g. "C", "C12", "CL", "6"), so each distinct label is
+# resolved once per process. Bounded for files with per-atom numbered labels.
+_LABEL_CACHE_SIZE = 4096
+_label_cache: dict[str, int] = {}
+
+
+def atomic_number(label: str) -> int:
+    number = _label_cache.get(label)
+    if number is not None:
+        return number
+    if label.isdigit():
+        number = int(label)
+        if number >= len(SYMBOLS):
+            number = 0
+    else:
+        letters = label[:2] if label[1:2].isalpha() else label[:1]
+        number = _NUMBERS.get(letters.casefold())
+        if number is None:
+            number = _NUMBERS.get(letters[:1].casefold(), 0)
+    if len(_label_cache) < _LABEL_CACHE_SIZE:
+        _label_cache[label] = number
+    return number
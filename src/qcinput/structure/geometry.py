@@ -0,0 +1,183 @@
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from qcinput.structure.elements import SYMBOLS, atomic_number
+
+# Set to keep each loaded geometry's atom lines verbatim instead of
+# formatting them on use (5.8 MB instead of 2.5 MB for 100k atoms).
+KEEP_TEXT_ENV = "QCINPUT_KEEP_COORDINATE_TEXT"
+# Sources with more decimals than this keep their atom lines verbatim.
+MAX_DECIMALS = 10
+# Atom lines per chunk yielded by Geometry.iter_text().
+CHUNK_ATOMS = 4096
+# Maps every digit to "0" and "E" to "e" for coordinate_decimals().
+_DECIMALS_TABLE = bytes.maketrans(b"123456789E", b"000000000e")
+# A digit or "." right before an "e" only occurs in exponent notation;
+# element labels ("He", "Fe") have a letter there. Six integer digits plus
+# up to MAX_DECIMALS decimals could exceed what a double holds exactly.
+_VERBATIM_MARKERS = (b"0e", b".e", b"000000.")
+
+
+class Geometry:
+    # Atomic numbers live in array('B') and coordinates in one flat array('d')
+    # (x0, y0, z0, x1, ...). The text block is formatted on use with a fixed
+    # number of decimals per geometry. Loaders only do that for sources that
+    # give every coordinate the same number of decimals (the usual case), so
+    # they come back as written, up to whitespace; other atom lines are kept
+    # verbatim. Atom labels that differ from the element symbol ("C1", "Bq",
+    # "h") are kept as one newline-joined string.
+    __slots__ = ("numbers", "coordinates", "decimals", "_labels", "_text")
+
+    def __init__(
+        self,
+        numbers: array,
+        coordinates: array,
+        *,
+        decimals: int = 8,
+        labels: str | None = None,
+        text: str | None = None,
+    ) -> None:
+        if numbers.typecode != "B" or coordinates.typecode != "d":
+            raise ValueError("Geometry expects array('B') numbers and array('d').")
+        if len(coordinates) != 3 * len(numbers):
+            raise ValueError(
+                f"Geometry has {len(numbers)} atoms but {len(coordinates)} "
+                "coordinate values; expected three per atom."
+            )
+        self.numbers = numbers
+        self.coordinates = coordinates
+        self.decimals = decimals
+        self._labels = labels
+        self._text = text
+
+    @classmethod
+    def from_atoms(
+        cls,
+        symbols: Iterable[str],
+        positions: Iterable[Iterable[float]],
+    ) -> "Geometry":
+        numbers = array("B", (atomic_number(symbol) for symbol in symbols))
+        coordinates = array("d")
+        for position in positions:
+            coordinates.extend(position)
+        return cls(numbers, coordinates)
+
+    @classmethod
+    def from_atom_lines(
+        cls,
+        numbers: array,
+        coordinates: array,
+        atom_lines: list[str],
+        labels: list[str],
+    ) -> "Geometry":
+        # For loaders: `atom_lines` are the validated "label x y z" lines the
+        # arrays were parsed from and `labels` their first columns.
+        text = "\n".join(atom_lines)
+        decimals = None
+        if not os.environ.get(KEEP_TEXT_ENV):
+            decimals = coordinate_decimals(text, count=len(coordinates))
+        if decimals is None:
+            return cls(numbers, coordinates, text=text)
+        canonical = all(map(str.__eq__, labels, map(SYMBOLS.__getitem__, numbers)))
+        return cls(
+            numbers,
+            coordinates,
+            decimals=decimals,
+            labels=None if canonical else "\n".join(labels),
+        )
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Geometry):
+            return NotImplemented
+        return (
+            self.numbers == other.numbers
+            and self.coordinates == other.coordinates
+            and self.decimals == other.decimals
+            and self._labels == other._labels
+            and self._text == other._text
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Geometry(atoms={len(self)})"
+
+    @property
+    def symbols(self) -> tuple[str, ...]:
+        return tuple(SYMBOLS[number] for number in self.numbers)
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        # Atom labels as written in the source; element symbols otherwise.
+        if self._labels is None:
+            return self.symbols
+        return tuple(self._labels.split("\n"))
+
+    @property
+    def text(self) -> str:
+        # Built on each access; not cached, so a geometry only ever holds
+        # its arrays (unless loaded with KEEP_TEXT_ENV set).
+        if self._text is not None:
+            return self._text
+        return "\n".join(self._iter_lines())
+
+    def iter_text(self) -> Iterator[str]:
+        # Same characters as `text`, in pieces of CHUNK_ATOMS atom lines.
+        if self._text is not None:
+            yield self._text
+            return
+        lines = self._iter_lines()
+        chunk = "\n".join(islice(lines, CHUNK_ATOMS))
+        while chunk:
+            yield chunk
+            chunk = "\n".join(islice(lines, CHUNK_ATOMS))
+            if chunk:
+                yield "\n"
+
+    def _iter_lines(self) -> Iterator[str]:
+        if self._labels is None:
+            labels = map(SYMBOLS.__getitem__, self.numbers)
+        else:
+            labels = iter(self._labels.split("\n"))
+        values = iter(self.coordinates)
+        line = "%s {0} {0} {0}".format(f"%.{self.decimals}f")
+        return map(line.__mod__, zip(labels, values, values, values))
+
+    def coordinate_view(self) -> memoryview:
+        # Zero-copy (natoms, 3) view over the coordinate buffer.
+        return memoryview(self.coordinates).cast("B").cast("d", (len(self), 3))
+
+    def to_numpy(self) -> Any:
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ImportError("Geometry.to_numpy() requires NumPy.") from exc
+        return numpy.frombuffer(self.coordinates, dtype=numpy.float64).reshape(-1, 3)
+
+
+def coordinate_decimals(atom_block: str, *, count: int) -> int | None:
+    # The number of decimals all `count` coordinates of a "label x y z"
+    # block are written with, or None if formatting with one fixed number
+    # would not give each of them back (exponents, mixed precision, more
+    # than MAX_DECIMALS decimals, very large values). With all digits mapped
+    # to "0" a fraction of n digits contains "." + n zeros, so this is a few
+    # substring searches rather than a pass over every token.
+    data = atom_block.encode().translate(_DECIMALS_TABLE)
+    if any(marker in data for marker in _VERBATIM_MARKERS):
+        return None
+    decimals = 0
+    while b"." + b"0" * (decimals + 1) in data:
+        if decimals == MAX_DECIMALS:
+            return None
+        decimals += 1
+    if decimals == 0:
+        return None if b"." in data else 0
+    # A block has at most one "." per coordinate; with `decimals` the most
+    # any of them has, each match is a coordinate with exactly that many.
+    return decimals if data.count(b"." + b"0" * decimals) == count else None
@@ -1,6 +1,24 @@
 import re
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
+from qcinput.structure.elements import atomic_number
+from qcinput.structure.geometry import Geometry
+from qcinput.structure.vectorized import split_atom_block
+
+
+@dataclass(frozen=True)
+class GjfJob:
+    link0: tuple[str, ...]
+    route: str
+    title: str
+    charge: int | None
+    multiplicity: int | None
+    geometry: Geometry | None
+    trailing: tuple[str, ...]
+
 
 def load_gjf_text(path: Path) -> str:
     text, _, _ = load_gjf_data(path)
@@ -8,79 +26,261 @@ def load_gjf_text(path: Path) -> str:
 
 
 def load_gjf_data(path: Path) -> tuple[str, int, int]:
-    text = path.read_text(encoding="utf-8").strip()
-    lines = [line.rstrip() for line in text.splitlines()]
-    if not lines:
-        raise ValueError("GJF file is empty.")
+    geometry, charge, multiplicity = load_gjf_geometry(path)
+    return geometry.text, charge, multiplicity
 
-    charge_mult_idx = _find_charge_multiplicity_index(lines)
 
-    if charge_mult_idx == -1:
+def load_gjf_geometry(path: Path) -> tuple[Geometry, int, int]:
+    with path.open(encoding="utf-8") as handle:
+        jobs = list(_parse_jobs(handle, first_geometry_only=True))
+    if not jobs:
+        raise ValueError("GJF file is empty.")
+    job = jobs[-1]
+    if job.geometry is None or job.charge is None or job.multiplicity is None:
+        if any(job.charge is not None for job in jobs):
+            raise ValueError("No geometry section found in GJF file.")
         raise ValueError("Cannot find charge/multiplicity line in GJF file.")
+    return job.geometry, job.charge, job.multiplicity
+
+
+def load_gjf_jobs(path: Path) -> list[GjfJob]:
+    with path.open(encoding="utf-8") as handle:
+        return list(_parse_jobs(handle))
+
+
+_LINK0, _ROUTE, _TITLE, _MOLECULE, _GEOMETRY, _TRAILING, _SEARCH, _CANDIDATE = range(8)
+_GEOM_OPTIONS = re.compile(r"\bgeom(?:etry)?\s*[=(]\s*\(?\s*([^)\s]*)", re.IGNORECASE)
+
+
+class _JobBuilder:
+    __slots__ = (
+        "link0",
+        "route",
+        "title",
+        "charge",
+        "multiplicity",
+        "atom_lines",
+        "labels",
+        "numbers",
+        "coordinates",
+        "trailing",
+    )
+
+    def __init__(self) -> None:
+        self.link0: list[str] = []
+        self.route: list[str] = []
+        self.title: list[str] = []
+        self.charge: int | None = None
+        self.multiplicity: int | None = None
+        self.atom_lines: list[str] = []
+        self.labels: list[str] = []
+        self.numbers = array("B")
+        self.coordinates = array("d")
+        self.trailing: list[str] = []
+
+    def add_atom(self, atom: tuple[str, str, tuple[float, float, float]]) -> None:
+        normalized_atom_line, symbol, position = atom
+        self.atom_lines.append(normalized_atom_line)
+        self.labels.append(symbol)
+        self.numbers.append(atomic_number(symbol))
+        self.coordinates.extend(position)
+
+    def is_empty(self) -> bool:
+        return not (self.link0 or self.route or self.title or self.atom_lines) and (
+            self.charge is None and not self.trailing
+        )
+
+    def finish(self) -> GjfJob:
+        geometry = None
+        if self.atom_lines:
+            geometry = Geometry.from_atom_lines(
+                self.numbers, self.coordinates, self.atom_lines, self.labels
+            )
+        trailing = self.trailing
+        while trailing and not trailing[-1]:
+            trailing.pop()
+        return GjfJob(
+            link0=tuple(self.link0),
+            route=" ".join(self.route),
+            title="\n".join(self.title),
+            charge=self.charge,
+            multiplicity=self.multiplicity,
+            geometry=geometry,
+            trailing=tuple(trailing),
+        )
+
+
+def _checkpoint_geometry(route: list[str]) -> tuple[bool, bool]:
+    # Returns (reads geometry from chk, reads title/charge/geometry from chk).
+    match = _GEOM_OPTIONS.search(" ".join(route))
+    if match is None:
+        return False, False
+    options = {option.casefold() for option in match.group(1).split(",")}
+    reads_all = bool(options & {"allcheck", "allcheckpoint"})
+    return reads_all or bool(options & {"check", "checkpoint"}), reads_all
+
+
+def _parse_jobs(
+    lines: Iterable[str], *, first_geometry_only: bool = False
+) -> Iterator[GjfJob]:
+    # Single pass over the line stream: each line is looked at once, in the
+    # section the state machine is in. Header-less fragments (no route line)
+    # fall back to searching for a charge/multiplicity line that is directly
+    # followed by an atom line.
+    state = _LINK0
+    job = _JobBuilder()
+    candidate: tuple[int, int] | None = None
+    # Geometry lines are buffered up to the next blank or --Link1-- line and
+    # parsed as one block, so large geometries can take the vectorized path.
+    pending: list[str] = []
+    pending_line_no = 0
+    for line_no, raw_line in enumerate(lines, start=1):
+        if state == _GEOMETRY:
+            stripped = raw_line.strip()
+            if stripped and stripped.casefold() != "--link1--":
+                if not pending:
+                    pending_line_no = line_no
+                pending.append(raw_line.rstrip())
+                continue
+            if pending:
+                _add_atom_lines(job, pending, first_line=pending_line_no)
+                pending = []
+            if job.atom_lines:
+                if first_geometry_only:
+                    yield job.finish()
+                    return
+                state = _TRAILING
+            elif not stripped:
+                continue
+            else:
+                raise ValueError(
+                    f"Invalid GJF atom line at line {line_no}: '{raw_line.rstrip()}'"
+                )
 
-    atom_lines: list[str] = []
-    for idx, line in enumerate(lines[charge_mult_idx + 1 :], start=charge_mult_idx + 2):
+        line = raw_line.rstrip()
         stripped = line.strip()
+        if stripped.casefold() == "--link1--":
+            yield job.finish()
+            job = _JobBuilder()
+            state = _LINK0
+            continue
+        if state == _TRAILING:
+            if stripped or job.trailing:
+                job.trailing.append(line)
+            continue
         if not stripped:
-            if atom_lines:
-                break
+            if state == _ROUTE:
+                _, reads_all = _checkpoint_geometry(job.route)
+                state = _TRAILING if reads_all else _TITLE
+            elif state == _TITLE:
+                # Ends the title section, also when the title is empty.
+                state = _MOLECULE
             continue
 
-        normalized_atom_line = _normalize_atom_line(stripped)
-        if normalized_atom_line is None:
-            if atom_lines:
-                break
-            raise ValueError(f"Invalid GJF atom line at line {idx}: '{line}'")
-        atom_lines.append(normalized_atom_line)
+        if state == _LINK0:
+            if stripped.startswith("%"):
+                job.link0.append(stripped)
+                continue
+            if stripped.startswith("#"):
+                job.route.append(stripped)
+                state = _ROUTE
+                continue
+            state = _SEARCH
+        if state == _ROUTE:
+            job.route.append(stripped)
+            continue
+        if state == _TITLE:
+            job.title.append(stripped)
+            continue
+        if state == _MOLECULE:
+            pair = _parse_charge_multiplicity(stripped)
+            if pair is None and not job.title:
+                # Extra blank lines before the title.
+                job.title.append(stripped)
+                state = _TITLE
+                continue
+            if pair is None:
+                raise ValueError("Cannot find charge/multiplicity line in GJF file.")
+            job.charge, job.multiplicity = pair
+            reads_geometry, _ = _checkpoint_geometry(job.route)
+            state = _TRAILING if reads_geometry else _GEOMETRY
+            continue
+
+        pair = _parse_charge_multiplicity(stripped)
+        if pair is not None:
+            candidate = pair
+            state = _CANDIDATE
+            continue
+        if state == _CANDIDATE and candidate is not None:
+            atom = _parse_atom_line(stripped)
+            if atom is not None:
+                job.charge, job.multiplicity = candidate
+                job.add_atom(atom)
+                state = _GEOMETRY
+                continue
+        state = _SEARCH
 
-    if not atom_lines:
-        raise ValueError("No geometry section found in GJF file.")
+    if pending:
+        _add_atom_lines(job, pending, first_line=pending_line_no)
+    if not job.is_empty():
+        yield job.finish()
 
-    charge_str, multiplicity_str = lines[charge_mult_idx].strip().split()
-    charge = int(charge_str)
-    multiplicity = int(multiplicity_str)
-    return "\n".join(atom_lines), charge, multiplicity
 
+def _add_atom_lines(job: _JobBuilder, lines: list[str], *, first_line: int) -> None:
+    # A non-atom line ends the geometry; it and the lines after it belong to
+    # the trailing sections.
+    block = split_atom_block(lines)
+    if block is not None:
+        tokens, coordinates = block
+        symbols = tokens[0::4]
+        if all(map(_is_atom_symbol, set(symbols))):
+            job.atom_lines.extend(
+                map(" ".join, zip(symbols, tokens[1::4], tokens[2::4], tokens[3::4]))
+            )
+            job.labels.extend(symbols)
+            job.numbers.extend(map(atomic_number, symbols))
+            job.coordinates.extend(coordinates)
+            return
 
-def _find_charge_multiplicity_index(lines: list[str]) -> int:
     for idx, line in enumerate(lines):
-        parts = line.strip().split()
-        if len(parts) != 2:
-            continue
-        try:
-            int(parts[0])
-            int(parts[1])
-        except ValueError:
-            continue
+        atom = _parse_atom_line(line)
+        if atom is None:
+            if not job.atom_lines:
+                raise ValueError(
+                    f"Invalid GJF atom line at line {first_line + idx}: '{line}'"
+                )
+            job.trailing.extend(lines[idx:])
+            return
+        job.add_atom(atom)
+
+
+def _parse_charge_multiplicity(line: str) -> tuple[int, int] | None:
+    parts = line.split()
+    if len(parts) != 2:
+        return None
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
 
-        atom_count = 0
-        for next_line in lines[idx + 1 :]:
-            stripped = next_line.strip()
-            if not stripped:
-                if atom_count:
-                    break
-                continue
-            if _normalize_atom_line(stripped) is None:
-                break
-            atom_count += 1
 
-        if atom_count > 0:
-            return idx
-    return -1
+def _is_atom_symbol(label: str) -> bool:
+    # Same as re.fullmatch(r"[A-Za-z][A-Za-z0-9]*", label), without the regex.
+    return label.isascii() and label.isalnum() and label[0].isalpha()
 
 
-def _normalize_atom_line(line: str) -> str | None:
+def _parse_atom_line(
+    line: str,
+) -> tuple[str, str, tuple[float, float, float]] | None:
     parts = line.split()
     if len(parts) != 4:
         return None
 
     atom, x, y, z = parts
-    if not re.fullmatch(r"^[A-Za-z][A-Za-z0-9]*$", atom):
+    if not _is_atom_symbol(atom):
         return None
     try:
-        float(x)
-        float(y)
-        float(z)
+        position = (float(x), float(y), float(z))
     except ValueError:
         return None
-    return " ".join((atom, x, y, z))
+    return " ".join(parts), atom, position
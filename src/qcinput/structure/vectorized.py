@@ -0,0 +1,52 @@
+import os
+from array import array
+from functools import cache
+from types import ModuleType
+
+DISABLE_NUMPY_ENV = "QCINPUT_NO_NUMPY"
+# The fast path saves roughly 1 us per atom line, so below this size the
+# one-off NumPy import (~0.1 s) costs more than it saves.
+VECTORIZE_MIN_ATOMS = 50_000
+
+
+@cache
+def _numpy() -> ModuleType | None:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def numpy_enabled() -> bool:
+    return not os.environ.get(DISABLE_NUMPY_ENV) and _numpy() is not None
+
+
+def split_atom_block(lines: list[str]) -> tuple[list[str], array] | None:
+    # Fast path for "symbol x y z" blocks: one str.split() over the whole
+    # block for the tokens and one numpy.loadtxt() (a C tokenizer) for the
+    # coordinate columns. Returns the flat token list and the coordinates,
+    # or None when NumPy is unavailable or disabled, the block is small, or
+    # any line is malformed; callers then run their per-line parser, which
+    # reports the first bad line with the usual message.
+    if len(lines) < VECTORIZE_MIN_ATOMS or not numpy_enabled():
+        return None
+    numpy = _numpy()
+    tokens = "\n".join(lines).split()
+    # loadtxt() requires at least four columns per line, so a total of four
+    # tokens per line means exactly four on every line.
+    if len(tokens) != 4 * len(lines):
+        return None
+    try:
+        values = numpy.loadtxt(
+            lines,
+            dtype=numpy.float64,
+            comments=None,
+            usecols=(1, 2, 3),
+            ndmin=2,
+        )
+    except ValueError:
+        return None
+    coordinates = array("d")
+    coordinates.frombytes(values.tobytes())
+    return tokens, coordinates
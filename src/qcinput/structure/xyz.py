@@ -1,7 +1,17 @@
+from array import array
+from collections.abc import Iterator
 from pathlib import Path
 
+from qcinput.structure.elements import atomic_number
+from qcinput.structure.geometry import Geometry
+from qcinput.structure.vectorized import split_atom_block
+
 
 def load_xyz_text(path: Path) -> str:
+    return load_xyz_geometry(path).text
+
+
+def load_xyz_geometry(path: Path) -> Geometry:
     text = path.read_text(encoding="utf-8").strip()
     lines = [line.rstrip() for line in text.splitlines()]
     if len(lines) < 3:
@@ -14,20 +24,112 @@ def load_xyz_text(path: Path) -> str:
 
     atom_lines = lines[2:]
     if atom_count != len(atom_lines):
-        raise ValueError(
-            f"XYZ atom count mismatch: header={atom_count}, geometry lines={len(atom_lines)}."
-        )
-
-    for idx, line in enumerate(atom_lines, start=3):
-        parts = line.split()
-        if len(parts) != 4:
-            raise ValueError(f"Invalid XYZ atom line at line {idx}: '{line}'")
-        _, x, y, z = parts
+        raise _atom_count_mismatch(atom_count, len(atom_lines))
+
+    return _build_geometry(atom_lines, first_line=3)
+
+
+def _atom_count_mismatch(atom_count: int, geometry_lines: int) -> ValueError:
+    return ValueError(
+        f"XYZ atom count mismatch: header={atom_count}, "
+        f"geometry lines={geometry_lines}."
+    )
+
+
+def parse_atom_block(text: str) -> Geometry:
+    # Header-less "symbol x y z" lines, as in StructureData.xyz_text.
+    lines = [line.rstrip() for line in text.strip("\r\n").splitlines()]
+    if not lines:
+        raise ValueError("Atom block is empty.")
+    return _build_geometry(lines, first_line=1)
+
+
+def iter_xyz_frames(path: Path) -> Iterator[Geometry]:
+    # Reads one frame at a time from the handle so memory stays flat for
+    # CREST/MD ensembles of any length.
+    with path.open(encoding="utf-8") as handle:
+        frame_count = 0
+        for geometry in _read_frames(iter(handle)):
+            frame_count += 1
+            yield geometry
+    if frame_count == 0:
+        raise ValueError("XYZ file must contain at least 3 lines.")
+
+
+def _read_frames(
+    lines: Iterator[str], *, line_no: int = 0, frame_count: int = 0
+) -> Iterator[Geometry]:
+    atom_count = 0
+    blank_lines = 0
+    for header in lines:
+        line_no += 1
+        header = header.strip()
+        if not header:
+            blank_lines += 1
+            continue
         try:
-            float(x)
-            float(y)
-            float(z)
+            atom_count = int(header)
         except ValueError as exc:
-            raise ValueError(f"Invalid coordinates at line {idx}: '{line}'") from exc
+            if frame_count == 0:
+                raise ValueError("The first line of XYZ must be atom count.") from exc
+            if frame_count == 1:
+                # A single frame followed by more lines: its header is wrong.
+                rest = [line.rstrip() for line in lines]
+                while rest and not rest[-1].strip():
+                    rest.pop()
+                raise _atom_count_mismatch(
+                    atom_count, atom_count + blank_lines + 1 + len(rest)
+                ) from exc
+            raise ValueError(
+                f"Invalid XYZ frame header at line {line_no}: '{header}'"
+            ) from exc
+        if atom_count < 1:
+            raise ValueError(f"XYZ atom count must be positive at line {line_no}.")
+        blank_lines = 0
+
+        next(lines, None)  # comment line
+        line_no += 1
+        atom_lines: list[str] = []
+        for line in lines:
+            line = line.rstrip()
+            if not line.strip():
+                break
+            atom_lines.append(line)
+            if len(atom_lines) == atom_count:
+                break
+        geometry = _build_geometry(atom_lines, first_line=line_no + 1)
+        if len(atom_lines) != atom_count:
+            raise _atom_count_mismatch(atom_count, len(atom_lines))
+        line_no += atom_count
+        frame_count += 1
+        yield geometry
+
 
-    return "\n".join(atom_lines)
+def _build_geometry(atom_lines: list[str], *, first_line: int) -> Geometry:
+    block = split_atom_block(atom_lines)
+    if block is not None:
+        tokens, coordinates = block
+        labels = tokens[0::4]
+        numbers = array("B", map(atomic_number, labels))
+        return Geometry.from_atom_lines(numbers, coordinates, atom_lines, labels)
+
+    labels = []
+    numbers = array("B")
+    coordinates = array("d")
+    for idx, line in enumerate(atom_lines, start=first_line):
+        symbol, x, y, z = _parse_atom_line(line, idx)
+        labels.append(symbol)
+        numbers.append(atomic_number(symbol))
+        coordinates.extend((x, y, z))
+    return Geometry.from_atom_lines(numbers, coordinates, atom_lines, labels)
+
+
+def _parse_atom_line(line: str, idx: int) -> tuple[str, float, float, float]:
+    parts = line.split()
+    if len(parts) != 4:
+        raise ValueError(f"Invalid XYZ atom line at line {idx}: '{line}'")
+    symbol, x, y, z = parts
+    try:
+        return symbol, float(x), float(y), float(z)
+    except ValueError as exc:
+        raise ValueError(f"Invalid coordinates at line {idx}: '{line}'") from exc
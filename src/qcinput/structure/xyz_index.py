@@ -0,0 +1,203 @@
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+
+from qcinput.structure.geometry import Geometry
+from qcinput.structure.xyz import _atom_count_mismatch, _read_frames
+
+INDEX_SUFFIX = ".qcidx"
+# magic, indexed file size, indexed file mtime_ns, frame count
+_HEADER = struct.Struct("=8sQqQ")
+_MAGIC = b"QCXYZIX1"
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(f"{path.name}{INDEX_SUFFIX}")
+
+
+def parse_frame_selection(text: str) -> slice:
+    parts = text.split(":")
+    try:
+        values = [int(part) if part.strip() else None for part in parts]
+    except ValueError as exc:
+        raise ValueError(
+            f"Invalid frame selection {text!r}; use K, START:STOP, or START:STOP:STEP."
+        ) from exc
+    if len(values) == 1:
+        if values[0] is None:
+            raise ValueError(f"Invalid frame selection {text!r}.")
+        index = values[0]
+        return slice(index, None if index == -1 else index + 1)
+    if len(values) > 3:
+        raise ValueError(
+            f"Invalid frame selection {text!r}; use K, START:STOP, or START:STOP:STEP."
+        )
+    if len(values) == 3 and values[2] == 0:
+        raise ValueError("Frame selection step cannot be zero.")
+    return slice(*values)
+
+
+def _scan_frames(data: mmap.mmap) -> tuple[array, array]:
+    offsets = array("Q")
+    line_numbers = array("Q")
+    size = len(data)
+    pos = 0
+    line_no = 0
+    while pos < size:
+        end = data.find(b"\n", pos)
+        if end == -1:
+            end = size
+        line_no += 1
+        header = data[pos:end].strip()
+        if not header:
+            pos = end + 1
+            continue
+        try:
+            atom_count = int(header)
+        except ValueError as exc:
+            if not offsets:
+                raise ValueError("The first line of XYZ must be atom count.") from exc
+            if len(offsets) == 1:
+                # A single frame followed by more lines: its header is wrong.
+                lines = data[offsets[0] :].strip().splitlines()
+                first = int(lines[0])
+                raise _atom_count_mismatch(first, len(lines) - 2) from exc
+            raise ValueError(
+                f"Invalid XYZ frame header at line {line_no}: "
+                f"'{header.decode('utf-8', 'replace')}'"
+            ) from exc
+        if atom_count < 1:
+            raise ValueError(f"XYZ atom count must be positive at line {line_no}.")
+        offsets.append(pos)
+        line_numbers.append(line_no)
+        pos = end + 1
+        # Skip the comment line plus atom_count geometry lines; the frame body
+        # is validated when the frame is actually read.
+        for _ in range(atom_count + 1):
+            if pos >= size:
+                break
+            end = data.find(b"\n", pos)
+            pos = size if end == -1 else end + 1
+            line_no += 1
+    offsets.append(size)
+    return offsets, line_numbers
+
+
+class XYZFrameIndex:
+    __slots__ = ("path", "_offsets", "_line_numbers", "_file", "_mmap")
+
+    def __init__(self, path: Path, offsets: array, line_numbers: array) -> None:
+        self.path = path
+        self._offsets = offsets
+        self._line_numbers = line_numbers
+        self._file = None
+        self._mmap: mmap.mmap | None = None
+
+    @classmethod
+    def open(cls, path: Path, *, write_sidecar: bool = True) -> "XYZFrameIndex":
+        stat = path.stat()
+        if stat.st_size == 0:
+            raise ValueError("XYZ file must contain at least 3 lines.")
+        sidecar = index_path_for(path)
+        loaded = _read_sidecar(sidecar, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+        if loaded is not None:
+            return cls(path, *loaded)
+        with (
+            path.open("rb") as handle,
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            offsets, line_numbers = _scan_frames(data)
+        if write_sidecar:
+            _write_sidecar(
+                sidecar,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                offsets=offsets,
+                line_numbers=line_numbers,
+            )
+        return cls(path, offsets, line_numbers)
+
+    def __len__(self) -> int:
+        return len(self._line_numbers)
+
+    def __enter__(self) -> "XYZFrameIndex":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def frame(self, index: int) -> Geometry:
+        count = len(self)
+        if not -count <= index < count:
+            raise ValueError(
+                f"Frame {index} is out of range for {self.path} ({count} frames)."
+            )
+        index %= count
+        if self._mmap is None:
+            self._file = self.path.open("rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        with memoryview(self._mmap) as view, view[start:end] as chunk:
+            text = str(chunk, "utf-8")
+        frames = _read_frames(
+            iter(text.splitlines()),
+            line_no=self._line_numbers[index] - 1,
+            frame_count=index,
+        )
+        return next(frames)
+
+    def iter_frames(self, selection: slice) -> Iterator[tuple[int, Geometry]]:
+        for index in range(len(self))[selection]:
+            yield index, self.frame(index)
+
+
+def _read_sidecar(
+    sidecar: Path, *, size: int, mtime_ns: int
+) -> tuple[array, array] | None:
+    try:
+        with sidecar.open("rb") as handle:
+            header = handle.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, indexed_size, indexed_mtime_ns, count = _HEADER.unpack(header)
+            if (magic, indexed_size, indexed_mtime_ns) != (_MAGIC, size, mtime_ns):
+                return None
+            offsets = array("Q")
+            line_numbers = array("Q")
+            offsets.fromfile(handle, count + 1)
+            line_numbers.fromfile(handle, count)
+    except (OSError, EOFError):
+        return None
+    return offsets, line_numbers
+
+
+def _write_sidecar(
+    sidecar: Path,
+    *,
+    size: int,
+    mtime_ns: int,
+    offsets: array,
+    line_numbers: array,
+) -> None:
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, size, mtime_ns, len(line_numbers)))
+            offsets.tofile(handle)
+            line_numbers.tofile(handle)
+        os.replace(tmp, sidecar)
+    except OSError:
+        # Read-only data directories still work; the index is just rebuilt.
+        tmp.unlink(missing_ok=True)
@@ -0,0 +1,57 @@
+import io
+import re
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+_SLOT_PATTERN = re.compile(r"\x00(\w+)\x00")
+# Slot values are written in slices of this many characters, so streaming
+# a large geometry never holds more than one slice in a second copy.
+CHUNK_CHARS = 1 << 18
+
+
+def slot(name: str) -> str:
+    return f"\x00{name}\x00"
+
+
+class InputTemplate:
+    # Input text rendered once with slot() markers in place of the
+    # structure-dependent values; render() only splices those values in.
+    __slots__ = ("_parts", "_slots")
+
+    def __init__(self, text: str) -> None:
+        self._parts = _SLOT_PATTERN.split(text)
+        self._slots = tuple(range(1, len(self._parts), 2))
+
+    @property
+    def slot_names(self) -> frozenset[str]:
+        return frozenset(self._parts[idx] for idx in self._slots)
+
+    def render(self, **values: str) -> str:
+        parts = list(self._parts)
+        for idx in self._slots:
+            parts[idx] = values[parts[idx]]
+        return "".join(parts)
+
+    def iter_chunks(self, **values: str | Iterable[str]) -> Iterator[str]:
+        # Non-str values are iterables of chunks, written as they come.
+        for idx, part in enumerate(self._parts):
+            if idx % 2 == 0:
+                if part:
+                    yield part
+                continue
+            value = values[part]
+            if not isinstance(value, str):
+                yield from value
+                continue
+            for start in range(0, len(value), CHUNK_CHARS):
+                yield value[start : start + CHUNK_CHARS]
+
+    def write(self, stream: IO, **values: str | Iterable[str]) -> None:
+        # Text streams (io.TextIOBase) get str chunks; anything else is
+        # treated as binary and gets UTF-8 bytes.
+        if isinstance(stream, io.TextIOBase):
+            for chunk in self.iter_chunks(**values):
+                stream.write(chunk)
+        else:
+            for chunk in self.iter_chunks(**values):
+                stream.write(chunk.encode("utf-8"))
@@ -0,0 +1,92 @@
+import json
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import IO, Any, TypeVar
+
+T = TypeVar("T")
+TimingHook = Callable[[dict[str, Any]], None]
+
+_active: ContextVar["StageTimer | None"] = ContextVar("qcinput_timer", default=None)
+
+
+class StageTimer:
+    # Times pipeline stages and reports one event per stage run to a hook:
+    # {"stage": ..., <fields>, "seconds": wall time, "peak_bytes": ...}.
+    # peak_bytes (with memory=True) is the tracemalloc high-water mark above
+    # the memory in use when the stage started.
+    __slots__ = ("hook", "memory")
+
+    def __init__(self, hook: TimingHook, *, memory: bool = False) -> None:
+        self.hook = hook
+        self.memory = memory
+
+    def _start(self) -> tuple[float, int]:
+        start_bytes = 0
+        if self.memory:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+        return time.perf_counter(), start_bytes
+
+    def _emit(
+        self, stage: str, fields: dict[str, Any], started: float, start_bytes: int
+    ) -> None:
+        event = {"stage": stage, **fields}
+        event["seconds"] = round(time.perf_counter() - started, 6)
+        if self.memory:
+            event["peak_bytes"] = tracemalloc.get_traced_memory()[1] - start_bytes
+        self.hook(event)
+
+    def measure(
+        self, stage: str, func: Callable[..., T], *args: Any, **fields: Any
+    ) -> T:
+        started, start_bytes = self._start()
+        try:
+            return func(*args)
+        finally:
+            self._emit(stage, fields, started, start_bytes)
+
+    def iterate(self, stage: str, items: Iterator[T], **fields: Any) -> Iterator[T]:
+        # Times producing each item of a lazy iterator (parsing a frame).
+        while True:
+            started, start_bytes = self._start()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except BaseException:
+                self._emit(stage, fields, started, start_bytes)
+                raise
+            self._emit(stage, fields, started, start_bytes)
+            yield item
+
+
+def active_timer() -> StageTimer | None:
+    return _active.get()
+
+
+@contextmanager
+def record_timings(hook: TimingHook, *, memory: bool = False) -> Iterator[StageTimer]:
+    # Library hook: stages of qcinput calls made inside the block (in this
+    # thread or task, not in worker processes) are reported to `hook`.
+    timer = StageTimer(hook, memory=memory)
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    token = _active.set(timer)
+    try:
+        yield timer
+    finally:
+        _active.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def json_lines_hook(stream: IO[str]) -> TimingHook:
+    def emit(event: dict[str, Any]) -> None:
+        stream.write(json.dumps(event) + "\n")
+        stream.flush()
+
+    return emit
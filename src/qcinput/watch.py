@@ -0,0 +1,210 @@
+import os
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from qcinput.batch import (
+    STRUCTURE_SUFFIXES,
+    BatchResult,
+    BatchTask,
+    drop_generated_outputs,
+    iter_batch_task_results,
+    output_collision,
+    plan_batch,
+    plan_incremental,
+    record_task,
+)
+from qcinput.config import QCInputConfig
+from qcinput.manifest import ManifestSet
+
+# (size, mtime_ns): a file whose signature is unchanged is not re-read.
+FileSignature = tuple[int, int]
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_SETTLE = 2.0
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def scan_structures(
+    directories: Iterable[Path], *, suffixes: tuple[str, ...] = STRUCTURE_SUFFIXES
+) -> dict[Path, FileSignature]:
+    # One directory listing per poll; hidden files (editor and download
+    # temporaries) are ignored.
+    found: dict[Path, FileSignature] = {}
+    for directory in directories:
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if os.path.splitext(entry.name)[1].lower() not in suffixes:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            found[Path(entry.path)] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+
+class StructureWatcher:
+    # A structure is ready once its size and mtime have not changed for
+    # `settle` seconds (or its mtime is that old), which skips files that
+    # are still being written. Each version of a file is handed out once.
+    def __init__(
+        self,
+        directories: Iterable[Path],
+        *,
+        settle: float = DEFAULT_SETTLE,
+        suffixes: tuple[str, ...] = STRUCTURE_SUFFIXES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.directories = tuple(directories)
+        self.settle = settle
+        self.suffixes = suffixes
+        self._clock = clock
+        self._seen: dict[Path, tuple[FileSignature, float]] = {}
+        self._done: dict[Path, FileSignature] = {}
+
+    def poll(self) -> list[Path]:
+        now = self._clock()
+        settled_mtime = time.time_ns() - int(self.settle * 1e9)
+        current = scan_structures(self.directories, suffixes=self.suffixes)
+        for path in self._seen.keys() - current.keys():
+            del self._seen[path]
+            self._done.pop(path, None)
+        ready = []
+        for path, signature in current.items():
+            seen = self._seen.get(path)
+            if seen is None or seen[0] != signature:
+                seen = self._seen[path] = (signature, now)
+            if self._done.get(path) == signature:
+                continue
+            if now - seen[1] >= self.settle or signature[1] <= settled_mtime:
+                ready.append(path)
+        return sorted(ready)
+
+    def mark_done(self, paths: Iterable[Path]) -> None:
+        for path in paths:
+            seen = self._seen.get(path)
+            if seen is not None:
+                self._done[path] = seen[0]
+
+    def done(self) -> list[Path]:
+        return sorted(self._done)
+
+
+class InputWatcher:
+    # Keeps the parsed config and the output manifests in memory between
+    # polls. New or changed structures are generated once they settle; when
+    # the config file changes it is reloaded and every known structure is
+    # re-planned, so the manifest rebuilds exactly the affected outputs.
+    def __init__(
+        self,
+        structures: StructureWatcher,
+        config_path: Path,
+        load_config: Callable[[], QCInputConfig | tuple[QCInputConfig, ...]],
+        *,
+        output_dir: Path | None = None,
+        notify: Callable[[str], None] = lambda message: None,
+    ) -> None:
+        self.structures = structures
+        self.config_path = config_path
+        self.output_dir = output_dir
+        self._load_config = load_config
+        self._notify = notify
+        self._config_signature = file_signature(config_path)
+        self.config = load_config()
+        self.manifests = ManifestSet()
+        # Resolved output path -> the structure it belongs to, and every
+        # output written so far.
+        self._owners: dict[Path, Path] = {}
+        self._outputs: set[Path] = set()
+
+    def _reload_config(self) -> bool:
+        signature = file_signature(self.config_path)
+        if signature == self._config_signature:
+            return False
+        self._config_signature = signature
+        try:
+            self.config = self._load_config()
+        except (FileNotFoundError, ValueError) as exc:
+            self._notify(f"error: {exc} (keeping the previous config)")
+            return False
+        self._notify(f"config reloaded: {self.config_path}")
+        return True
+
+    def _plan(
+        self, paths: list[Path], engine: str
+    ) -> tuple[list[BatchTask], list[BatchResult]]:
+        # Planned one structure at a time, so a name collision fails only the
+        # structure that came later, not the whole poll.
+        tasks: list[BatchTask] = []
+        failures: list[BatchResult] = []
+        for path in paths:
+            (task,) = plan_batch([path], engine=engine, output_dir=self.output_dir)
+            key = task.output.resolve()
+            owner = self._owners.get(key)
+            if owner is not None and owner != path and owner.exists():
+                error = output_collision(owner, path, task.output)
+                failures.append(
+                    BatchResult(structure=path, output=task.output, error=str(error))
+                )
+                continue
+            self._owners[key] = path
+            tasks.append(task)
+        return tasks, failures
+
+    def poll(self) -> list[BatchResult]:
+        ready = self.structures.poll()
+        paths = ready
+        if self._reload_config():
+            paths = sorted({*ready, *self.structures.done()})
+        config = self.config
+        engine = (
+            config.engine if isinstance(config, QCInputConfig) else config[0].engine
+        )
+        # Without an output directory the inputs written here land next to
+        # their structures and show up in the next listing; they are skipped
+        # (not marked done) on every poll.
+        paths = [
+            path
+            for path in drop_generated_outputs(
+                paths,
+                engine=engine,
+                output_dir=self.output_dir,
+                manifests=self.manifests,
+            )
+            if path.resolve() not in self._outputs
+        ]
+        if not paths:
+            return []
+        tasks, results = self._plan(paths, engine)
+        pending, _ = plan_incremental(tasks, config, self.manifests)
+        entries = dict(pending)
+        try:
+            for task, task_results in iter_batch_task_results(list(entries), config):
+                record_task(self.manifests, task, entries[task], task_results)
+                results.extend(task_results)
+                self._outputs.update(
+                    result.output.resolve()
+                    for result in task_results
+                    if result.error is None
+                )
+        finally:
+            self.manifests.save()
+        # Failed structures count as processed too: they are reported once
+        # and retried when they change.
+        self.structures.mark_done(paths)
+        return results
@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+from tests.conftest import ROOT
+
+RUNNER = ROOT / "benchmarks" / "run.py"
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, str(RUNNER), "--max-atoms", "3", "--repeat", "1", *args],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_benchmark_runner_writes_json_and_flags_regressions(tmp_path) -> None:
+    results = tmp_path / "results.json"
+
+    proc = _run("-k", "load_config.warm", "--output", str(results))
+
+    assert proc.returncode == 0, proc.stderr
+    payload = json.loads(results.read_text(encoding="utf-8"))
+    assert list(payload["results"]) == ["config.load_config.warm"]
+    assert payload["results"]["config.load_config.warm"]["seconds"] > 0
+    assert {"qcinput", "python", "numpy"} <= set(payload["meta"])
+
+    payload["results"]["config.load_config.warm"]["seconds"] = 1e-12
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(payload), encoding="utf-8")
+    proc = _run("-k", "load_config.warm", "--baseline", str(baseline))
+
+    assert proc.returncode == 1
+    assert "regression: config.load_config.warm" in proc.stderr
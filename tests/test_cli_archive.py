@@ -0,0 +1,86 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+
+
+def _write_structures(tmp_path, names):
+    xyz, config = write_example_files(tmp_path)
+    structures_dir = tmp_path / "structures"
+    structures_dir.mkdir()
+    for name in names:
+        (structures_dir / f"{name}.xyz").write_text(
+            xyz.read_text(encoding="utf-8"), encoding="utf-8"
+        )
+    return structures_dir, config
+
+
+@pytest.mark.parametrize("suffix", [".tar.gz", ".tar", ".zip"])
+def test_batch_archive_is_reproducible_and_extracts(tmp_path, capsys, suffix) -> None:
+    structures_dir, config = _write_structures(tmp_path, ["c", "a", "b"])
+    archive = tmp_path / f"inputs{suffix}"
+    argv = ["batch", str(structures_dir), "-c", str(config), "-j", "2"]
+
+    assert main([*argv, "--archive", str(archive)]) == 0
+    assert capsys.readouterr().out == f"{archive}\n"
+    assert not list(structures_dir.glob("*.inp"))
+    first = archive.read_bytes()
+
+    (structures_dir / "a.xyz").touch()
+    assert main([*argv, "-j", "1", "--archive", str(archive)]) == 0
+    assert archive.read_bytes() == first
+
+    extract_dir = tmp_path / "scratch"
+    assert main(["extract", str(archive), "-d", str(extract_dir)]) == 0
+    assert capsys.readouterr().out.splitlines()[-3:] == [
+        str(extract_dir / name) for name in ("a.inp", "b.inp", "c.inp")
+    ]
+
+    assert main([*argv, "-d", str(tmp_path / "plain")]) == 0
+    for name in ("a.inp", "b.inp", "c.inp"):
+        assert (extract_dir / name).read_bytes() == (
+            tmp_path / "plain" / name
+        ).read_bytes()
+
+
+def test_batch_archive_rejects_bad_options(tmp_path) -> None:
+    structures_dir, config = _write_structures(tmp_path, ["a"])
+    argv = ["batch", str(structures_dir), "-c", str(config)]
+
+    with pytest.raises(SystemExit, match="cannot be combined"):
+        main([*argv, "--archive", str(tmp_path / "x.zip"), "-d", str(tmp_path)])
+    with pytest.raises(SystemExit, match="Unsupported archive type"):
+        main([*argv, "--archive", str(tmp_path / "x.rar")])
+
+
+def test_batch_archive_is_removed_after_failure(tmp_path) -> None:
+    structures_dir, config = _write_structures(tmp_path, ["a", "b"])
+    (structures_dir / "b.xyz").write_text("broken\n", encoding="utf-8")
+    archive = tmp_path / "inputs.tar.gz"
+
+    with pytest.raises(SystemExit, match="b.xyz"):
+        main(
+            ["batch", str(structures_dir), "-c", str(config), "--archive", str(archive)]
+        )
+    assert not archive.exists()
+
+
+def test_extract_refuses_unsafe_entries(tmp_path) -> None:
+    archive = tmp_path / "evil.tar"
+    with tarfile.open(archive, "w") as tar:
+        info = tarfile.TarInfo("../escape.inp")
+        info.size = 1
+        tar.addfile(info, io.BytesIO(b"x"))
+    with pytest.raises(SystemExit, match="unsafe archive entry"):
+        main(["extract", str(archive), "-d", str(tmp_path / "out")])
+    assert not (tmp_path / "escape.inp").exists()
+
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as handle:
+        handle.writestr("/etc/escape.inp", "x")
+    with pytest.raises(SystemExit, match="unsafe archive entry"):
+        main(["extract", str(archive), "-d", str(tmp_path / "out")])
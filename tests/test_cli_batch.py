@@ -0,0 +1,195 @@
+import sys
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+
+
+def _write_structures(tmp_path, names):
+    xyz, config = write_example_files(tmp_path)
+    structures_dir = tmp_path / "structures"
+    structures_dir.mkdir()
+    paths = []
+    for name in names:
+        path = structures_dir / f"{name}.xyz"
+        path.write_text(xyz.read_text(encoding="utf-8"), encoding="utf-8")
+        paths.append(path)
+    return structures_dir, paths, config
+
+
+def test_batch_generates_directory_in_parallel(monkeypatch, tmp_path, capsys) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a", "b", "c"])
+    output_dir = tmp_path / "out"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qcinput",
+            "batch",
+            str(structures_dir),
+            "--config",
+            str(config),
+            "-d",
+            str(output_dir),
+            "-j",
+            "2",
+            "--chunksize",
+            "1",
+        ],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert captured.out.splitlines() == [
+        str(output_dir / f"{path.stem}.inp") for path in paths
+    ]
+    for path in paths:
+        text = (output_dir / f"{path.stem}.inp").read_text(encoding="utf-8")
+        assert "! Opt Freq B3LYP def2-TZVP NoPop" in text
+
+
+def test_batch_accepts_globs_and_file_list(monkeypatch, tmp_path, capsys) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a", "b", "c"])
+    file_list = tmp_path / "structures.txt"
+    file_list.write_text(f"# conformers\n{paths[2]}\n\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qcinput",
+            "batch",
+            str(structures_dir / "[ab].xyz"),
+            "--file-list",
+            str(file_list),
+            "--config",
+            str(config),
+            "-j",
+            "1",
+        ],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert captured.out.splitlines() == [
+        str(path.with_suffix(".inp")) for path in paths
+    ]
+
+
+def test_batch_keep_going_reports_all_failures(monkeypatch, tmp_path, capsys) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a", "b", "c"])
+    paths[0].write_text("2\nbroken\nO 0 0 0\n", encoding="utf-8")
+    paths[2].write_text("1\nbroken\nO 0 zero 0\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qcinput",
+            "batch",
+            str(structures_dir),
+            "--config",
+            str(config),
+            "-j",
+            "2",
+            "--keep-going",
+        ],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 1
+    assert captured.out.splitlines() == [str(paths[1].with_suffix(".inp"))]
+    assert "2 of 3 structures failed" in captured.err
+    assert f"{paths[0]}: XYZ atom count mismatch" in captured.err
+    assert f"{paths[2]}: Invalid coordinates at line 3" in captured.err
+
+
+def test_batch_stops_at_first_failure(monkeypatch, tmp_path) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a", "b"])
+    paths[0].write_text("2\nbroken\nO 0 0 0\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["qcinput", "batch", str(structures_dir), "--config", str(config)],
+    )
+
+    try:
+        main()
+    except SystemExit as exc:
+        message = str(exc)
+    else:
+        raise AssertionError("Expected SystemExit for invalid structure.")
+
+    assert message.startswith(f"error: {paths[0]}:")
+    assert "atom count mismatch" in message
+
+
+def test_batch_rejects_output_name_collisions(monkeypatch, tmp_path) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a"])
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    (other_dir / "a.xyz").write_text(paths[0].read_text(encoding="utf-8"))
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qcinput",
+            "batch",
+            str(structures_dir),
+            str(other_dir),
+            "--config",
+            str(config),
+            "-d",
+            str(tmp_path / "out"),
+        ],
+    )
+
+    try:
+        main()
+    except SystemExit as exc:
+        message = str(exc)
+    else:
+        raise AssertionError("Expected SystemExit for output name collision.")
+
+    assert "collision" in message
+
+
+def test_batch_rerun_skips_gaussian_outputs_next_to_structures(
+    tmp_path, capsys
+) -> None:
+    structures_dir, paths, _ = _write_structures(tmp_path, ["a", "b"])
+    _, config = write_example_files(tmp_path, engine="gaussian")
+    argv = ["batch", str(structures_dir), "-c", str(config)]
+    assert main(argv) == 0
+    outputs = [path.with_suffix(".gjf") for path in paths]
+    assert capsys.readouterr().out.splitlines() == [str(path) for path in outputs]
+
+    assert main(argv) == 0
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [str(path) for path in outputs]
+    assert "0 rebuilt, 2 skipped" in captured.err
+
+    # Tagged outputs are recognized through the manifest.
+    assert main([*argv, "--kinds", "int,sp"]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 4
+    assert main([*argv, "--kinds", "int,sp"]) == 0
+    assert "0 rebuilt, 4 skipped" in capsys.readouterr().err
+
+
+def test_batch_workers_default_to_cpus_available_to_process(monkeypatch) -> None:
+    from qcinput.cli import build_root_parser
+
+    monkeypatch.setattr("os.sched_getaffinity", lambda pid: {0, 1, 2}, raising=False)
+    monkeypatch.setattr("os.cpu_count", lambda: 64)
+    assert build_root_parser().parse_args(["batch", "x"]).workers == 3
+
+    monkeypatch.delattr("os.sched_getaffinity", raising=False)
+    assert build_root_parser().parse_args(["batch", "x"]).workers == 64
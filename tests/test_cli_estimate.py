@@ -0,0 +1,89 @@
+import pytest
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+
+
+def _write_structures(tmp_path, **kwargs):
+    xyz, config = write_example_files(tmp_path, **kwargs)
+    structures = tmp_path / "structures"
+    structures.mkdir()
+    (structures / "a_water.xyz").write_text(xyz.read_text(encoding="utf-8"))
+    (structures / "b_benzene.xyz").write_text(
+        "12\nbenzene\n"
+        + "".join(f"C {i}.0 0.0 0.0\n" for i in range(6))
+        + "".join(f"H {i}.0 1.0 0.0\n" for i in range(6))
+    )
+    return structures, config
+
+
+def _rows(out):
+    return [line.split() for line in out.splitlines()[1:]]
+
+
+def test_estimate_ranks_structures_and_suggests_walltime(tmp_path, capsys) -> None:
+    structures, config = _write_structures(tmp_path)
+    assert main(["estimate", str(structures), "-c", str(config)]) == 0
+
+    captured = capsys.readouterr()
+    assert captured.out.splitlines()[0].split() == [
+        "cost",
+        "walltime",
+        "basis_fns",
+        "atoms",
+        "structure",
+    ]
+    # def2-TZVP: 31 functions per C/O, 6 per H.
+    rows = _rows(captured.out)
+    assert [row[2:] for row in rows] == [
+        ["222", "12", "b_benzene.xyz"],
+        ["43", "3", "a_water.xyz"],
+    ]
+    assert float(rows[0][0]) > 50 * float(rows[1][0])
+    assert rows[1][1] == "00:15:00"
+    assert "2 structures" in captured.err
+    assert "hf/dft, def2-TZVP, 8 cores per job" in captured.err
+
+    argv = ["estimate", str(structures), "-c", str(config), "--sort", "name"]
+    assert main([*argv, "--cores", "1", "--seconds-per-unit", "600"]) == 0
+    rows = _rows(capsys.readouterr().out)
+    assert [row[-1] for row in rows] == ["a_water.xyz", "b_benzene.xyz"]
+    hours, minutes, _ = map(int, rows[1][1].split(":"))
+    assert hours > 24 and minutes % 15 == 0
+
+
+@pytest.mark.parametrize(
+    ("route", "basis_functions", "method"),
+    [
+        ("B3LYP/def2TZVP", "43", "hf/dft"),
+        ("MP2/6-31G*", "19", "mp2"),
+        ("CCSD(T)/cc-pVTZ", "58", "ccsd(t)"),
+    ],
+)
+def test_estimate_reads_method_and_basis_from_gaussian_route(
+    tmp_path, capsys, route, basis_functions, method
+) -> None:
+    structures, config = _write_structures(tmp_path, engine="gaussian", kind="sp")
+    config.write_text(
+        config.read_text(encoding="utf-8").replace("B3LYP/def2TZVP", route),
+        encoding="utf-8",
+    )
+    water = structures / "a_water.xyz"
+    assert main(["estimate", str(water), "-c", str(config)]) == 0
+    captured = capsys.readouterr()
+    assert _rows(captured.out)[0][2] == basis_functions
+    assert f"({method}, " in captured.err
+
+
+def test_batch_order_cost_starts_with_the_most_expensive(tmp_path, capsys) -> None:
+    structures, config = _write_structures(tmp_path)
+    output_dir = tmp_path / "out"
+    argv = ["batch", str(structures), "-c", str(config), "-d", str(output_dir)]
+    assert main([*argv, "-j", "1", "--order", "cost"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        str(output_dir / "b_benzene.inp"),
+        str(output_dir / "a_water.inp"),
+    ]
+
+    with pytest.raises(SystemExit, match="drop --order"):
+        main([*argv[:4], "--archive", str(tmp_path / "x.tar"), "--order", "cost"])
@@ -0,0 +1,60 @@
+import asyncio
+import json
+
+import pytest
+
+import qcinput
+from qcinput.aio import agenerate_many
+from qcinput.cli import main
+from tests.test_cli_batch import _write_structures
+from tests.test_cli_multiframe import _write_ensemble
+
+
+def test_batch_io_concurrency_matches_serial_run(tmp_path, capsys) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a", "b", "c"])
+    _write_ensemble(structures_dir, 3)
+    outputs = {}
+    for name, extra in (("serial", ["-j", "1"]), ("async", ["--io-concurrency", "2"])):
+        output_dir = tmp_path / name
+        argv = ["batch", str(structures_dir), "-c", str(config), "-d", str(output_dir)]
+        assert main([*argv, "--kinds", "int,sp", *extra]) == 0
+        outputs[name] = {
+            path.name: path.read_bytes() for path in output_dir.glob("*.inp")
+        }
+        assert [
+            line.replace(str(output_dir), "")
+            for line in capsys.readouterr().out.splitlines()
+        ] == sorted(f"/{name}" for name in outputs[name])
+
+        manifest = json.loads((output_dir / ".qcinput-manifest.json").read_text())
+        assert len(manifest["entries"]) == 4
+        assert main([*argv, "--kinds", "int,sp", *extra]) == 0
+        assert "0 rebuilt, 12 skipped" in capsys.readouterr().err
+    assert len(outputs["async"]) == 12
+    assert outputs["async"] == outputs["serial"]
+
+
+def test_batch_io_concurrency_keep_going_and_pack(tmp_path, capsys) -> None:
+    structures_dir, _, config = _write_structures(tmp_path, ["a", "b"])
+    (structures_dir / "bad.xyz").write_text("2\nbroken\nO 0 0\n", encoding="utf-8")
+    argv = ["batch", str(structures_dir), "-c", str(config), "--io-concurrency", "4"]
+    assert main([*argv, "--keep-going"]) == 1
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 2
+    assert "1 of 3 structures failed" in captured.err
+    assert f"{structures_dir / 'bad.xyz'}:" in captured.err
+
+    with pytest.raises(SystemExit, match="drop --io-concurrency"):
+        main([*argv, "--pack", "2"])
+
+
+def test_agenerate_many_matches_generate_many(tmp_path) -> None:
+    structures_dir, paths, config = _write_structures(tmp_path, ["a", "b", "c"])
+    sources = [*paths, ("inline", paths[0].read_text().split("\n", 2)[2])]
+
+    async def collect(items):
+        return [output async for output in agenerate_many(items, config)]
+
+    assert asyncio.run(collect(sources)) == list(qcinput.generate_many(sources, config))
+    with pytest.raises(ValueError, match="missing.xyz: "):
+        asyncio.run(collect([*paths, structures_dir / "missing.xyz"]))
@@ -0,0 +1,116 @@
+import shutil
+import subprocess
+
+import pytest
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+
+
+def _write_inputs(tmp_path, names):
+    _, config = write_example_files(tmp_path)
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    for name in names:
+        (inputs / name).write_text(f"input {name}\n", encoding="utf-8")
+    return inputs, config
+
+
+def test_jobscripts_pack_jobs_onto_nodes(tmp_path, capsys) -> None:
+    # ORCA: 8 cores x 4000 MB; Gaussian: 8 cores, 8GB = 8192 MB; plus 25%.
+    names = [f"m{i}.inp" for i in range(5)] + ["g.gjf"]
+    inputs, config = _write_inputs(tmp_path, names)
+    argv = ["jobscripts", str(inputs), "-c", str(config), "--time", "2:00:00"]
+    assert main([*argv, "--node-cores", "24", "--node-mem", "150G"]) == 0
+
+    captured = capsys.readouterr()
+    scripts = [inputs / "qcinput-0001.sh", inputs / "qcinput-0002.sh"]
+    assert captured.out.splitlines() == [str(path) for path in scripts]
+    assert captured.err == "6 jobs in 2 node bundles\n"
+    first = scripts[0].read_text(encoding="utf-8")
+    assert (
+        "#SBATCH --ntasks=24\n#SBATCH --mem=120000M\n#SBATCH --time=2:00:00\n" in first
+    )
+    assert "# 3 jobs: 24 of 24 cores, 120000 of 153600 MB\n" in first
+    assert f"cd {inputs} || exit 1\n" in first
+    # Concurrent ORCA runs must not all pin their ranks to the first cores.
+    assert (
+        'OMPI_MCA_hwloc_base_binding_policy=none "$(command -v orca)" m0.inp > m0.out'
+        " &\npids+=($!)\n" in first
+    )
+    second = scripts[1].read_text(encoding="utf-8")
+    assert "#SBATCH --ntasks=24\n#SBATCH --mem=90240M\n" in second
+    assert "\ng16 < g.gjf > g.log &\n" in second
+    assert sorted(
+        line.split()[-2]
+        for script in scripts
+        for line in script.read_text().splitlines()
+        if line.endswith(" &")
+    ) == ["g.log", *(f"m{i}.out" for i in range(5))]
+
+
+def test_jobscripts_array_per_job_shape(tmp_path, capsys) -> None:
+    inputs, config = _write_inputs(tmp_path, ["a.inp", "b.inp", "c.gjf"])
+    output_dir = tmp_path / "scripts"
+    argv = ["jobscripts", str(inputs), "-c", str(config), "-d", str(output_dir)]
+    assert main([*argv, "--array", "--scheduler", "pbs", "--partition", "q"]) == 0
+    assert capsys.readouterr().err == "3 jobs in 2 job arrays\n"
+
+    gaussian = (output_dir / "qcinput-0002.sh").read_text(encoding="utf-8")
+    assert "#PBS -l select=1:ncpus=8:mpiprocs=8:mem=10240mb\n#PBS -q q\n" in gaussian
+    assert "#PBS -J" not in gaussian
+    assert "  1) cd ../inputs && exec g16 < c.gjf > c.log ;;\n" in gaussian
+    orca = (output_dir / "qcinput-0001.sh").read_text(encoding="utf-8")
+    assert "#PBS -l select=1:ncpus=8:mpiprocs=8:mem=40000mb\n" in orca
+    assert "#PBS -J 1-2\n" in orca
+    assert 'case "${PBS_ARRAY_INDEX:-1}" in\n' in orca
+    assert '  2) cd ../inputs && exec "$(command -v orca)" b.inp > b.out ;;\n' in orca
+
+
+def test_jobscripts_mem_overhead_sets_packing_and_request(tmp_path, capsys) -> None:
+    inputs, config = _write_inputs(tmp_path, ["a.inp", "b.inp"])
+    argv = ["jobscripts", str(inputs), "-c", str(config), "--node-cores", "16"]
+    assert main([*argv, "--node-mem", "64000", "--mem-overhead", "1"]) == 0
+    assert capsys.readouterr().err == "2 jobs in 1 node bundles\n"
+    script = (inputs / "qcinput-0001.sh").read_text(encoding="utf-8")
+    assert "#SBATCH --mem=64000M\n" in script
+
+    assert main([*argv, "--node-mem", "64000", "--mem-overhead", "1.5"]) == 0
+    assert capsys.readouterr().err == "2 jobs in 2 node bundles\n"
+    script = (inputs / "qcinput-0001.sh").read_text(encoding="utf-8")
+    assert "#SBATCH --ntasks=8\n#SBATCH --mem=48000M\n" in script
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+def test_jobscripts_bundle_runs_jobs_and_reports_failures(tmp_path, capsys) -> None:
+    inputs, config = _write_inputs(tmp_path, ["a.inp", "b.inp"])
+    (inputs / "sub").mkdir()
+    (inputs / "sub" / "c.inp").write_text("input c\n", encoding="utf-8")
+    argv = ["jobscripts", str(inputs), str(inputs / "sub" / "c.inp"), "-c", str(config)]
+    node = ["--node-cores", "64", "--node-mem", "256000"]
+    assert main([*argv, *node, "--orca-command", "cat"]) == 0
+    capsys.readouterr()
+
+    script = inputs / "qcinput-0001.sh"
+    assert subprocess.run(["bash", str(script)], cwd=tmp_path).returncode == 0
+    assert (inputs / "b.out").read_text(encoding="utf-8") == "input b.inp\n"
+    assert (inputs / "sub" / "c.out").read_text(encoding="utf-8") == "input c\n"
+
+    assert main([*argv, *node, "--orca-command", "false"]) == 0
+    assert subprocess.run(["bash", str(script)], cwd=tmp_path).returncode == 1
+
+
+@pytest.mark.parametrize(
+    ("extra", "message"),
+    [
+        (["--node-cores", "4", "--node-mem", "100G"], "needs 8 cores and 40000 MB"),
+        (["--node-cores", "4"], "--node-cores and --node-mem"),
+        (["--node-cores", "8", "--node-mem", "lots"], "Invalid memory size 'lots'"),
+        (["--array", "--mem-overhead", "0.5"], "expected a factor of at least 1"),
+    ],
+)
+def test_jobscripts_rejects_bad_node_shapes(tmp_path, capsys, extra, message) -> None:
+    inputs, config = _write_inputs(tmp_path, ["a.inp"])
+    with pytest.raises(SystemExit) as excinfo:
+        main(["jobscripts", str(inputs), "-c", str(config), *extra])
+    assert message in f"{excinfo.value.code} {capsys.readouterr().err}"
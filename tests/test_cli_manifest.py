@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+from qcinput.cli import main
+from qcinput.manifest import MANIFEST_NAME
+from tests.helpers import write_example_files
+
+
+def _generate(capsys, *argv):
+    assert main(["generate", *argv]) == 0
+    return capsys.readouterr()
+
+
+def test_generate_skips_unchanged_outputs(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    argv = (str(xyz), "--config", str(config))
+
+    first = _generate(capsys, *argv)
+    output = tmp_path / "water.inp"
+    assert first.out == f"{output}\n"
+    assert (tmp_path / MANIFEST_NAME).exists()
+    mtime = output.stat().st_mtime_ns
+
+    second = _generate(capsys, *argv)
+    assert second.out == f"{output}\n"
+    assert "0 rebuilt, 1 skipped" in second.err
+    assert output.stat().st_mtime_ns == mtime
+
+    forced = _generate(capsys, *argv, "--force")
+    assert forced.out == f"{output}\n"
+    assert forced.err == ""
+
+
+def test_generate_rebuilds_when_inputs_or_outputs_change(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    output = tmp_path / "water.inp"
+    argv = (str(xyz), "--config", str(config))
+    _generate(capsys, *argv)
+
+    # Comment-only config edits do not change the resolved config.
+    config.write_text(
+        "# tuned\n" + config.read_text(encoding="utf-8"), encoding="utf-8"
+    )
+    assert "0 rebuilt, 1 skipped" in _generate(capsys, *argv).err
+
+    config.write_text(
+        config.read_text(encoding="utf-8").replace("nprocs = 8", "nprocs = 16"),
+        encoding="utf-8",
+    )
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert _generate(capsys, *argv) == (f"{output}\n", "")
+    assert "nprocs 16\n" in output.read_text(encoding="utf-8")
+
+    xyz.write_text(xyz.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    assert _generate(capsys, *argv) == (f"{output}\n", "")
+
+    output.write_text("edited\n", encoding="utf-8")
+    assert _generate(capsys, *argv) == (f"{output}\n", "")
+    assert "nprocs 16\n" in output.read_text(encoding="utf-8")
+
+    output.unlink()
+    assert _generate(capsys, *argv) == (f"{output}\n", "")
+
+    assert "skipped" not in _generate(capsys, *argv, "--kinds", "int,sp").err
+
+
+def test_batch_reports_rebuilt_and_skipped_counts(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    structures = tmp_path / "structures"
+    structures.mkdir()
+    for name in ("a", "b", "c"):
+        (structures / f"{name}.xyz").write_text(
+            xyz.read_text(encoding="utf-8"), encoding="utf-8"
+        )
+    output_dir = tmp_path / "out"
+    argv = ["batch", str(structures), "--config", str(config), "-d", str(output_dir)]
+
+    assert main(argv) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 3
+
+    (structures / "b.xyz").write_text(
+        xyz.read_text(encoding="utf-8").replace("0.757000", "0.758000"),
+        encoding="utf-8",
+    )
+    assert main(argv) == 0
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        str(output_dir / f"{name}.inp") for name in ("a", "b", "c")
+    ]
+    assert "1 rebuilt, 2 skipped" in captured.err
+
+    manifest = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert sorted(manifest["entries"]) == ["a.inp", "b.inp", "c.inp"]
+
+
+def test_failed_job_is_dropped_from_manifest(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    argv = (str(xyz), "--config", str(config))
+    _generate(capsys, *argv)
+
+    xyz.write_text("not an xyz file\n", encoding="utf-8")
+    with pytest.raises(SystemExit, match="^error: "):
+        main(["generate", *argv])
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert manifest["entries"] == {}
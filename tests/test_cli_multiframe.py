@@ -0,0 +1,187 @@
+import sys
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+
+WATER_FRAME = [
+    "3",
+    "energy: -76.4",
+    "O 0.000000 0.000000 0.000000",
+    "H 0.757000 0.586000 0.000000",
+    "H -0.757000 0.586000 0.000000",
+]
+
+
+def _write_ensemble(tmp_path, frames: int):
+    xyz = tmp_path / "crest_conformers.xyz"
+    lines = []
+    for index in range(frames):
+        frame = list(WATER_FRAME)
+        frame[2] = f"O {index}.000000 0.000000 0.000000"
+        lines.extend(frame)
+    xyz.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return xyz
+
+
+def test_multiframe_xyz_generates_one_input_per_frame(
+    monkeypatch, tmp_path, capsys
+) -> None:
+    _, config = write_example_files(tmp_path)
+    xyz = _write_ensemble(tmp_path, 3)
+
+    monkeypatch.setattr(sys, "argv", ["qcinput", str(xyz), "--config", str(config)])
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    expected = [tmp_path / f"crest_conformers_{i:04d}.inp" for i in (1, 2, 3)]
+    assert exit_code == 0
+    assert captured.out.splitlines() == [str(path) for path in expected]
+    for index, path in enumerate(expected):
+        text = path.read_text(encoding="utf-8")
+        assert f"O {index}.000000 0.000000 0.000000" in text
+        assert "energy" not in text
+    assert not (tmp_path / "crest_conformers.inp").exists()
+
+
+def test_multiframe_gaussian_uses_per_frame_chk(monkeypatch, tmp_path, capsys) -> None:
+    _, config = write_example_files(tmp_path, kind="sp", engine="gaussian")
+    xyz = _write_ensemble(tmp_path, 2)
+    output = tmp_path / "conf.gjf"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["qcinput", str(xyz), "--config", str(config), "-o", str(output)],
+    )
+
+    exit_code = main()
+    capsys.readouterr()
+
+    assert exit_code == 0
+    first = (tmp_path / "conf_0001.gjf").read_text(encoding="utf-8")
+    second = (tmp_path / "conf_0002.gjf").read_text(encoding="utf-8")
+    assert "%chk=crest_conformers_0001.chk" in first
+    assert "%chk=crest_conformers_0002.chk" in second
+
+
+def test_single_frame_xyz_keeps_plain_output_name(
+    monkeypatch, tmp_path, capsys
+) -> None:
+    _, config = write_example_files(tmp_path)
+    xyz = _write_ensemble(tmp_path, 1)
+
+    monkeypatch.setattr(sys, "argv", ["qcinput", str(xyz), "--config", str(config)])
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert captured.out.strip() == str(tmp_path / "crest_conformers.inp")
+
+
+def test_multiframe_bad_frame_header_errors(monkeypatch, tmp_path) -> None:
+    _, config = write_example_files(tmp_path)
+    xyz = _write_ensemble(tmp_path, 2)
+    xyz.write_text(
+        xyz.read_text(encoding="utf-8") + "three\ncomment\n", encoding="utf-8"
+    )
+
+    monkeypatch.setattr(sys, "argv", ["qcinput", str(xyz), "--config", str(config)])
+
+    try:
+        main()
+    except SystemExit as exc:
+        message = str(exc)
+    else:
+        raise AssertionError("Expected SystemExit for invalid frame header.")
+
+    assert "Invalid XYZ frame header at line 11: 'three'" in message
+
+
+def test_single_frame_with_extra_atoms_reports_count_mismatch(tmp_path) -> None:
+    xyz, config = write_example_files(tmp_path)
+    xyz.write_text("2\nwater\nO 0 0 0\nH 0 0 1\n\nH 0 1 0\n\n", encoding="utf-8")
+    expected = "XYZ atom count mismatch: header=2, geometry lines=4."
+    for extra in ([], ["--frames", "0"]):
+        try:
+            main([str(xyz), "--config", str(config), *extra])
+        except SystemExit as exc:
+            assert expected in str(exc)
+        else:
+            raise AssertionError("Expected SystemExit for atom count mismatch.")
+
+
+def test_batch_expands_multiframe_files(monkeypatch, tmp_path, capsys) -> None:
+    _, config = write_example_files(tmp_path)
+    xyz = _write_ensemble(tmp_path, 2)
+    output_dir = tmp_path / "out"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qcinput",
+            "batch",
+            str(xyz),
+            "--config",
+            str(config),
+            "-d",
+            str(output_dir),
+        ],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert captured.out.splitlines() == [
+        str(output_dir / "crest_conformers_0001.inp"),
+        str(output_dir / "crest_conformers_0002.inp"),
+    ]
+
+
+def test_frames_selector_uses_absolute_frame_numbers(
+    monkeypatch, tmp_path, capsys
+) -> None:
+    _, config = write_example_files(tmp_path)
+    xyz = _write_ensemble(tmp_path, 10)
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["qcinput", str(xyz), "--config", str(config), "--frames", "2:8:3"],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert captured.out.splitlines() == [
+        str(tmp_path / "crest_conformers_0003.inp"),
+        str(tmp_path / "crest_conformers_0006.inp"),
+    ]
+    text = (tmp_path / "crest_conformers_0006.inp").read_text(encoding="utf-8")
+    assert "O 5.000000 0.000000 0.000000" in text
+    assert (tmp_path / "crest_conformers.xyz.qcidx").exists()
+
+
+def test_frames_selector_rejects_gjf(monkeypatch, tmp_path) -> None:
+    _, config = write_example_files(tmp_path)
+    gjf = tmp_path / "mol.gjf"
+    gjf.write_text("# sp\n\ntitle\n\n0 1\nO 0 0 0\n\n", encoding="utf-8")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["qcinput", str(gjf), "--config", str(config), "--frames", "0"],
+    )
+
+    try:
+        main()
+    except SystemExit as exc:
+        message = str(exc)
+    else:
+        raise AssertionError("Expected SystemExit for --frames on a GJF file.")
+
+    assert "requires an .xyz" in message
@@ -0,0 +1,158 @@
+import pytest
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+from tests.test_cli_gjf_input import _write_example_gjf
+from tests.test_cli_multiframe import _write_ensemble
+
+
+def _write_structures(tmp_path, *, engine="orca"):
+    xyz, config = write_example_files(tmp_path, kind="sp", engine=engine)
+    structures = tmp_path / "structures"
+    structures.mkdir()
+    (structures / "a.xyz").write_text(xyz.read_text(encoding="utf-8"))
+    gjf = _write_example_gjf(tmp_path)
+    (structures / "b.gjf").write_text(gjf.read_text(encoding="utf-8"))
+    _write_ensemble(structures, 3)
+    return structures, config
+
+
+def test_batch_pack_writes_orca_compound_steps(tmp_path, capsys) -> None:
+    structures, config = _write_structures(tmp_path)
+    output_dir = tmp_path / "packs"
+
+    argv = ["batch", str(structures), "-c", str(config), "-d", str(output_dir)]
+    assert main([*argv, "--pack", "3"]) == 0
+
+    packs = [output_dir / "pack_0001.inp", output_dir / "pack_0002.inp"]
+    assert capsys.readouterr().out.splitlines() == [str(path) for path in packs]
+    first = packs[0].read_text(encoding="utf-8")
+    second = packs[1].read_text(encoding="utf-8")
+
+    assert first.count("%pal") == 1
+    assert first.count("%maxcore 4000") == 1
+    assert first.count("New_Step") == 3
+    assert first.count("! SP B3LYP def2-TZVP NoPop") == 3
+    assert "    # qcinput-step 1: a.xyz\n" in first
+    assert "    # qcinput-step 2: b.gjf\n    ! SP" in first
+    assert "    * xyz 0 1\nC -1.03321036" in first
+    assert "    # qcinput-step 3: crest_conformers_0001.xyz\n" in first
+    assert first.endswith("  Step_End\nend\n")
+    assert second.count("New_Step") == 2
+    assert "    # qcinput-step 2: crest_conformers_0003.xyz\n" in second
+    assert "    * xyz 0 1\nO 2.000000" in second
+
+
+def test_batch_pack_chains_gaussian_link1_jobs(tmp_path, capsys) -> None:
+    structures, config = _write_structures(tmp_path, engine="gaussian")
+    argv = ["batch", str(structures), "-c", str(config), "-d", str(tmp_path)]
+    assert main([*argv, "--pack", "4"]) == 0
+
+    assert capsys.readouterr().out.splitlines() == [
+        str(tmp_path / "pack_0001.gjf"),
+        str(tmp_path / "pack_0002.gjf"),
+    ]
+    jobs = (tmp_path / "pack_0001.gjf").read_text(encoding="utf-8").split("--Link1--\n")
+    assert len(jobs) == 4
+    assert [job.splitlines()[0] for job in jobs] == [
+        "%chk=a.chk",
+        "%chk=b.chk",
+        "%chk=crest_conformers_0001.chk",
+        "%chk=crest_conformers_0002.chk",
+    ]
+    assert all(
+        "%NProcShared=8\n%Mem=8GB\n#P B3LYP/def2TZVP SP\n" in job for job in jobs
+    )
+    assert "qcinput-step 2: b.gjf\n\n0 1\nC -1.03321036" in jobs[1]
+    assert jobs[0].endswith("H -0.757000 0.586000 0.000000\n\n")
+    last = (tmp_path / "pack_0002.gjf").read_text(encoding="utf-8")
+    assert "--Link1--" not in last
+    assert last.endswith("H -0.757000 0.586000 0.000000\n\n\n")
+
+    log = "".join(
+        f" Entering Gaussian System\n Entering Link 1 = l1.exe PID= {pid}.\n"
+        f" SCF Done {pid}\n Normal termination\n"
+        for pid in range(4)
+    )
+    (tmp_path / "pack_0001.log").write_text(log, encoding="utf-8")
+    assert main(["split-pack", str(tmp_path / "pack_0001.log")]) == 0
+    assert capsys.readouterr().out.splitlines()[1] == str(tmp_path / "b.log")
+    assert (tmp_path / "b.log").read_text(encoding="utf-8") == (
+        " Entering Link 1 = l1.exe PID= 1.\n SCF Done 1\n Normal termination\n"
+        " Entering Gaussian System\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("kind", "engine", "message"),
+    [
+        ("ts", "orca", "single-step kinds"),
+        ("ts", "gaussian", "single-step kinds"),
+    ],
+)
+def test_batch_pack_rejects_unsupported_configs(tmp_path, kind, engine, message):
+    xyz, config = write_example_files(tmp_path, kind=kind, engine=engine)
+    with pytest.raises(SystemExit, match=message):
+        main(["batch", str(xyz), "-c", str(config), "--pack", "2"])
+
+
+def test_batch_pack_rejects_gjf_charge_mismatch(tmp_path) -> None:
+    structures, config = _write_structures(tmp_path)
+    gjf = structures / "b.gjf"
+    gjf.write_text(gjf.read_text(encoding="utf-8").replace("\n0 1\n", "\n1 2\n"))
+
+    with pytest.raises(SystemExit, match="b.gjf: GJF charge/multiplicity mismatch"):
+        main(["batch", str(structures), "-c", str(config), "--pack", "3"])
+
+
+def test_batch_pack_rejects_duplicate_job_names(monkeypatch, tmp_path) -> None:
+    structures, config = _write_structures(tmp_path)
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "a.gjf").write_text((structures / "b.gjf").read_text(encoding="utf-8"))
+    monkeypatch.chdir(tmp_path)
+
+    # Without -d the outputs would not collide; the packed job names do.
+    argv = ["batch", str(structures), str(other), "-c", str(config)]
+    with pytest.raises(SystemExit, match=r"a.gjf has the same job name \(a\) as "):
+        main([*argv, "--pack", "3"])
+    assert not (tmp_path / "pack_0002.inp").exists()
+
+
+def test_split_pack_writes_one_output_per_structure(tmp_path, capsys) -> None:
+    structures, config = _write_structures(tmp_path)
+    argv = ["batch", str(structures), "-c", str(config), "-d", str(tmp_path)]
+    assert main([*argv, "--pack", "5"]) == 0
+    capsys.readouterr()
+
+    banner = "*" * 40
+    steps = [
+        f"{banner}\n*  COMPOUND JOB  {i}  *\n{banner}\nenergy {i}\n"
+        for i in range(1, 6)
+    ]
+    # The echoed input and a repeated banner must not start new sections.
+    output = (
+        "ORCA header\n|  3>   New_Step\n"
+        + "".join(steps[:2])
+        + "*  COMPOUND JOB  1  *\n"
+        + "".join(steps[2:])
+    )
+    (tmp_path / "pack_0001.out").write_text(output, encoding="utf-8")
+
+    split_dir = tmp_path / "split"
+    assert (
+        main(["split-pack", str(tmp_path / "pack_0001.out"), "-d", str(split_dir)]) == 0
+    )
+    names = ["a", "b", *(f"crest_conformers_{i:04d}" for i in (1, 2, 3))]
+    assert capsys.readouterr().out.splitlines() == [
+        str(split_dir / f"{name}.out") for name in names
+    ]
+    second = (split_dir / "b.out").read_text(encoding="utf-8")
+    assert second.startswith("*  COMPOUND JOB  2  *\n")
+    assert "energy 2\n*  COMPOUND JOB  1  *\n" in second
+    assert "energy 3" not in second
+    assert "energy 5" in (split_dir / "crest_conformers_0003.out").read_text()
+
+    (tmp_path / "pack_0001.out").write_text("".join(steps[:4]), encoding="utf-8")
+    with pytest.raises(SystemExit, match="Found 4 of 5 job markers"):
+        main(["split-pack", str(tmp_path / "pack_0001.out")])
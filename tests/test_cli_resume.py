@@ -0,0 +1,173 @@
+import json
+
+import pytest
+
+from qcinput import generate
+from qcinput.cli import main
+from qcinput.journal import JOURNAL_NAME, Journal, replay_journal
+from qcinput.manifest import MANIFEST_NAME
+from tests.helpers import write_example_files
+from tests.test_cli_multiframe import _write_ensemble
+
+
+class Preempted(Exception):
+    pass
+
+
+@pytest.fixture
+def preempt_after(monkeypatch):
+    # Kill the run (an exception nothing catches) after `count` outputs.
+    def install(count):
+        items = generate._iter_output_items
+        written = []
+
+        def interrupted(*args, **kwargs):
+            for item in items(*args, **kwargs):
+                if len(written) == count:
+                    raise Preempted
+                written.append(item[0])
+                yield item
+
+        monkeypatch.setattr(generate, "_iter_output_items", interrupted)
+        return lambda: monkeypatch.setattr(generate, "_iter_output_items", items)
+
+    return install
+
+
+def test_generate_resumes_trajectory_mid_file(tmp_path, capsys, preempt_after) -> None:
+    _, config = write_example_files(tmp_path)
+    xyz = _write_ensemble(tmp_path, 5)
+    argv = ["generate", str(xyz), "-c", str(config)]
+    journal = tmp_path / f".crest_conformers.inp{JOURNAL_NAME}"
+
+    restore = preempt_after(2)
+    with pytest.raises(Preempted):
+        main(argv)
+    restore()
+    assert sorted(tmp_path.glob("crest_conformers_*.inp")) == [
+        tmp_path / f"crest_conformers_{i:04d}.inp" for i in (1, 2)
+    ]
+    assert journal.exists()
+
+    assert main([*argv, "--resume"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        str(tmp_path / f"crest_conformers_{i:04d}.inp") for i in range(1, 6)
+    ]
+    assert "3 rebuilt, 2 skipped" in captured.err
+    assert not journal.exists()
+
+    manifest = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))
+    assert len(manifest["entries"]["crest_conformers.inp"]["outputs"]) == 5
+    assert main(argv) == 0
+    assert "0 rebuilt, 5 skipped" in capsys.readouterr().err
+
+
+def test_batch_resume_replays_finished_jobs(tmp_path, capsys, preempt_after) -> None:
+    xyz, config = write_example_files(tmp_path)
+    structures = tmp_path / "structures"
+    structures.mkdir()
+    for name in ("a", "b", "c"):
+        (structures / f"{name}.xyz").write_text(
+            xyz.read_text(encoding="utf-8"), encoding="utf-8"
+        )
+    output_dir = tmp_path / "out"
+    argv = ["batch", str(structures), "-c", str(config), "-d", str(output_dir)]
+
+    restore = preempt_after(1)
+    with pytest.raises(Preempted):
+        main([*argv, "-j", "1"])
+    restore()
+    capsys.readouterr()
+    # A hard kill never gets to save the manifest; only the journal survives.
+    (output_dir / MANIFEST_NAME).unlink()
+    (journal,) = output_dir.glob(f".batch-*{JOURNAL_NAME}")
+    finished, _ = replay_journal(journal)
+    assert list(finished) == [str(output_dir / "a.inp")]
+
+    assert main([*argv, "--resume"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        str(output_dir / f"{name}.inp") for name in ("a", "b", "c")
+    ]
+    assert "2 rebuilt, 1 skipped" in captured.err
+    assert not journal.exists()
+
+
+def test_batches_from_one_directory_keep_their_own_journals(
+    monkeypatch, tmp_path, capsys, preempt_after
+) -> None:
+    xyz, config = write_example_files(tmp_path)
+    for name in ("first/a", "first/b", "second/c"):
+        path = tmp_path / f"{name}.xyz"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(xyz.read_text(encoding="utf-8"), encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    first = ["batch", "first", "-c", str(config)]
+
+    restore = preempt_after(1)
+    with pytest.raises(Preempted):
+        main(first)
+    restore()
+    (journal,) = tmp_path.glob(f".batch-*{JOURNAL_NAME}")
+
+    # Without -d both journals live in the current directory.
+    assert main(["batch", "second", "-c", str(config)]) == 0
+    assert journal.exists()
+    capsys.readouterr()
+
+    (tmp_path / "first" / MANIFEST_NAME).unlink()
+    assert main([*first, "--resume"]) == 0
+    assert "1 rebuilt, 1 skipped" in capsys.readouterr().err
+    assert not journal.exists()
+
+
+def test_journal_in_use_is_not_truncated(tmp_path) -> None:
+    path = tmp_path / "journal.jsonl"
+    running = Journal(path, flush_every=1)
+    running.output_done(tmp_path / "a.inp", tmp_path / "a.inp", "1")
+
+    with pytest.raises(OSError, match="in use by another qcinput run"):
+        Journal(path)
+    assert replay_journal(path)[1] == {
+        str(tmp_path / "a.inp"): {tmp_path / "a.inp": "1"}
+    }
+    running.close(complete=True)
+    assert not path.exists()
+
+
+def test_stale_journal_is_discarded_without_resume(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    journal = tmp_path / f".water.inp{JOURNAL_NAME}"
+    journal.write_text('{"task": "water.inp", "output": "x", "sha256": "0"}\n')
+
+    assert main(["generate", str(xyz), "-c", str(config)]) == 0
+    assert "pass --resume to continue it" in capsys.readouterr().err
+    assert not journal.exists()
+
+
+def test_journal_batches_writes_and_skips_torn_lines(tmp_path) -> None:
+    path = tmp_path / "journal.jsonl"
+    journal = Journal(path, flush_every=3, flush_interval=3600)
+    journal.output_done(tmp_path / "a.inp", tmp_path / "a_0001.inp", "1")
+    journal.output_done(tmp_path / "a.inp", tmp_path / "a_0002.inp", "2")
+    assert not path.exists()
+    journal.output_done(tmp_path / "b.inp", tmp_path / "b.inp", "3")
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    journal.close(complete=False)
+
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"task": "b.inp", "outp')
+    _, written = replay_journal(path)
+    assert written[str(tmp_path / "a.inp")] == {
+        tmp_path / "a_0001.inp": "1",
+        tmp_path / "a_0002.inp": "2",
+    }
+
+    resumed = Journal(path, append=True)
+    resumed.output_done(tmp_path / "b.inp", tmp_path / "b.inp", "3")
+    resumed.close(complete=False)
+    assert replay_journal(path)[1][str(tmp_path / "b.inp")] == {tmp_path / "b.inp": "3"}
+
+    Journal(path, append=True).close(complete=True)
+    assert not path.exists()
@@ -0,0 +1,132 @@
+import os
+import stat
+import sys
+import threading
+
+import pytest
+
+from qcinput.cli import main, make_server
+from qcinput.server import SOCKET_ENV, QCInputServer, default_socket_path
+from tests.helpers import write_example_files
+
+
+@pytest.fixture
+def server(tmp_path):
+    instance = make_server(tmp_path / "qcinput.sock")
+    thread = threading.Thread(
+        target=instance.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield instance
+    instance.shutdown()
+    instance.server_close()
+    thread.join()
+
+
+def test_via_socket_generates_in_client_cwd(
+    monkeypatch, tmp_path, capsys, server
+) -> None:
+    work = tmp_path / "work"
+    work.mkdir()
+    write_example_files(work)
+    monkeypatch.chdir(work)
+    monkeypatch.setenv(SOCKET_ENV, str(server.socket_path))
+    server_cwd = os.getcwd()
+
+    monkeypatch.setattr(sys, "argv", ["qcinput", "--via-socket", "water.xyz"])
+    assert main() == 0
+
+    assert capsys.readouterr().out == "water.inp\n"
+    via_socket = (work / "water.inp").read_text(encoding="utf-8")
+    assert main(["water.xyz", "-o", "direct.inp"]) == 0
+    assert via_socket == (work / "direct.inp").read_text(encoding="utf-8")
+    assert os.getcwd() == server_cwd
+
+
+def test_via_socket_forwards_config_env_and_reloads_changes(
+    monkeypatch, tmp_path, capsys, server
+) -> None:
+    xyz, config = write_example_files(tmp_path)
+    monkeypatch.setenv("QCINPUT_CONFIG", str(config))
+    output = tmp_path / "out.inp"
+    argv = [f"--via-socket={server.socket_path}", str(xyz), "-o", str(output)]
+
+    assert main(argv) == 0
+    assert "nprocs 8\n" in output.read_text(encoding="utf-8")
+
+    config.write_text(
+        config.read_text(encoding="utf-8").replace("nprocs = 8", "nprocs = 16"),
+        encoding="utf-8",
+    )
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert main(argv) == 0
+
+    assert "nprocs 16\n" in output.read_text(encoding="utf-8")
+    assert "QCINPUT_CONFIG" in os.environ
+    capsys.readouterr()
+
+
+def test_via_socket_returns_errors_and_exit_code(
+    monkeypatch, tmp_path, capsys, server
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    code = main([f"--via-socket={server.socket_path}", str(tmp_path / "none.xyz")])
+
+    assert code == 1
+    assert "error: Config file not found" in capsys.readouterr().err
+
+    assert main([f"--via-socket={server.socket_path}", "serve"]) == 1
+    assert "cannot be run through the server" in capsys.readouterr().err
+
+
+def test_via_socket_without_server_errors(tmp_path) -> None:
+    with pytest.raises(SystemExit, match="Cannot reach qcinput server"):
+        main([f"--via-socket={tmp_path / 'missing.sock'}", "water.xyz"])
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-V", "--via-socket"],
+        ["water.xyz", "--startup-profile"],
+        ["--via-socket=x.sock", "--startup-profile", "water.xyz"],
+    ],
+)
+def test_leading_flags_are_rejected_elsewhere(argv) -> None:
+    with pytest.raises(SystemExit, match="must be the first argument"):
+        main(argv)
+
+
+def test_server_refuses_socket_in_use(server) -> None:
+    with pytest.raises(ValueError, match="already listening"):
+        QCInputServer(server.socket_path, lambda argv: 0)
+
+
+def test_socket_is_private_from_the_start(server) -> None:
+    assert stat.S_IMODE(server.socket_path.stat().st_mode) & 0o077 == 0
+
+
+def test_server_refuses_shared_socket_directory(tmp_path) -> None:
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o1777)
+
+    with pytest.raises(ValueError, match="only you can access"):
+        make_server(shared / "qcinput.sock")
+    assert not (shared / "qcinput.sock").exists()
+
+
+def test_default_socket_needs_a_runtime_dir(monkeypatch, tmp_path) -> None:
+    monkeypatch.delenv(SOCKET_ENV, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    socket_path = default_socket_path()
+    assert socket_path == tmp_path / "qcinput" / "qcinput.sock"
+
+    server = make_server(socket_path)
+    server.server_close()
+    assert stat.S_IMODE(socket_path.parent.stat().st_mode) == 0o700
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    with pytest.raises(SystemExit, match="XDG_RUNTIME_DIR is not set"):
+        main(["--via-socket", "water.xyz"])
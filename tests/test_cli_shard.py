@@ -0,0 +1,127 @@
+import pytest
+
+from qcinput.cli import main
+from tests.helpers import write_example_files
+from tests.test_cli_multiframe import _write_ensemble
+
+NAMES = [f"mol{idx:02d}" for idx in range(11)]
+
+
+@pytest.fixture
+def structures(tmp_path):
+    xyz, config = write_example_files(tmp_path)
+    structures_dir = tmp_path / "structures"
+    structures_dir.mkdir()
+    for name in NAMES:
+        (structures_dir / f"{name}.xyz").write_text(
+            xyz.read_text(encoding="utf-8"), encoding="utf-8"
+        )
+    return structures_dir, config
+
+
+def _run_shard(tmp_path, structures, shard, *extra):
+    structures_dir, config = structures
+    output_dir = tmp_path / f"out{shard.replace('/', '-')}"
+    argv = ["batch", str(structures_dir), "-c", str(config), "-d", str(output_dir)]
+    assert main([*argv, "--shard", shard, *extra]) == 0
+    return output_dir
+
+
+@pytest.mark.parametrize("strategy", ["index", "hash"])
+def test_shards_are_disjoint_stable_and_verified(
+    tmp_path, capsys, structures, strategy
+) -> None:
+    outputs = []
+    records = []
+    for shard in ("1/3", "2/3", "3/3"):
+        output_dir = _run_shard(tmp_path, structures, shard, "--shard-by", strategy)
+        outputs.append({path.stem for path in output_dir.glob("*.inp")})
+        records.extend(output_dir.glob("qcinput-shard-*-of-3.json"))
+    capsys.readouterr()
+
+    assert sorted(name for names in outputs for name in names) == NAMES
+    if strategy == "index":
+        assert [len(names) for names in outputs] == [4, 4, 3]
+
+    rerun = _run_shard(tmp_path / "rerun", structures, "2/3", "--shard-by", strategy)
+    assert {path.stem for path in rerun.glob("*.inp")} == outputs[1]
+    capsys.readouterr()
+
+    assert main(["verify-shards", *map(str, records)]) == 0
+    assert capsys.readouterr().out == "ok: 11 structures emitted once across 3 shards\n"
+
+
+def test_verify_shards_reports_gaps_and_overlaps(tmp_path, capsys, structures) -> None:
+    first = _run_shard(tmp_path, structures, "1/2") / "qcinput-shard-1-of-2.json"
+    other = tmp_path / "shard1-again.json"
+    _run_shard(tmp_path, structures, "1/2", "--shard-record", str(other))
+    capsys.readouterr()
+
+    assert main(["verify-shards", str(first)]) == 1
+    assert "missing shards: 2 of 2" in capsys.readouterr().err
+
+    assert main(["verify-shards", str(first), str(other)]) == 1
+    err = capsys.readouterr().err
+    assert "shard 1/2 recorded 2 times" in err
+    assert "mol00.xyz emitted 2 times" in err
+
+    third = _run_shard(tmp_path, structures, "1/3") / "qcinput-shard-1-of-3.json"
+    assert main(["verify-shards", str(first), str(third)]) == 1
+    assert "different input set or shard layout" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("strategy", ["index", "hash"])
+def test_trajectory_frames_are_dealt_across_shards(
+    tmp_path, capsys, structures, strategy
+) -> None:
+    structures_dir, _ = structures
+    _write_ensemble(structures_dir, 7)
+    frames = [f"crest_conformers_{index:04d}" for index in range(1, 8)]
+    outputs = []
+    records = []
+    for shard in ("1/3", "2/3", "3/3"):
+        output_dir = _run_shard(tmp_path, structures, shard, "--shard-by", strategy)
+        outputs.append({path.stem for path in output_dir.glob("*.inp")})
+        records.extend(output_dir.glob("qcinput-shard-*-of-3.json"))
+    capsys.readouterr()
+
+    assert sorted(name for names in outputs for name in names) == sorted(
+        [*frames, *NAMES]
+    )
+    assert all(names & set(frames) for names in outputs)
+    if strategy == "index":
+        assert [len(names) for names in outputs] == [6, 6, 6]
+    assert main(["verify-shards", *map(str, records)]) == 0
+    assert capsys.readouterr().out == "ok: 12 structures emitted once across 3 shards\n"
+
+    assert main(["verify-shards", *map(str, records[:2])]) == 1
+    err = capsys.readouterr().err
+    assert "missing shards: 3 of 3" in err
+    assert f"{structures_dir.as_posix()}/crest_conformers.xyz: " in err
+    assert "of 7 frames not emitted" in err
+
+
+def test_frame_selection_is_sharded_with_absolute_numbers(
+    tmp_path, capsys, structures
+) -> None:
+    structures_dir, config = structures
+    trajectory = _write_ensemble(structures_dir, 9)
+    output_dir = _run_shard(tmp_path, (trajectory, config), "2/2", "--frames", "1:8:2")
+    capsys.readouterr()
+
+    assert sorted(path.stem for path in output_dir.glob("*.inp")) == [
+        "crest_conformers_0004",
+        "crest_conformers_0008",
+    ]
+    record = output_dir / "qcinput-shard-2-of-2.json"
+    text = record.read_text(encoding="utf-8")
+    assert '"split": {\n  "' in text
+    assert '/crest_conformers.xyz": "1:8:2"\n },\n "emitted_frames"' in text
+    assert text.endswith('/crest_conformers.xyz": "3:8:4"\n }\n}\n')
+
+
+def test_invalid_shard_is_rejected(tmp_path, capsys, structures) -> None:
+    structures_dir, config = structures
+    with pytest.raises(SystemExit):
+        main(["batch", str(structures_dir), "-c", str(config), "--shard", "4/3"])
+    assert "Expected I/N with 1 <= I <= N" in capsys.readouterr().err
@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from qcinput import __version__, cli, config
+from qcinput.cli import main
+from tests.conftest import SRC
+
+# Extra wall time a cold `qcinput --version` may take over a bare interpreter.
+STARTUP_BUDGET_MS = float(os.environ.get("QCINPUT_STARTUP_BUDGET_MS", "150"))
+
+_PROBE = (
+    "import sys\n"
+    "from qcinput.cli import main\n"
+    "try:\n"
+    "    main(sys.argv[1:])\n"
+    "except SystemExit:\n"
+    "    pass\n"
+    "print(' '.join(sorted(sys.modules)), file=sys.stderr)\n"
+)
+
+
+def _python(*args, cwd=None):
+    env = {**os.environ, "PYTHONPATH": SRC}
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _loaded_modules(*argv, cwd=None) -> set[str]:
+    proc = _python("-c", _PROBE, *argv, cwd=cwd)
+    return set(proc.stderr.splitlines()[-1].split())
+
+
+@pytest.mark.parametrize("argv", [("--version",), ("--help",), ("batch", "--help")])
+def test_version_and_help_skip_subcommand_imports(argv) -> None:
+    modules = _loaded_modules(*argv)
+
+    assert {name for name in modules if name.startswith("qcinput")} == {
+        "qcinput",
+        "qcinput.cli",
+    }
+    assert not modules & {"tomllib", "concurrent.futures", "socketserver", "mmap"}
+
+
+def test_init_config_skips_renderers_and_structures(tmp_path) -> None:
+    modules = _loaded_modules("init-config", cwd=tmp_path)
+
+    assert (tmp_path / "qcinput.toml").exists()
+    assert "qcinput.config" in modules
+    assert not modules & {
+        "qcinput.generate",
+        "qcinput.structure",
+        "qcinput.batch",
+        "qcinput.server",
+    }
+
+
+def test_cli_name_choices_match_config() -> None:
+    assert cli._ENGINES == config.ENGINES
+    assert cli._KINDS == config.KINDS
+
+
+def _best_wall_ms(*args, runs: int = 5) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        _python(*args)
+        best = min(best, (time.perf_counter() - started) * 1e3)
+    return best
+
+
+def test_cold_version_latency_budget() -> None:
+    bare = _best_wall_ms("-c", "pass")
+    version = _best_wall_ms(
+        "-c", "import sys; from qcinput.cli import main; sys.exit(main())", "-V"
+    )
+
+    assert version - bare < STARTUP_BUDGET_MS, (
+        f"`qcinput --version` took {version:.1f} ms, {version - bare:.1f} ms over "
+        f"a bare interpreter (budget {STARTUP_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_startup_profile_reports_imports(capfd) -> None:
+    assert main(["--startup-profile", "--version"]) == 0
+
+    out, err = capfd.readouterr()
+    assert f"qcinput {__version__}" in out
+    assert "startup profile:" in err
+    assert "import time: self [us] | cumulative | imported package" in err
+    assert "| qcinput.cli" in err
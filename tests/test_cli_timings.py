@@ -0,0 +1,61 @@
+import json
+import pstats
+import tracemalloc
+
+from qcinput.cli import main
+from qcinput.timings import record_timings
+from tests.helpers import write_example_files
+from tests.test_cli_multiframe import _write_ensemble
+
+
+def test_generate_timings_reports_each_stage_as_json_lines(tmp_path, capsys) -> None:
+    _, config = write_example_files(tmp_path)
+    ensemble = _write_ensemble(tmp_path, 2)
+    assert main(["generate", str(ensemble), "-c", str(config), "--timings"]) == 0
+
+    captured = capsys.readouterr()
+    assert len(captured.out.splitlines()) == 2
+    events = [json.loads(line) for line in captured.err.splitlines()]
+    assert [event["stage"] for event in events] == [
+        "load_config",
+        "manifest",
+        *["load_structure", "render", "write"] * 2,
+        "total",
+    ]
+    assert events[0]["path"] == str(config)
+    assert events[4]["output"] == str(tmp_path / "crest_conformers_0001.inp")
+    for event in events:
+        assert event["seconds"] >= 0
+        assert "peak_bytes" not in event
+
+
+def test_generate_timings_memory_traces_allocations(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    assert main(["generate", str(xyz), "-c", str(config), "--timings-memory"]) == 0
+
+    events = [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+    assert events[-1]["stage"] == "total"
+    assert all(isinstance(event["peak_bytes"], int) for event in events)
+    assert not tracemalloc.is_tracing()
+
+
+def test_record_timings_library_hook_and_profile(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    profile = tmp_path / "generate.prof"
+    events = []
+    with record_timings(events.append):
+        assert main(["generate", str(xyz), "-c", str(config)]) == 0
+    argv = ["generate", str(xyz), "-c", str(config), "--force"]
+    assert main([*argv, "--profile", str(profile)]) == 0
+    assert capsys.readouterr().err.endswith(f"profile written to {profile}\n")
+
+    assert [event["stage"] for event in events] == [
+        "load_config",
+        "manifest",
+        "load_structure",
+        "render",
+        "write",
+    ]
+    assert all("peak_bytes" not in event for event in events)
+    stats = pstats.Stats(str(profile))
+    assert any(func[2] == "_run_generate" for func in stats.stats)
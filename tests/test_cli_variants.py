@@ -0,0 +1,129 @@
+import sys
+
+import pytest
+
+from qcinput import config as config_module
+from qcinput.cli import main
+from qcinput.config import clear_config_cache, load_all_configs
+from tests.helpers import write_example_files
+
+
+def test_load_all_configs_builds_every_task_table(tmp_path) -> None:
+    _, config = write_example_files(tmp_path)
+
+    configs = load_all_configs(config)
+
+    assert list(configs) == [
+        ("orca", "int"),
+        ("orca", "ts"),
+        ("orca", "sp"),
+        ("gaussian", "int"),
+        ("gaussian", "ts"),
+        ("gaussian", "sp"),
+    ]
+    assert configs[("orca", "ts")].orca_ts_constraint_atoms == ((0, 1),)
+    assert configs[("gaussian", "sp")].task_keywords == ("SP",)
+
+
+def test_load_all_configs_requires_explicit_pairs(tmp_path) -> None:
+    _, config = write_example_files(tmp_path)
+    text = config.read_text(encoding="utf-8")
+    head, tail = text.split("[gaussian.task.sp]\n", 1)
+    config.write_text(head, encoding="utf-8")
+
+    assert ("gaussian", "sp") not in load_all_configs(config)
+    with pytest.raises(ValueError, match=r"\[gaussian.task.sp\]"):
+        load_all_configs(config, engines=("gaussian",), kinds=("sp",))
+
+
+def test_partial_selection_parses_the_toml_once(monkeypatch, tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    clear_config_cache()
+    parses = []
+    load_raw = config_module._load_raw
+    monkeypatch.setattr(
+        config_module,
+        "_load_raw",
+        lambda content: parses.append(content) or load_raw(content),
+    )
+    argv = [str(xyz), "--config", str(config), "--engines", "gaussian", "--force"]
+    assert main(argv) == 0
+    assert capsys.readouterr().out.splitlines() == [str(tmp_path / "water_int.gjf")]
+    assert len(parses) == 1
+    assert main(argv) == 0
+    assert len(parses) == 1
+    clear_config_cache()
+
+
+def test_generate_renders_every_kind_and_engine(monkeypatch, tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "qcinput",
+            str(xyz),
+            "--config",
+            str(config),
+            "--kinds",
+            "int,sp,ts",
+            "--engines",
+            "orca,gaussian",
+        ],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    expected = [
+        tmp_path / name
+        for name in (
+            "water_int.inp",
+            "water_sp.inp",
+            "water_ts.inp",
+            "water_int.gjf",
+            "water_sp.gjf",
+            "water_ts.gjf",
+        )
+    ]
+    assert exit_code == 0
+    assert captured.out.splitlines() == [str(path) for path in expected]
+    assert "! SP B3LYP def2-TZVP NoPop" in expected[1].read_text(encoding="utf-8")
+    orca_ts = expected[2].read_text(encoding="utf-8")
+    assert "* xyzfile 0 1 water_ts_Compound_1.xyz *" in orca_ts
+    gaussian_sp = expected[4].read_text(encoding="utf-8")
+    assert "%chk=water_sp.chk" in gaussian_sp
+    assert "#P B3LYP/def2TZVP SP" in gaussian_sp
+
+
+def test_generate_kinds_default_to_active_engine(monkeypatch, tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path, engine="gaussian")
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["qcinput", str(xyz), "--config", str(config), "--kinds", "sp"],
+    )
+
+    exit_code = main()
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert captured.out.strip() == str(tmp_path / "water_sp.gjf")
+
+
+def test_generate_rejects_unknown_kind(monkeypatch, tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["qcinput", str(xyz), "--config", str(config), "--kinds", "int,freq"],
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+
+    assert excinfo.value.code == 2
+    assert "--kinds" in capsys.readouterr().err
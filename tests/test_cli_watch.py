@@ -0,0 +1,101 @@
+import pytest
+
+from qcinput.cli import main
+from qcinput.config import load_config
+from qcinput.watch import InputWatcher, StructureWatcher
+from tests.helpers import write_example_files
+
+
+def test_watch_once_generates_new_structures_only(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    output_dir = tmp_path / "out"
+    argv = ["watch", str(tmp_path), "-c", str(config), "-d", str(output_dir)]
+    assert main([*argv, "--once"]) == 0
+    assert capsys.readouterr().out.splitlines() == [str(output_dir / "water.inp")]
+    assert main([*argv, "--once"]) == 0
+    assert capsys.readouterr().out == ""
+
+    (tmp_path / "broken.xyz").write_text("2\nbad\nO 0 0\n", encoding="utf-8")
+    (tmp_path / ".partial.xyz").write_text("", encoding="utf-8")
+    assert main([*argv, "--once"]) == 1
+    assert f"error: {tmp_path / 'broken.xyz'}:" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit, match="Watch directory not found"):
+        main(["watch", str(tmp_path / "missing"), "-c", str(config), "--once"])
+
+
+def test_watcher_debounces_and_follows_config_edits(tmp_path) -> None:
+    _, config = write_example_files(tmp_path)
+    incoming = tmp_path / "incoming"
+    incoming.mkdir()
+    now = [0.0]
+    messages = []
+    watcher = InputWatcher(
+        StructureWatcher([incoming], settle=5, clock=lambda: now[0]),
+        config,
+        lambda: load_config(config),
+        notify=messages.append,
+    )
+    water = (tmp_path / "water.xyz").read_text(encoding="utf-8")
+    (incoming / "a.xyz").write_text(water[:20], encoding="utf-8")
+    assert watcher.poll() == []
+    now[0] = 3.0
+    (incoming / "a.xyz").write_text(water, encoding="utf-8")
+    assert watcher.poll() == []
+    now[0] = 7.0
+    assert watcher.poll() == []
+    now[0] = 8.0
+    [result] = watcher.poll()
+    assert result.output == incoming / "a.inp" and result.error is None
+    now[0] = 20.0
+    assert watcher.poll() == []
+
+    text = config.read_text(encoding="utf-8")
+    config.write_text(f"# tweaked\n{text}", encoding="utf-8")
+    assert watcher.poll() == []
+    assert messages == [f"config reloaded: {config}"]
+    config.write_text(text.replace('"Freq"', '"Freq", "TightOpt"'))
+    [result] = watcher.poll()
+    assert "TightOpt" in result.output.read_text(encoding="utf-8")
+
+    config.write_text("[broken", encoding="utf-8")
+    assert watcher.poll() == []
+    assert messages[-1].endswith("(keeping the previous config)")
+    assert watcher.config.task_keywords[-1] == "TightOpt"
+
+
+def test_watcher_skips_the_gaussian_inputs_it_writes(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path, engine="gaussian")
+    messages = []
+    watcher = InputWatcher(
+        StructureWatcher([tmp_path], settle=0),
+        config,
+        lambda: load_config(config),
+        notify=messages.append,
+    )
+
+    [result] = watcher.poll()
+    assert result.output == xyz.with_suffix(".gjf") and result.error is None
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    assert messages == []
+    assert watcher.structures.done() == [xyz]
+
+    argv = ["watch", str(tmp_path), "-c", str(config), "--once"]
+    assert main(argv) == 0
+    assert capsys.readouterr() == ("", "")
+
+
+def test_watch_once_reports_collisions_per_structure(tmp_path, capsys) -> None:
+    xyz, config = write_example_files(tmp_path)
+    first, second = tmp_path / "a", tmp_path / "b"
+    for directory in (first, second):
+        directory.mkdir()
+        (directory / "water.xyz").write_text(xyz.read_text(encoding="utf-8"))
+    output_dir = tmp_path / "out"
+    argv = ["watch", str(first), str(second), "-c", str(config), "-d", str(output_dir)]
+
+    assert main([*argv, "--once"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [str(output_dir / "water.inp")]
+    assert captured.err.startswith(f"error: {second / 'water.xyz'}: Output name")
@@ -0,0 +1,160 @@
+import hashlib
+import io
+from dataclasses import replace
+
+import pytest
+
+from qcinput import generate, template
+from qcinput.config import load_all_configs
+from qcinput.gaussian import (
+    render_gaussian_input,
+    render_gaussian_two_step_ts_input,
+    write_gaussian_two_step_ts_input,
+)
+from qcinput.generate import CompiledRenderer, compile_renderer
+from qcinput.orca import render_orca_input, write_orca_input
+from qcinput.structure import (
+    StructureData,
+    geometry,
+    load_structure,
+    parse_atom_block,
+)
+from qcinput.template import InputTemplate, slot
+from tests.helpers import write_example_files
+
+XYZ_TEXT = "O 0.000000 0.000000 0.000000\nH 0.757000 0.586000 0.000000"
+
+
+def _structure(xyz_text: str = XYZ_TEXT) -> StructureData:
+    return StructureData(
+        geometry=parse_atom_block(xyz_text),
+        charge=None,
+        multiplicity=None,
+        source_format="xyz",
+    )
+
+
+def test_input_template_splices_slots() -> None:
+    template = InputTemplate(f"%chk={slot('chk')}\n{slot('xyz')}\n\n")
+
+    assert template.slot_names == {"chk", "xyz"}
+    assert template.render(chk="a.chk", xyz="H 0 0 0") == "%chk=a.chk\nH 0 0 0\n\n"
+
+
+@pytest.mark.parametrize("kind", ["int", "sp"])
+def test_compiled_renderer_matches_one_shot_renderers(tmp_path, kind) -> None:
+    _, config_path = write_example_files(tmp_path)
+    configs = load_all_configs(config_path)
+    orca = configs[("orca", kind)]
+    gaussian = configs[("gaussian", kind)]
+
+    for xyz_text in (XYZ_TEXT, "C 1.0 2.0 3.0"):
+        structure = _structure(xyz_text)
+        assert CompiledRenderer(orca).render(
+            structure, source_structure_name="mol.xyz", output_stem="mol"
+        ) == render_orca_input(xyz_text=xyz_text, config=orca)
+        assert CompiledRenderer(gaussian).render(
+            structure, source_structure_name="dir/mol.xyz", output_stem="mol"
+        ) == render_gaussian_input(
+            xyz_text=xyz_text, config=gaussian, source_structure_name="mol.xyz"
+        )
+
+
+def test_compiled_renderer_fills_structure_dependent_names(tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    configs = load_all_configs(config_path)
+    orca_ts = CompiledRenderer(configs[("orca", "ts")])
+    gaussian_ts = CompiledRenderer(configs[("gaussian", "ts")])
+
+    first = orca_ts.render(_structure(), source_structure_name="a.xyz", output_stem="a")
+    second = orca_ts.render(
+        _structure(), source_structure_name="b.xyz", output_stem="b_ts"
+    )
+    assert "* xyzfile 0 1 a_Compound_1.xyz *" in first
+    assert "* xyzfile 0 1 b_ts_Compound_1.xyz *" in second
+
+    text = gaussian_ts.render(
+        _structure(), source_structure_name="b.xyz", output_stem="b"
+    )
+    assert text == render_gaussian_two_step_ts_input(
+        xyz_text=XYZ_TEXT,
+        config=configs[("gaussian", "ts")],
+        source_structure_name="b.xyz",
+    )
+    assert text.count("%chk=b.chk") == 2
+
+
+def test_compile_renderer_is_reused_per_config(tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    config = load_all_configs(config_path)[("orca", "int")]
+
+    assert compile_renderer(config) is compile_renderer(config)
+
+
+def test_compiled_renderer_validates_config_once(tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    config = load_all_configs(config_path)[("orca", "ts")]
+    broken = replace(config, orca_ts_constraint_atoms=())
+
+    with pytest.raises(ValueError, match="constraint_atoms"):
+        CompiledRenderer(broken)
+
+
+def test_template_write_streams_text_and_binary_chunks(monkeypatch) -> None:
+    monkeypatch.setattr(template, "CHUNK_CHARS", 4)
+    tpl = InputTemplate(f"head\n{slot('xyz')}\ntail\n")
+    writes = []
+
+    class Sink:
+        def write(self, data):
+            writes.append(data)
+
+    tpl.write(Sink(), xyz="H 0 0 0\nH 1 0 0")
+    assert b"".join(writes) == b"head\nH 0 0 0\nH 1 0 0\ntail\n"
+    assert all(isinstance(chunk, bytes) for chunk in writes)
+    assert max(len(chunk) for chunk in writes[1:-1]) == 4
+
+    text = io.StringIO()
+    tpl.write(text, xyz="é")
+    assert text.getvalue() == "head\né\ntail\n"
+
+
+def test_writer_renderers_match_string_renderers(tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    configs = load_all_configs(config_path)
+    orca = configs[("orca", "int")]
+    gaussian_ts = configs[("gaussian", "ts")]
+
+    binary = io.BytesIO()
+    write_orca_input(binary, xyz_text=XYZ_TEXT, config=orca)
+    assert binary.getvalue().decode() == render_orca_input(
+        xyz_text=XYZ_TEXT, config=orca
+    )
+    text = io.StringIO()
+    write_gaussian_two_step_ts_input(
+        text, xyz_text=XYZ_TEXT, config=gaussian_ts, source_structure_name="m.xyz"
+    )
+    assert text.getvalue() == render_gaussian_two_step_ts_input(
+        xyz_text=XYZ_TEXT, config=gaussian_ts, source_structure_name="m.xyz"
+    )
+
+
+def test_large_geometries_are_streamed_to_disk(tmp_path, monkeypatch) -> None:
+    xyz, config_path = write_example_files(tmp_path)
+    config = load_all_configs(config_path)[("orca", "int")]
+    expected = generate.render_structure(
+        load_structure(xyz),
+        config,
+        source_structure_name="water.xyz",
+        output_stem="water",
+    )
+    monkeypatch.setattr(generate, "STREAM_MIN_ATOMS", 1)
+    monkeypatch.setattr(template, "CHUNK_CHARS", 16)
+    monkeypatch.setattr(geometry, "CHUNK_ATOMS", 2)
+    monkeypatch.setattr(generate, "render_structure", pytest.fail, raising=True)
+
+    output = tmp_path / "water.inp"
+    [(path, digest)] = generate.write_rendered_outputs(xyz, output, config)
+    assert path == output
+    assert output.read_text(encoding="utf-8") == expected
+    assert digest == hashlib.sha256(expected.encode()).hexdigest()
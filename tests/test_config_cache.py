@@ -0,0 +1,128 @@
+import hashlib
+import os
+
+import pytest
+
+from qcinput import config as config_module
+from qcinput.config import clear_config_cache, load_config
+from tests.helpers import write_example_files
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+def _age(path, seconds: int = 60) -> None:
+    stat = path.stat()
+    past = stat.st_mtime_ns - seconds * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+def _count_parses(monkeypatch) -> list[bytes]:
+    calls: list[bytes] = []
+    parse = config_module._parse_config
+
+    def counting_parse(content: bytes):
+        calls.append(content)
+        return parse(content)
+
+    monkeypatch.setattr(config_module, "_parse_config", counting_parse)
+    return calls
+
+
+def test_repeated_load_only_stats_the_file(monkeypatch, tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    _age(config_path)
+    parses = _count_parses(monkeypatch)
+
+    first = load_config(config_path)
+    monkeypatch.setattr(
+        type(config_path),
+        "read_bytes",
+        lambda self: pytest.fail("cached config must not be re-read"),
+    )
+    second = load_config(config_path)
+
+    assert second is first
+    assert len(parses) == 1
+
+
+def test_recently_modified_config_is_reverified_by_hash(monkeypatch, tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    parses = _count_parses(monkeypatch)
+
+    first = load_config(config_path)
+    second = load_config(config_path)
+
+    assert second is first
+    assert len(parses) == 1
+
+
+def test_changed_config_is_reparsed(tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    assert load_config(config_path).kind == "int"
+
+    config_path.write_text(
+        config_path.read_text(encoding="utf-8").replace(
+            'kind = "int"', 'kind = "sp"', 1
+        ),
+        encoding="utf-8",
+    )
+
+    assert load_config(config_path).kind == "sp"
+
+
+def test_disk_cache_survives_in_process_invalidation(monkeypatch, tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path, kind="ts")
+    cache_dir = tmp_path / "cache"
+    parses = _count_parses(monkeypatch)
+
+    first = load_config(config_path, cache_dir=cache_dir)
+    clear_config_cache(config_path)
+    second = load_config(config_path, cache_dir=cache_dir)
+
+    assert len(parses) == 1
+    assert len(list(cache_dir.glob("*.json"))) == 1
+    assert second == first
+    assert second.orca_ts_constraint_atoms == ((0, 1),)
+
+    clear_config_cache(cache_dir=cache_dir)
+    assert not list(cache_dir.glob("*.json"))
+    load_config(config_path, cache_dir=cache_dir)
+    assert len(parses) == 2
+
+
+def test_clear_disk_cache_deletes_only_qcinput_entries(tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    other_path = tmp_path / "other.toml"
+    other_path.write_text(
+        config_path.read_text(encoding="utf-8").replace("charge = 0", "charge = 1"),
+        encoding="utf-8",
+    )
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    unrelated = cache_dir / "settings.json"
+    unrelated.write_text("{}", encoding="utf-8")
+    load_config(config_path, cache_dir=cache_dir)
+    load_config(other_path, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.qcinput-config.json"))) == 2
+
+    clear_config_cache(config_path, cache_dir=cache_dir)
+    [kept] = cache_dir.glob("*.qcinput-config.json")
+    assert kept.name.startswith(hashlib.sha256(other_path.read_bytes()).hexdigest())
+
+    clear_config_cache(cache_dir=cache_dir)
+    assert list(cache_dir.iterdir()) == [unrelated]
+
+
+def test_disk_cache_dir_from_environment(monkeypatch, tmp_path) -> None:
+    _, config_path = write_example_files(tmp_path)
+    cache_dir = tmp_path / "env-cache"
+    monkeypatch.setenv("QCINPUT_CONFIG_CACHE_DIR", str(cache_dir))
+
+    load_config(config_path)
+
+    assert len(list(cache_dir.glob("*.json"))) == 1
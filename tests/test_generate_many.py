@@ -0,0 +1,53 @@
+import pytest
+
+import qcinput
+from qcinput.cli import main
+from qcinput.config import load_all_configs
+from qcinput.structure import load_structure
+from tests.helpers import write_example_files
+from tests.test_cli_multiframe import _write_ensemble
+
+
+def test_generate_many_matches_cli_output_without_writing(tmp_path) -> None:
+    xyz, config = write_example_files(tmp_path)
+    ensemble = _write_ensemble(tmp_path, 2)
+    water = load_structure(xyz)
+    sources = [
+        str(xyz),
+        ensemble,
+        ("from_data", water),
+        ("from_geometry.xyz", water.geometry),
+        ("from_text", water.xyz_text),
+    ]
+    outputs = list(qcinput.generate_many(sources, config))
+
+    assert [name for name, _ in outputs] == [
+        "water.inp",
+        "crest_conformers_0001.inp",
+        "crest_conformers_0002.inp",
+        "from_data.inp",
+        "from_geometry.inp",
+        "from_text.inp",
+    ]
+    assert not list(tmp_path.glob("*.inp"))
+    assert main(["generate", str(xyz), "-c", str(config)]) == 0
+    expected = (tmp_path / "water.inp").read_text(encoding="utf-8")
+    assert outputs[0][1] == expected
+    assert outputs[-1][1] == expected
+
+
+def test_generate_many_configs_workers_and_errors(tmp_path) -> None:
+    xyz, config = write_example_files(tmp_path)
+    configs = load_all_configs(config, engines=("gaussian",), kinds=("int", "sp"))
+    sources = [xyz, ("ethanol.xyz", load_structure(xyz))] * 3
+    inline = list(qcinput.generate_many(sources, configs.values()))
+    pooled = qcinput.generate_many(sources, configs.values(), workers=2)
+
+    assert list(pooled) == inline
+    assert [name for name, _ in inline[2:4]] == ["ethanol_int.gjf", "ethanol_sp.gjf"]
+    assert "%chk=ethanol_sp.chk\n" in inline[3][1]
+
+    with pytest.raises(ValueError, match="missing.xyz: "):
+        list(qcinput.generate_many([xyz, tmp_path / "missing.xyz"], config))
+    with pytest.raises(ValueError, match="at least one config"):
+        list(qcinput.generate_many([xyz], []))
@@ -0,0 +1,123 @@
+from array import array
+
+import pytest
+
+from qcinput.structure import Geometry, load_structure, parse_atom_block
+from qcinput.structure import geometry as geometry_module
+from qcinput.structure.elements import atomic_number
+from tests.helpers import write_example_files
+
+
+def test_xyz_loader_builds_array_geometry(tmp_path) -> None:
+    xyz, _ = write_example_files(tmp_path)
+
+    structure = load_structure(xyz)
+    geometry = structure.geometry
+
+    assert len(geometry) == 3
+    assert geometry.numbers == array("B", [8, 1, 1])
+    assert geometry.symbols == ("O", "H", "H")
+    assert geometry.coordinates[3:6] == array("d", [0.757, 0.586, 0.0])
+    assert structure.xyz_text == (
+        "O 0.000000 0.000000 0.000000\n"
+        "H 0.757000 0.586000 0.000000\n"
+        "H -0.757000 0.586000 0.000000"
+    )
+
+
+def test_gjf_loader_builds_array_geometry(tmp_path) -> None:
+    gjf = tmp_path / "mol.gjf"
+    gjf.write_text(
+        "# hf/3-21g\n\ntitle\n\n0 1\nC1  0.0 0.0 0.0\nCl2 1.8 0.0 0.0\n\n",
+        encoding="utf-8",
+    )
+
+    geometry = load_structure(gjf).geometry
+
+    assert geometry.numbers == array("B", [6, 17])
+    assert geometry.text == "C1 0.0 0.0 0.0\nCl2 1.8 0.0 0.0"
+
+
+def test_text_is_formatted_with_the_source_precision() -> None:
+    block = "  O\t0.000000 0.000000 -0.000000\nh 1.234567 .001000   -2.000000"
+
+    geometry = parse_atom_block(block)
+
+    assert geometry.decimals == 6
+    assert geometry.labels == ("O", "h")
+    assert geometry.text == (
+        "O 0.000000 0.000000 -0.000000\nh 1.234567 0.001000 -2.000000"
+    )
+    assert parse_atom_block(geometry.text) == geometry
+    assert "".join(geometry.iter_text()) == geometry.text
+
+
+@pytest.mark.parametrize(
+    "block",
+    [
+        # Mixed precision: one long value must not pad all the others.
+        "O  0.0 0.0 0.0\nH  0.757 0.586 0.0",
+        "H 0.1 0.12345678901234568 -2.5\nH 0 0 0",
+        # Exponent notation.
+        "H 1e300 0.0 0.0\nH 1.25e-3 0.0 0.0",
+        "C -0.5E+1 3.0 4.0",
+        # More decimals than MAX_DECIMALS, or more digits than a double holds.
+        "H 0.10000000000000001 0.20000000000000001 0.30000000000000004",
+        "H 1234567.891 0.000 0.000",
+    ],
+)
+def test_coordinates_that_do_not_round_trip_keep_source_text(block) -> None:
+    geometry = parse_atom_block(block)
+
+    assert geometry.text == block
+    assert "".join(geometry.iter_text()) == block
+
+
+def test_source_text_is_kept_only_on_request(monkeypatch) -> None:
+    block = "O  0.000 0.000 0.000\nH  0.757 0.586 0.000"
+    assert parse_atom_block(block).text == "O 0.000 0.000 0.000\nH 0.757 0.586 0.000"
+
+    monkeypatch.setenv(geometry_module.KEEP_TEXT_ENV, "1")
+    assert parse_atom_block(block).text == block
+
+
+def test_coordinate_view_is_zero_copy() -> None:
+    geometry = parse_atom_block("O 0 0 0\nH 0.757 0.586 0")
+
+    view = geometry.coordinate_view()
+    assert view.shape == (2, 3)
+    assert view[1, 0] == pytest.approx(0.757)
+    geometry.coordinates[3] = 1.5
+    assert view[1, 0] == 1.5
+
+
+def test_geometry_from_atoms_formats_text_lazily() -> None:
+    geometry = Geometry.from_atoms(["O", "H"], [(0.0, 0.0, 0.0), (0.757, 0.586, 0.0)])
+
+    assert geometry.numbers == array("B", [8, 1])
+    assert geometry.text == (
+        "O 0.00000000 0.00000000 0.00000000\nH 0.75700000 0.58600000 0.00000000"
+    )
+
+
+def test_geometry_rejects_mismatched_arrays() -> None:
+    with pytest.raises(ValueError, match="three per atom"):
+        Geometry(array("B", [1]), array("d", [0.0, 0.0]))
+
+
+@pytest.mark.parametrize(
+    ("label", "number"),
+    [("H", 1), ("CL", 17), ("Cl3", 17), ("C12", 6), ("6", 6), ("Bq", 0), ("X", 0)],
+)
+def test_atomic_number_interns_labels(label, number) -> None:
+    assert atomic_number(label) == number
+
+
+def test_to_numpy_shares_coordinate_buffer() -> None:
+    numpy = pytest.importorskip("numpy")
+    geometry = parse_atom_block("O 0 0 0\nH 0.757 0.586 0")
+
+    coords = geometry.to_numpy()
+
+    assert coords.shape == (2, 3)
+    assert numpy.shares_memory(coords, numpy.frombuffer(geometry.coordinates))
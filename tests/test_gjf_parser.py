@@ -0,0 +1,146 @@
+import pytest
+
+from qcinput.structure.gjf import load_gjf_data, load_gjf_jobs
+
+
+def _write(tmp_path, lines):
+    gjf = tmp_path / "mol.gjf"
+    gjf.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return gjf
+
+
+def test_gjf_sections_are_split_by_state(tmp_path) -> None:
+    gjf = _write(
+        tmp_path,
+        [
+            "%chk=mol.chk",
+            "%nprocshared=4",
+            "# opt freq",
+            "  b3lyp/def2svp geom=connectivity",
+            "",
+            "multi-line",
+            "title",
+            "",
+            "-1 2",
+            " O 0.0 0.0 0.0",
+            " H 0.0 0.0 0.96",
+            "",
+            " 1 2 1.0",
+            " 2",
+            "",
+        ],
+    )
+
+    (job,) = load_gjf_jobs(gjf)
+
+    assert job.link0 == ("%chk=mol.chk", "%nprocshared=4")
+    assert job.route == "# opt freq b3lyp/def2svp geom=connectivity"
+    assert job.title == "multi-line\ntitle"
+    assert (job.charge, job.multiplicity) == (-1, 2)
+    assert job.geometry.text == "O 0.0 0.0 0.0\nH 0.0 0.0 0.96"
+    assert job.trailing == (" 1 2 1.0", " 2")
+
+
+def test_gjf_link1_jobs_and_checkpoint_geometry(tmp_path) -> None:
+    gjf = _write(
+        tmp_path,
+        [
+            "%chk=mol.chk",
+            "# opt b3lyp/def2svp",
+            "",
+            "step 1",
+            "",
+            "0 1",
+            "H 0.0 0.0 0.0",
+            "H 0.0 0.0 0.74",
+            "",
+            "--Link1--",
+            "%chk=mol.chk",
+            "# freq geom=allcheck guess=read",
+            "",
+            "--Link1--",
+            "%chk=mol.chk",
+            "# sp geom=check",
+            "",
+            "step 3",
+            "",
+            "0 3",
+            "",
+        ],
+    )
+
+    first, second, third = load_gjf_jobs(gjf)
+
+    assert first.geometry.symbols == ("H", "H")
+    assert second.route == "# freq geom=allcheck guess=read"
+    assert (second.title, second.charge, second.geometry) == ("", None, None)
+    assert (third.charge, third.multiplicity, third.geometry) == (0, 3, None)
+    assert load_gjf_data(gjf) == ("H 0.0 0.0 0.0\nH 0.0 0.0 0.74", 0, 1)
+
+
+def test_gjf_geometry_is_taken_from_first_job_that_has_one(tmp_path) -> None:
+    gjf = _write(
+        tmp_path,
+        [
+            "# freq geom=allcheck",
+            "",
+            "--Link1--",
+            "# sp",
+            "",
+            "title",
+            "",
+            "1 1",
+            "Na 0.0 0.0 0.0",
+        ],
+    )
+
+    assert load_gjf_data(gjf) == ("Na 0.0 0.0 0.0", 1, 1)
+
+
+def test_gjf_without_route_finds_charge_line_before_atoms(tmp_path) -> None:
+    gjf = _write(tmp_path, ["water", "1 2", "", "0 1", "", "O 0.0 0.0 0.0"])
+
+    assert load_gjf_data(gjf) == ("O 0.0 0.0 0.0", 0, 1)
+
+
+@pytest.mark.parametrize(
+    "head",
+    [["# opt b3lyp", "", ""], ["# opt b3lyp", "", "", "title", ""]],
+)
+def test_gjf_empty_title_or_extra_blank_line(tmp_path, head) -> None:
+    gjf = _write(tmp_path, [*head, "0 1", "C 0 0 0", "H 0 0 1"])
+
+    assert load_gjf_data(gjf) == ("C 0 0 0\nH 0 0 1", 0, 1)
+
+
+def test_gjf_numeric_lines_are_parsed_in_one_pass(tmp_path) -> None:
+    # Integer pairs everywhere (title, trailing connectivity) used to be
+    # rescanned as charge/multiplicity candidates.
+    atoms = [f"C {i}.0 0.0 0.0" for i in range(2000)]
+    connectivity = [f" {i} {i + 1}" for i in range(1, 2000)]
+    gjf = _write(
+        tmp_path, ["# sp", "", "1 2", "", "0 1", *atoms, "", *connectivity, ""]
+    )
+
+    text, charge, multiplicity = load_gjf_data(gjf)
+
+    assert (charge, multiplicity) == (0, 1)
+    assert text.count("\n") == 1999
+    assert load_gjf_jobs(gjf)[0].trailing[-1] == " 1999 2000"
+
+
+@pytest.mark.parametrize(
+    ("lines", "message"),
+    [
+        ([""], "GJF file is empty."),
+        (["# sp", "", "title", ""], "Cannot find charge/multiplicity line"),
+        (["# sp", "", "title", "", "charge"], "Cannot find charge/multiplicity"),
+        (["# sp", "", "title", "", "0 1", ""], "No geometry section found"),
+        (["# sp", "", "t", "", "0 1", "C 0.0 0.0"], "Invalid GJF atom line at line 6"),
+    ],
+)
+def test_gjf_parse_errors(tmp_path, lines, message) -> None:
+    gjf = _write(tmp_path, lines)
+
+    with pytest.raises(ValueError, match=message):
+        load_gjf_data(gjf)
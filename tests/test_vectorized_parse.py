@@ -0,0 +1,82 @@
+import pytest
+
+from qcinput.structure import vectorized
+from qcinput.structure.gjf import load_gjf_geometry, load_gjf_jobs
+from qcinput.structure.xyz import load_xyz_geometry
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_ATOMS", 1)
+    monkeypatch.delenv(vectorized.DISABLE_NUMPY_ENV, raising=False)
+
+
+def _atom_lines(count):
+    return [f"  Cl{i}  {i * 0.5:.6f} -1.25e-3 {i % 3}" for i in range(count)]
+
+
+def _both_paths(monkeypatch, load, path):
+    fast = load(path)
+    monkeypatch.setenv(vectorized.DISABLE_NUMPY_ENV, "1")
+    return fast, load(path)
+
+
+def test_vectorized_xyz_matches_pure_python(monkeypatch, tmp_path, small_blocks):
+    xyz = tmp_path / "big.xyz"
+    xyz.write_text("50\ncomment\n" + "\n".join(_atom_lines(50)) + "\n")
+
+    fast, slow = _both_paths(monkeypatch, load_xyz_geometry, xyz)
+
+    assert fast == slow
+    assert fast.symbols[:2] == ("Cl", "Cl")
+    assert fast.coordinates[3:6].tolist() == [0.5, -1.25e-3, 1.0]
+
+
+def test_vectorized_gjf_matches_pure_python(monkeypatch, tmp_path, small_blocks):
+    gjf = tmp_path / "big.gjf"
+    gjf.write_text("# sp\n\nt\n\n0 1\n" + "\n".join(_atom_lines(50)) + "\n\n")
+
+    fast, slow = _both_paths(monkeypatch, load_gjf_geometry, gjf)
+
+    assert fast == slow
+    assert fast[0].text.splitlines()[1] == "Cl1 0.500000 -1.25e-3 1"
+
+
+def test_vectorized_gjf_non_atom_line_still_ends_geometry(tmp_path, small_blocks):
+    gjf = tmp_path / "big.gjf"
+    lines = _atom_lines(10) + [" 1 2 1.0 3 1.0", " 2"]
+    gjf.write_text("# sp geom=connectivity\n\nt\n\n0 1\n" + "\n".join(lines) + "\n")
+
+    (job,) = load_gjf_jobs(gjf)
+
+    assert len(job.geometry) == 10
+    assert job.trailing == (" 1 2 1.0 3 1.0", " 2")
+
+
+@pytest.mark.parametrize(
+    ("bad_line", "message"),
+    [
+        ("C 1.0 2.0", "Invalid XYZ atom line at line 6: 'C 1.0 2.0'"),
+        ("C 1.0 2.0 nope", "Invalid coordinates at line 6: 'C 1.0 2.0 nope'"),
+    ],
+)
+def test_vectorized_xyz_reports_first_bad_line(
+    tmp_path, small_blocks, bad_line, message
+) -> None:
+    lines = _atom_lines(3) + [bad_line, "C 1.0 2.0 x", "H 0 0 0"]
+    xyz = tmp_path / "bad.xyz"
+    xyz.write_text(f"{len(lines)}\n\n" + "\n".join(lines) + "\n")
+
+    with pytest.raises(ValueError, match=message):
+        load_xyz_geometry(xyz)
+
+
+def test_numpy_fast_path_can_be_disabled(monkeypatch, small_blocks) -> None:
+    lines = _atom_lines(4)
+    assert vectorized.split_atom_block(lines) is not None
+
+    monkeypatch.setenv(vectorized.DISABLE_NUMPY_ENV, "1")
+
+    assert vectorized.split_atom_block(lines) is None
@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+from qcinput.structure.xyz_index import (
+    XYZFrameIndex,
+    index_path_for,
+    parse_frame_selection,
+)
+
+
+def _write_frames(path, frames: int) -> None:
+    lines = []
+    for index in range(frames):
+        lines.extend(
+            [
+                "2",
+                f"frame {index}",
+                f"H {index}.0 0.0 0.0",
+                "H 0.0 0.0 0.74",
+                "",
+            ]
+        )
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def test_index_serves_random_frames_and_writes_sidecar(tmp_path) -> None:
+    xyz = tmp_path / "traj.xyz"
+    _write_frames(xyz, 50)
+
+    with XYZFrameIndex.open(xyz) as index:
+        assert len(index) == 50
+        assert index.frame(37).text == "H 37.0 0.0 0.0\nH 0.0 0.0 0.74"
+        assert index.frame(-1).text.startswith("H 49.0")
+        assert [i for i, _ in index.iter_frames(slice(10, 20, 4))] == [10, 14, 18]
+
+    assert index_path_for(xyz).exists()
+    with XYZFrameIndex.open(xyz, write_sidecar=False) as index:
+        assert index.frame(0).text.startswith("H 0.0")
+
+
+def test_index_sidecar_invalidated_when_file_changes(tmp_path) -> None:
+    xyz = tmp_path / "traj.xyz"
+    _write_frames(xyz, 5)
+    with XYZFrameIndex.open(xyz) as index:
+        assert len(index) == 5
+
+    _write_frames(xyz, 8)
+    stat = xyz.stat()
+    os.utime(xyz, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    with XYZFrameIndex.open(xyz) as index:
+        assert len(index) == 8
+        assert index.frame(7).text.startswith("H 7.0")
+
+
+def test_index_reports_absolute_line_numbers(tmp_path) -> None:
+    xyz = tmp_path / "traj.xyz"
+    _write_frames(xyz, 3)
+    text = xyz.read_text(encoding="utf-8").replace("H 2.0 0.0 0.0", "H 2.0 x 0.0")
+    xyz.write_text(text, encoding="utf-8")
+
+    with XYZFrameIndex.open(xyz) as index:
+        assert index.frame(1).text.startswith("H 1.0")
+        with pytest.raises(ValueError, match="Invalid coordinates at line 13"):
+            index.frame(2)
+        with pytest.raises(ValueError, match="out of range"):
+            index.frame(3)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("100:200:5", slice(100, 200, 5)),
+        ("100:", slice(100, None)),
+        ("::2", slice(None, None, 2)),
+        ("7", slice(7, 8)),
+        ("-1", slice(-1, None)),
+    ],
+)
+def test_parse_frame_selection(text, expected) -> None:
+    assert parse_frame_selection(text) == expected
+
+
+@pytest.mark.parametrize("text", ["a:b", "1:2:3:4", "1:2:0", ""])
+def test_parse_frame_selection_rejects_invalid(text) -> None:
+    with pytest.raises(ValueError):
+        parse_frame_selection(text)